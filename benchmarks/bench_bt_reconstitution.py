@@ -0,0 +1,65 @@
+"""
+Compare hydrating a BusinessType forest link by link (add_child per
+child, as BusinessTypeMapper.attach_relations does) with
+BusinessType.reconstitute.
+
+Run from the repository root:
+    PYTHONPATH=src/handbook python benchmarks/bench_bt_reconstitution.py
+"""
+
+from time import perf_counter
+from uuid import uuid4
+
+from domain.entities.business_type import BusinessType
+from domain.val_objs.business_name import BusinessName
+from domain.val_objs.ids import BusinessTypeId
+
+SIZES = (250, 500, 1_000, 2_000, 4_000)
+ROOTS = 5
+
+
+def make_rows(n: int):
+    """Forest of ROOTS wide trees, three levels deep (BusinessType.MAX_DEPTH)."""
+    roots = [BusinessTypeId(uuid4()) for _ in range(ROOTS)]
+    rows = [(r, BusinessName(f"root-{i}"), None) for i, r in enumerate(roots)]
+    middles = []
+    for i in range(max(ROOTS, (n - ROOTS) // 2)):
+        m = BusinessTypeId(uuid4())
+        middles.append(m)
+        rows.append((m, BusinessName(f"mid-{i}"), roots[i % ROOTS]))
+    i = 0
+    while len(rows) < n:
+        rows.append((BusinessTypeId(uuid4()), BusinessName(f"leaf-{i}"), middles[i % len(middles)]))
+        i += 1
+    return rows
+
+
+def link_by_link(rows):
+    nodes = {id_: BusinessType(id_=id_, name=name) for id_, name, _ in rows}
+    children: dict[BusinessTypeId, list[BusinessType]] = {}
+    for id_, _, parent_id in rows:
+        if parent_id is not None:
+            children.setdefault(parent_id, []).append(nodes[id_])
+    for parent_id, kids in children.items():
+        for child in kids:
+            nodes[parent_id].add_child(child)
+    return nodes
+
+
+def timed(fn, rows) -> float:
+    started = perf_counter()
+    fn(rows)
+    return perf_counter() - started
+
+
+def main() -> None:
+    print(f"{'nodes':>8} {'add_child':>12} {'reconstitute':>14} {'us/node':>9}")
+    for n in SIZES:
+        rows = make_rows(n)
+        slow = timed(link_by_link, rows)
+        fast = timed(BusinessType.reconstitute, rows)
+        print(f"{n:>8} {slow:>11.3f}s {fast:>13.4f}s {fast / n * 1e6:>9.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""
+Time organization name autocomplete on the in-process paths: bisecting
+the sorted PrefixIndex the in-memory repository keeps, a full scan of
+every name for comparison, and a hit in the prefix cache the SQL
+repository answers hot prefixes from.
+
+Run from the repository root (name count defaults to 1M):
+    PYTHONPATH=src/handbook python benchmarks/bench_org_autocomplete.py [names]
+"""
+
+import random
+import sys
+from time import perf_counter
+from uuid import uuid4
+
+from domain.val_objs.org_summary import OrganizationSummary
+from infra.cache.org_name_prefix import OrganizationNamePrefixCache
+from infra.indexes.prefix_index import PrefixIndex
+
+NAMES = 1_000_000
+ROUNDS = 200
+SCAN_ROUNDS = 3
+LIMIT = 10
+
+WORDS = [
+    "Coffee", "House", "Bakery", "Auto", "Service", "Market", "Pharmacy",
+    "Garden", "Studio", "Dental", "Clinic", "Books", "Fitness", "Pizza",
+    "Hotel", "Travel", "Print", "Flowers", "Sushi", "Repair",
+]  # fmt: skip
+
+PREFIXES = ["c", "coffee h", "sushi repair №42", "zzz"]
+
+
+def make_names(count: int) -> list[OrganizationSummary]:
+    rng = random.Random(42)
+    return [
+        OrganizationSummary(
+            id=uuid4(), name=f"{rng.choice(WORDS)} {rng.choice(WORDS)} №{i}"
+        )
+        for i in range(count)
+    ]
+
+
+def scan(items: list[OrganizationSummary], prefix: str) -> list[OrganizationSummary]:
+    p = prefix.casefold()
+    matches = [s for s in items if s.name.casefold().startswith(p)]
+    return sorted(matches, key=lambda s: s.name.casefold())[:LIMIT]
+
+
+def timed(rounds: int, fn, *args) -> float:
+    started = perf_counter()
+    for _ in range(rounds):
+        fn(*args)
+    return (perf_counter() - started) / rounds
+
+
+def main(count: int) -> None:
+    items = make_names(count)
+
+    started = perf_counter()
+    index = PrefixIndex.build(items, key=lambda s: s.name)
+    print(f"{count:,} names, index built in {perf_counter() - started:.1f}s")
+
+    cache = OrganizationNamePrefixCache()
+    for prefix in PREFIXES:
+        cache.put(prefix, LIMIT, tuple(index.prefix(prefix, LIMIT)))
+
+    print(f"{'prefix':>18} {'scan ms':>9} {'index ms':>9} {'cache ms':>9}")
+    for prefix in PREFIXES:
+        scan_s = timed(SCAN_ROUNDS, scan, items, prefix)
+        index_s = timed(ROUNDS, index.prefix, prefix, LIMIT)
+        cache_s = timed(ROUNDS, cache.get, prefix, LIMIT)
+        print(
+            f"{prefix:>18} {scan_s * 1000:>9.3f} "
+            f"{index_s * 1000:>9.4f} {cache_s * 1000:>9.4f}"
+        )
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else NAMES)
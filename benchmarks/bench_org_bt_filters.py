@@ -0,0 +1,122 @@
+"""
+Compare business type filters of InMemoryOrganizationRepository (one
+bitmask AND per organization) with scanning each organization's
+business_types tuple, as the repository did before.
+
+Run from the repository root (organization count defaults to 1M):
+    PYTHONPATH=src/handbook python benchmarks/bench_org_bt_filters.py [orgs]
+"""
+
+import asyncio
+import random
+import sys
+from decimal import Decimal
+from time import perf_counter
+from uuid import uuid4
+
+from domain.entities.business_type import BusinessType
+from domain.entities.facility import Facility
+from domain.entities.organization import Organization
+from domain.val_objs.address import Address
+from domain.val_objs.business_name import BusinessName
+from domain.val_objs.coords import Coordinates
+from domain.val_objs.ids import BusinessTypeId, FacilityId, OrganizationId
+from domain.val_objs.organization_name import OrganizationName
+from domain.val_objs.phone import PhoneNumber
+from infra.repositories.in_mem_org_repo import InMemoryOrganizationRepository
+
+ORGS = 1_000_000
+ROOTS = 8
+CHILDREN = 8
+GRANDCHILDREN = 4
+
+
+def make_bt(name: str, parent=None) -> BusinessType:
+    return BusinessType(BusinessTypeId(uuid4()), BusinessName(name), parent)
+
+
+def make_forest() -> tuple[list[BusinessType], list[BusinessType]]:
+    roots, nodes = [], []
+    for r in range(ROOTS):
+        root = make_bt(f"root-{r}")
+        roots.append(root)
+        nodes.append(root)
+        for c in range(CHILDREN):
+            child = make_bt(f"child-{r}-{c}", root)
+            nodes.append(child)
+            nodes.extend(
+                make_bt(f"leaf-{r}-{c}-{g}", child) for g in range(GRANDCHILDREN)
+            )
+    return roots, nodes
+
+
+def make_orgs(n: int, types: list[BusinessType]) -> list[Organization]:
+    rng = random.Random(42)
+    facility = Facility(
+        id_=FacilityId(uuid4()),
+        address=Address("Bench street"),
+        coordinates=Coordinates(lat=Decimal("10"), lon=Decimal("20")),
+    )
+    phone = PhoneNumber("+1234567")
+    return [
+        Organization(
+            id_=OrganizationId(uuid4()),
+            name=OrganizationName(f"Org {i:07d}"),
+            phone_numbers=[phone],
+            facility=facility,
+            business_types=rng.sample(types, rng.randint(1, 3)),
+        )
+        for i in range(n)
+    ]
+
+
+def scan_any(orgs, types):
+    type_set = set(types)
+    return [o for o in orgs if any(t in type_set for t in o.business_types)]
+
+
+def scan_recursive(orgs, root):
+    scope = set(root.get_recursive_business_types())
+    return [o for o in orgs if any(t in scope for t in o.business_types)]
+
+
+def timed(fn, *args) -> tuple[float, int]:
+    started = perf_counter()
+    result = fn(*args)
+    if asyncio.iscoroutine(result):
+        result = asyncio.run(result)
+    return perf_counter() - started, len(result)
+
+
+def main() -> None:
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else ORGS
+    roots, nodes = make_forest()
+    orgs = make_orgs(n, nodes)
+
+    repo = InMemoryOrganizationRepository()
+
+    async def load():
+        for org in orgs:
+            await repo.save(org)
+
+    asyncio.run(load())
+
+    leaves = [bt for bt in nodes if not bt.children][:5]
+    cases = [
+        ("recursive (root)", scan_recursive, (orgs, roots[0]),
+         repo.list_by_business_type_recursive, (roots[0],)),
+        ("any-of (5 leaves)", scan_any, (orgs, leaves),
+         repo.list_by_any_business_type, (leaves,)),
+    ]
+
+    print(f"organizations: {n}, business types: {len(nodes)}")
+    print(f"{'filter':<20} {'scan':>9} {'bitmask':>9} {'matches':>9}")
+    for label, slow_fn, slow_args, fast_fn, fast_args in cases:
+        slow, matched = timed(slow_fn, *slow_args)
+        fast, fast_matched = timed(fast_fn, *fast_args)
+        assert matched == fast_matched
+        print(f"{label:<20} {slow:>8.3f}s {fast:>8.3f}s {matched:>9}")
+
+
+if __name__ == "__main__":
+    main()
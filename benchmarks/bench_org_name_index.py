@@ -0,0 +1,68 @@
+"""
+Compare substring name search of InMemoryOrganizationRepository's
+trigram inverted index with lowercasing and scanning every name, as the
+repository did before.
+
+Run from the repository root (name count defaults to 1M):
+    PYTHONPATH=src/handbook python benchmarks/bench_org_name_index.py [names]
+"""
+
+import random
+import sys
+from time import perf_counter
+
+from infra.indexes.trigram import TrigramIndex
+
+NAMES = 1_000_000
+ROUNDS = 20
+
+WORDS = [
+    "Coffee", "House", "Bakery", "Auto", "Service", "Market", "Pharmacy",
+    "Garden", "Studio", "Dental", "Clinic", "Books", "Fitness", "Pizza",
+    "Hotel", "Travel", "Print", "Flowers", "Sushi", "Repair",
+]  # fmt: skip
+
+QUERIES = ["sushi rep", "dental", "ffee ho", "№4242", "zzz"]
+
+
+def make_names(count: int) -> dict[int, str]:
+    rng = random.Random(42)
+    return {
+        i: f"{rng.choice(WORDS)} {rng.choice(WORDS)} №{i}" for i in range(count)
+    }
+
+
+def scan(names: dict[int, str], query: str) -> list[int]:
+    q = query.lower()
+    return [k for k, name in names.items() if q in name.lower()]
+
+
+def timed(fn, *args) -> tuple[float, list[int]]:
+    started = perf_counter()
+    for _ in range(ROUNDS):
+        result = fn(*args)
+    return (perf_counter() - started) / ROUNDS, result
+
+
+def main(count: int) -> None:
+    names = make_names(count)
+
+    started = perf_counter()
+    index = TrigramIndex()
+    for key, name in names.items():
+        index.add(key, name)
+    print(f"{count:,} names, index built in {perf_counter() - started:.1f}s")
+
+    print(f"{'query':>12} {'matches':>9} {'scan ms':>9} {'index ms':>9}")
+    for query in QUERIES:
+        scan_s, expected = timed(scan, names, query)
+        index_s, found = timed(index.search, query)
+        assert sorted(found) == expected
+        print(
+            f"{query:>12} {len(found):>9,} "
+            f"{scan_s * 1000:>9.2f} {index_s * 1000:>9.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else NAMES)
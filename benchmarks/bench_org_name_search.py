@@ -0,0 +1,98 @@
+"""
+Show how the pg_trgm GIN index changes the plans of organization name
+searches: the substring filter (lower(name) LIKE '%q%') and the ranked
+similarity filter (lower(name) % q). Both run once without and once with
+the index, on a synthetic temporary table shaped like `organization`.
+
+Needs a Postgres DATABASE_URL with permission to create pg_trgm. Run from
+the repository root (row count defaults to 1M):
+    PYTHONPATH=src/handbook python benchmarks/bench_org_name_search.py [rows]
+"""
+
+import asyncio
+import os
+import sys
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection, create_async_engine
+
+ROWS = 1_000_000
+TABLE = "organization_name_bench"
+
+WORDS = [
+    "Coffee", "House", "Bakery", "Auto", "Service", "Market", "Pharmacy",
+    "Garden", "Studio", "Dental", "Clinic", "Books", "Fitness", "Pizza",
+    "Hotel", "Travel", "Print", "Flowers", "Sushi", "Repair",
+]  # fmt: skip
+
+QUERIES = {
+    "substring": (
+        f"SELECT id, name FROM {TABLE} "
+        "WHERE lower(name) LIKE '%' || :q || '%' "
+        "ORDER BY name, id LIMIT 50"
+    ),
+    "similarity": (
+        f"SELECT id, name, similarity(lower(name), :q) AS score FROM {TABLE} "
+        "WHERE lower(name) % :q "
+        "ORDER BY score DESC, name, id LIMIT 10"
+    ),
+}
+QUERY_TEXT = {"substring": "fee hou", "similarity": "cofee hous"}
+
+
+async def create_table(conn: AsyncConnection, rows: int) -> None:
+    words = "ARRAY[" + ", ".join(f"'{w}'" for w in WORDS) + "]"
+    n = len(WORDS)
+    await conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+    await conn.execute(text(f"DROP TABLE IF EXISTS {TABLE}"))
+    await conn.execute(
+        text(
+            f"""
+            CREATE TEMPORARY TABLE {TABLE} AS
+            SELECT gen_random_uuid() AS id,
+                   ({words})[1 + (i * 7) % {n}] || ' '
+                   || ({words})[1 + (i * 13 / {n}) % {n}] || ' №' || i AS name
+            FROM generate_series(1, :rows) AS i
+            """
+        ),
+        {"rows": rows},
+    )
+    await conn.execute(text(f"CREATE INDEX ON {TABLE} (name, id)"))
+    await conn.execute(text(f"ANALYZE {TABLE}"))
+
+
+async def explain(conn: AsyncConnection, label: str) -> None:
+    await conn.execute(text("SET LOCAL pg_trgm.similarity_threshold = 0.3"))
+    for name, sql in QUERIES.items():
+        result = await conn.execute(
+            text(f"EXPLAIN (ANALYZE, BUFFERS) {sql}"), {"q": QUERY_TEXT[name]}
+        )
+        print(f"--- {name}, {label}")
+        for (line,) in result:
+            print(line)
+        print()
+
+
+async def main(rows: int) -> None:
+    engine = create_async_engine(os.environ["DATABASE_URL"])
+    try:
+        async with engine.begin() as conn:
+            print(f"building {rows:,} rows ...")
+            await create_table(conn, rows)
+
+            await explain(conn, "btree (name, id) only")
+
+            await conn.execute(
+                text(
+                    f"CREATE INDEX {TABLE}_trgm ON {TABLE} "
+                    "USING gin (lower(name) gin_trgm_ops)"
+                )
+            )
+            await conn.execute(text(f"ANALYZE {TABLE}"))
+            await explain(conn, "with gin (lower(name) gin_trgm_ops)")
+    finally:
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else ROWS))
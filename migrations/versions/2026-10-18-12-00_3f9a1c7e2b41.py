@@ -0,0 +1,38 @@
+"""organization name trigram index
+
+Revision ID: 3f9a1c7e2b41
+Revises:
+Create Date: 2026-10-18 12:00:00.000000
+
+Adds a pg_trgm GIN index on lower(organization.name). It serves the
+substring search (lower(name) LIKE '%q%') and the similarity search
+(lower(name) % q), which otherwise scan the whole table.
+
+The index is built CONCURRENTLY so the table stays writable; that
+cannot run inside a transaction, hence the autocommit blocks.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "3f9a1c7e2b41"
+down_revision: Union[str, Sequence[str], None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_organization_name_trgm "
+            "ON organization USING gin (lower(name) gin_trgm_ops)"
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_organization_name_trgm")
@@ -0,0 +1,38 @@
+"""organization name prefix index
+
+Revision ID: 8c4e2a9d5b17
+Revises: 3f9a1c7e2b41
+Create Date: 2026-10-18 13:00:00.000000
+
+Adds a btree on lower(organization.name) in the "C" collation for name
+autocomplete (lower(name) LIKE 'p%' ORDER BY lower(name), id LIMIT n).
+With byte order the planner turns the prefix LIKE into a range scan and
+reads rows already sorted, whatever the database collation is;
+text_pattern_ops would serve the LIKE but not the ORDER BY.
+
+Built CONCURRENTLY, outside a transaction, like the trigram index.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "8c4e2a9d5b17"
+down_revision: Union[str, Sequence[str], None] = "3f9a1c7e2b41"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_organization_name_prefix "
+            'ON organization ((lower(name) COLLATE "C"), id)'
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_organization_name_prefix")
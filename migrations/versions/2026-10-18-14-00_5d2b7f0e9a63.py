@@ -0,0 +1,61 @@
+"""business type organization counts
+
+Revision ID: 5d2b7f0e9a63
+Revises: 8c4e2a9d5b17
+Create Date: 2026-10-18 14:00:00.000000
+
+Creates business_type_org_count, the per business type direct and
+subtree organization counts kept up to date by the repositories, and
+fills it from the existing links and closure table. Databases created
+from 01_db_init.sql already have the table, so both steps skip what is
+there, like the index revisions do.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "5d2b7f0e9a63"
+down_revision: Union[str, Sequence[str], None] = "8c4e2a9d5b17"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute(
+        """
+        CREATE TABLE IF NOT EXISTS business_type_org_count (
+            business_type_id UUID PRIMARY KEY
+                REFERENCES business_type(id) ON DELETE CASCADE,
+            direct_count INTEGER NOT NULL DEFAULT 0,
+            total_count INTEGER NOT NULL DEFAULT 0
+        )
+        """
+    )
+    op.execute(
+        """
+        INSERT INTO business_type_org_count (business_type_id, direct_count, total_count)
+        SELECT
+            bt.id,
+            (
+                SELECT count(*)
+                FROM organization_business_type obt
+                WHERE obt.business_type_id = bt.id
+            ),
+            (
+                SELECT count(DISTINCT obt.organization_id)
+                FROM business_type_closure btc
+                JOIN organization_business_type obt
+                    ON obt.business_type_id = btc.descendant_id
+                WHERE btc.ancestor_id = bt.id
+            )
+        FROM business_type bt
+        ON CONFLICT (business_type_id) DO NOTHING
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("DROP TABLE IF EXISTS business_type_org_count")
@@ -0,0 +1,57 @@
+"""organization keyset pagination indexes
+
+Revision ID: a7c3e1f4d829
+Revises: 5d2b7f0e9a63
+Create Date: 2026-10-18 15:00:00.000000
+
+Widens ix_organization_name to (name, id) and ix_organization_facility to
+(facility_id, name, id). Every paginated organization listing orders by
+(name, id) and seeks with (name, id) > (:name, :id), which only the wide
+indexes serve without sorting everything before the page.
+
+The indexes keep their names, so each is built CONCURRENTLY under a
+temporary name, swapped in for the old one and renamed. Databases created
+from 01_db_init.sql already have the wide definitions and are skipped.
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "a7c3e1f4d829"
+down_revision: Union[str, Sequence[str], None] = "5d2b7f0e9a63"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _replace_index(name: str, table: str, columns: str) -> None:
+    current = op.get_bind().scalar(
+        sa.text(
+            "SELECT indexdef FROM pg_indexes "
+            "WHERE schemaname = current_schema() AND indexname = :name"
+        ),
+        {"name": name},
+    )
+    if current is not None and current.endswith(f"({columns})"):
+        return
+
+    staged = f"{name}_new"
+    with op.get_context().autocommit_block():
+        op.execute(
+            f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {staged} ON {table} ({columns})"
+        )
+        op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
+        op.execute(f"ALTER INDEX {staged} RENAME TO {name}")
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    _replace_index("ix_organization_name", "organization", "name, id")
+    _replace_index("ix_organization_facility", "organization", "facility_id, name, id")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    _replace_index("ix_organization_name", "organization", "name")
+    _replace_index("ix_organization_facility", "organization", "facility_id")
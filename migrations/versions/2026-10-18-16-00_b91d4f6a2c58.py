@@ -0,0 +1,58 @@
+"""business type closure covering indexes
+
+Revision ID: b91d4f6a2c58
+Revises: a7c3e1f4d829
+Create Date: 2026-10-18 16:00:00.000000
+
+Adds depth to ix_btc_ancestor and ix_btc_descendant. Path, ancestor and
+subtree queries filter the closure by one end and then by or in order of
+depth; with depth in the index that is a range scan instead of a sort.
+
+The indexes keep their names, so each is built CONCURRENTLY under a
+temporary name, swapped in for the old one and renamed. Databases created
+from 01_db_init.sql already have the covering definitions and are skipped.
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "b91d4f6a2c58"
+down_revision: Union[str, Sequence[str], None] = "a7c3e1f4d829"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _replace_index(name: str, table: str, columns: str) -> None:
+    current = op.get_bind().scalar(
+        sa.text(
+            "SELECT indexdef FROM pg_indexes "
+            "WHERE schemaname = current_schema() AND indexname = :name"
+        ),
+        {"name": name},
+    )
+    if current is not None and current.endswith(f"({columns})"):
+        return
+
+    staged = f"{name}_new"
+    with op.get_context().autocommit_block():
+        op.execute(
+            f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {staged} ON {table} ({columns})"
+        )
+        op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
+        op.execute(f"ALTER INDEX {staged} RENAME TO {name}")
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    _replace_index("ix_btc_ancestor", "business_type_closure", "ancestor_id, depth")
+    _replace_index(
+        "ix_btc_descendant", "business_type_closure", "descendant_id, depth"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    _replace_index("ix_btc_ancestor", "business_type_closure", "ancestor_id")
+    _replace_index("ix_btc_descendant", "business_type_closure", "descendant_id")
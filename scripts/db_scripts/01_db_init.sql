@@ -35,8 +35,17 @@ CREATE TABLE business_type_closure (
     PRIMARY KEY (ancestor_id, descendant_id)
 );
 
-CREATE INDEX ix_btc_ancestor ON business_type_closure (ancestor_id);
-CREATE INDEX ix_btc_descendant ON business_type_closure (descendant_id);
+CREATE INDEX ix_btc_ancestor ON business_type_closure (ancestor_id, depth);
+CREATE INDEX ix_btc_descendant ON business_type_closure (descendant_id, depth);
+
+------------------------------------------------------------
+-- TABLE: business_type_org_count
+------------------------------------------------------------
+CREATE TABLE business_type_org_count (
+    business_type_id UUID PRIMARY KEY REFERENCES business_type(id) ON DELETE CASCADE,
+    direct_count INTEGER NOT NULL DEFAULT 0,
+    total_count INTEGER NOT NULL DEFAULT 0
+);
 
 ------------------------------------------------------------
 -- TABLE: organization
@@ -47,8 +56,11 @@ CREATE TABLE organization (
     facility_id UUID NOT NULL REFERENCES facility(id) ON DELETE CASCADE
 );
 
-CREATE INDEX ix_organization_name ON organization (name);
-CREATE INDEX ix_organization_facility ON organization (facility_id);
+-- (name, id) is the keyset order of every paginated organization listing
+CREATE INDEX ix_organization_name ON organization (name, id);
+CREATE INDEX ix_organization_facility ON organization (facility_id, name, id);
+-- name autocomplete: prefix LIKE and ORDER BY in byte order
+CREATE INDEX ix_organization_name_prefix ON organization ((lower(name) COLLATE "C"), id);
 
 ------------------------------------------------------------
 -- TABLE: phone_table
@@ -175,3 +187,23 @@ INSERT INTO organization_business_type (organization_id, business_type_id) VALUE
     -- ТехСервис+: ремонт техники + логистика
     ('99999999-5555-5555-5555-555555555555', 'ccccccc2-cccc-cccc-cccc-ccccccccccc2'),
     ('99999999-5555-5555-5555-555555555555', 'ccccccc1-cccc-cccc-cccc-ccccccccccc1');
+
+-------------------------
+-- business_type_org_count
+-- (derived from the links and the closure above)
+-------------------------
+INSERT INTO business_type_org_count (business_type_id, direct_count, total_count)
+SELECT
+    bt.id,
+    (
+        SELECT count(*)
+        FROM organization_business_type obt
+        WHERE obt.business_type_id = bt.id
+    ),
+    (
+        SELECT count(DISTINCT obt.organization_id)
+        FROM business_type_closure btc
+        JOIN organization_business_type obt ON obt.business_type_id = btc.descendant_id
+        WHERE btc.ancestor_id = bt.id
+    )
+FROM business_type bt;
@@ -0,0 +1,9 @@
+from domain.repositories.business_type_repository import BusinessTypeRepository
+
+
+class AutocompleteBusinessTypesUseCase:
+    def __init__(self, bt_repo: BusinessTypeRepository):
+        self._bt_repo = bt_repo
+
+    async def execute(self, prefix: str, limit: int):
+        return await self._bt_repo.list_by_name_prefix(prefix, limit)
@@ -0,0 +1,26 @@
+from typing import Mapping
+from uuid import UUID
+
+from domain.repositories.business_type_repository import BusinessTypeRepository
+from domain.repositories.organization_repository import OrganizationRepository
+from domain.val_objs.ids import BusinessTypeId
+from domain.val_objs.org_count import OrganizationCount
+
+
+class CountOrganizationsByBusinessTypeUseCase:
+    def __init__(
+        self,
+        org_repo: OrganizationRepository,
+        bt_repo: BusinessTypeRepository,
+    ) -> None:
+        self._org_repo = org_repo
+        self._bt_repo = bt_repo
+
+    async def execute(
+        self, root_bt_id: UUID | None = None
+    ) -> Mapping[BusinessTypeId, OrganizationCount]:
+        if root_bt_id is None:
+            return await self._org_repo.count_by_business_type()
+
+        root_bt = await self._bt_repo.get_by_id(BusinessTypeId(root_bt_id))
+        return await self._org_repo.count_by_business_type(root_bt)
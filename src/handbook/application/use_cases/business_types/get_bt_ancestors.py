@@ -0,0 +1,34 @@
+from typing import Sequence
+from uuid import UUID
+
+from domain.entities.business_type import BusinessType
+from domain.exceptions.base import DomainResourceNotFoundError
+from domain.repositories.business_type_repository import BusinessTypeRepository
+from domain.val_objs.ids import BusinessTypeId
+
+
+class GetBusinessTypeAncestorsUseCase:
+    def __init__(self, bt_repo: BusinessTypeRepository):
+        self._bt_repo = bt_repo
+
+    async def execute(self, bt_id: UUID) -> Sequence[BusinessType]:
+        bt_id_vo = BusinessTypeId(bt_id)
+
+        paths = await self._bt_repo.list_paths([bt_id_vo])
+        if bt_id_vo not in paths:
+            raise DomainResourceNotFoundError(
+                "BusinessType not found",
+                context={"business_type_id": str(bt_id)},
+            )
+
+        return paths[bt_id_vo]
+
+
+class GetBusinessTypeAncestorsBatchUseCase:
+    def __init__(self, bt_repo: BusinessTypeRepository):
+        self._bt_repo = bt_repo
+
+    async def execute(self, bt_ids: Sequence[UUID]) -> dict[UUID, Sequence[BusinessType]]:
+        paths = await self._bt_repo.list_paths([BusinessTypeId(i) for i in bt_ids])
+
+        return {bt_id.value: path for bt_id, path in paths.items()}
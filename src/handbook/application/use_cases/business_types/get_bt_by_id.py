@@ -1,6 +1,9 @@
+from typing import Sequence
 from uuid import UUID
 
+from domain.entities.business_type import BusinessType
 from domain.repositories.business_type_repository import BusinessTypeRepository
+from domain.val_objs.batch import BatchResult
 from domain.val_objs.ids import BusinessTypeId
 
 
@@ -12,3 +15,12 @@ class GetBusinessTypeByIdUseCase:
         bt_id_vo = BusinessTypeId(bt_id)
 
         return await self._bt_repo.get_by_id(id=bt_id_vo)
+
+
+class GetBusinessTypesByIdsUseCase:
+    def __init__(self, bt_repo: BusinessTypeRepository):
+        self._bt_repo = bt_repo
+
+    async def execute(self, bt_ids: Sequence[UUID]) -> BatchResult[BusinessType]:
+        bts = await self._bt_repo.list_by_ids([BusinessTypeId(i) for i in bt_ids])
+        return BatchResult.of(bt_ids, bts)
@@ -0,0 +1,14 @@
+from uuid import UUID
+
+from domain.repositories.business_type_repository import BusinessTypeRepository
+from domain.val_objs.ids import BusinessTypeId
+
+
+class GetBusinessTypeSubtreeUseCase:
+    def __init__(self, bt_repo: BusinessTypeRepository):
+        self._bt_repo = bt_repo
+
+    async def execute(self, bt_id: UUID, max_depth: int | None = None):
+        bt_id_vo = BusinessTypeId(bt_id)
+
+        return await self._bt_repo.get_subtree(bt_id_vo, max_depth)
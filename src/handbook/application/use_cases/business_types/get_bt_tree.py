@@ -0,0 +1,12 @@
+from domain.repositories.business_type_repository import BusinessTypeRepository
+
+
+class GetBusinessTypeTreeUseCase:
+    def __init__(self, bt_repo: BusinessTypeRepository):
+        self._bt_repo = bt_repo
+
+    async def data_version(self) -> int:
+        return await self._bt_repo.data_version()
+
+    async def execute(self):
+        return await self._bt_repo.list_roots()
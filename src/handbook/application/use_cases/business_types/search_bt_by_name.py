@@ -0,0 +1,9 @@
+from domain.repositories.business_type_repository import BusinessTypeRepository
+
+
+class SearchBusinessTypesByNameUseCase:
+    def __init__(self, bt_repo: BusinessTypeRepository):
+        self._bt_repo = bt_repo
+
+    async def execute(self, query: str, max_distance: int, limit: int):
+        return await self._bt_repo.search_by_name(query, max_distance, limit)
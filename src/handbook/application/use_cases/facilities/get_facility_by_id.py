@@ -1,6 +1,9 @@
+from typing import Sequence
 from uuid import UUID
 
+from domain.entities.facility import Facility
 from domain.repositories.facility_repository import FacilityRepository
+from domain.val_objs.batch import BatchResult
 from domain.val_objs.ids import FacilityId
 
 
@@ -12,3 +15,14 @@ class GetFacilityByIdUseCase:
         facility_id_vo = FacilityId(facility_id)
 
         return await self._facility_repo.get_by_id(facility_id_vo)
+
+
+class GetFacilitiesByIdsUseCase:
+    def __init__(self, facility_repo: FacilityRepository):
+        self._facility_repo = facility_repo
+
+    async def execute(self, facility_ids: Sequence[UUID]) -> BatchResult[Facility]:
+        facilities = await self._facility_repo.list_by_ids(
+            [FacilityId(i) for i in facility_ids]
+        )
+        return BatchResult.of(facility_ids, facilities)
@@ -0,0 +1,9 @@
+from domain.repositories.organization_repository import OrganizationRepository
+
+
+class AutocompleteOrganizationsUseCase:
+    def __init__(self, org_repo: OrganizationRepository) -> None:
+        self._org_repo = org_repo
+
+    async def execute(self, prefix: str, limit: int):
+        return await self._org_repo.list_names_by_prefix(prefix, limit)
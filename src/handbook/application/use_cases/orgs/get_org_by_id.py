@@ -1,13 +1,46 @@
+from typing import Sequence
 from uuid import UUID
 
+from domain.entities.organization import Organization
+from domain.exceptions.base import DomainResourceNotFoundError
 from domain.repositories.organization_repository import OrganizationRepository
+from domain.val_objs.batch import BatchResult
 from domain.val_objs.ids import OrganizationId
+from domain.val_objs.org_projection import OrganizationProjection, OrganizationView
 
 
 class GetOrganizationByIdUseCase:
     def __init__(self, org_repo: OrganizationRepository) -> None:
         self._org_repo = org_repo
 
-    async def execute(self, org_id: UUID):
+    async def execute(
+        self, org_id: UUID, projection: OrganizationProjection | None = None
+    ):
         org_id_vo = OrganizationId(org_id)
-        return await self._org_repo.get_by_id(org_id_vo)
+        if projection is None:
+            return await self._org_repo.get_by_id(org_id_vo)
+
+        views = await self._org_repo.view_by_ids([org_id_vo], projection)
+        if not views:
+            raise DomainResourceNotFoundError(
+                "Organization not found",
+                context={"organization_id": str(org_id)},
+            )
+        return views[0]
+
+
+class GetOrganizationsByIdsUseCase:
+    def __init__(self, org_repo: OrganizationRepository) -> None:
+        self._org_repo = org_repo
+
+    async def execute(
+        self,
+        org_ids: Sequence[UUID],
+        projection: OrganizationProjection | None = None,
+    ) -> BatchResult[Organization] | BatchResult[OrganizationView]:
+        ids = [OrganizationId(i) for i in org_ids]
+        if projection is None:
+            orgs = await self._org_repo.list_by_ids(ids)
+        else:
+            orgs = await self._org_repo.view_by_ids(ids, projection)
+        return BatchResult.of(org_ids, orgs)
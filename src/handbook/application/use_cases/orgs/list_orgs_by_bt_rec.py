@@ -1,14 +1,12 @@
-from typing import Iterable
+from typing import AsyncIterator
 from uuid import UUID
 
 from domain.entities.organization import Organization
-from domain.exceptions.base import DomainResourceNotFoundError
 from domain.repositories.business_type_repository import BusinessTypeRepository
 from domain.repositories.organization_repository import OrganizationRepository
-from domain.services.business_type_class_service import (
-    BusinessTypeClassificationService,
-)
 from domain.val_objs.ids import BusinessTypeId
+from domain.val_objs.org_projection import OrganizationProjection, OrganizationView
+from domain.val_objs.page import OrganizationPage, PageRequest
 
 
 class ListOrganizationsByBusinessTypeRecursiveUseCase:
@@ -20,11 +18,35 @@ class ListOrganizationsByBusinessTypeRecursiveUseCase:
         self._org_repo = org_repo
         self._bt_repo = bt_repo
 
-    async def execute(self, root_bt_id: UUID) -> Iterable[Organization]:
+    async def execute(
+        self,
+        root_bt_id: UUID,
+        page: PageRequest | None = None,
+        projection: OrganizationProjection | None = None,
+    ) -> OrganizationPage:
+        """With a projection, the page holds OrganizationViews."""
         root_bt_vo_id = BusinessTypeId(root_bt_id)
         root_bt = await self._bt_repo.get_by_id(root_bt_vo_id)
 
-        descendants = BusinessTypeClassificationService.get_all_descendants(root_bt)
-        all_types = [root_bt] + descendants
+        probe = page.lookahead() if page else None
+        if projection is None:
+            orgs = await self._org_repo.list_by_business_type_recursive(root_bt, probe)
+        else:
+            orgs = await self._org_repo.view_by_business_type_recursive(
+                root_bt, projection, probe
+            )
+        return OrganizationPage.of(orgs, page)
 
-        return await self._org_repo.list_by_any_business_type(all_types)
+    async def stream(
+        self, root_bt_id: UUID, projection: OrganizationProjection | None = None
+    ) -> AsyncIterator[Organization] | AsyncIterator[OrganizationView]:
+        """
+        Resolve the business type up front, then stream every match; with
+        a projection, OrganizationViews are streamed.
+        """
+        root_bt = await self._bt_repo.get_by_id(BusinessTypeId(root_bt_id))
+        if projection is None:
+            return self._org_repo.stream_by_business_type_recursive(root_bt)
+        return self._org_repo.stream_view_by_business_type_recursive(
+            root_bt, projection
+        )
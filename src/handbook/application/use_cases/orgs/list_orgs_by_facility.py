@@ -1,8 +1,12 @@
+from typing import AsyncIterator
 from uuid import UUID
 
+from domain.entities.organization import Organization
 from domain.repositories.facility_repository import FacilityRepository
 from domain.repositories.organization_repository import OrganizationRepository
 from domain.val_objs.ids import FacilityId
+from domain.val_objs.org_projection import OrganizationProjection, OrganizationView
+from domain.val_objs.page import OrganizationPage, PageRequest
 
 
 class ListOrganizationsByFacilityUseCase:
@@ -12,7 +16,31 @@ class ListOrganizationsByFacilityUseCase:
         self._org_repo = org_repo
         self._facility_repo = facility_repo
 
-    async def execute(self, facility_id: UUID):
+    async def execute(
+        self,
+        facility_id: UUID,
+        page: PageRequest | None = None,
+        projection: OrganizationProjection | None = None,
+    ) -> OrganizationPage:
+        """With a projection, the page holds OrganizationViews."""
         facility_id_vo = FacilityId(facility_id)
         facility = await self._facility_repo.get_by_id(facility_id_vo)
-        return await self._org_repo.list_by_facility(facility)
+
+        probe = page.lookahead() if page else None
+        if projection is None:
+            orgs = await self._org_repo.list_by_facility(facility, probe)
+        else:
+            orgs = await self._org_repo.view_by_facility(facility, projection, probe)
+        return OrganizationPage.of(orgs, page)
+
+    async def stream(
+        self, facility_id: UUID, projection: OrganizationProjection | None = None
+    ) -> AsyncIterator[Organization] | AsyncIterator[OrganizationView]:
+        """
+        Resolve the facility up front, then stream every match; with a
+        projection, OrganizationViews are streamed.
+        """
+        facility = await self._facility_repo.get_by_id(FacilityId(facility_id))
+        if projection is None:
+            return self._org_repo.stream_by_facility(facility)
+        return self._org_repo.stream_view_by_facility(facility, projection)
@@ -1,25 +1,46 @@
 from decimal import Decimal
+from typing import AsyncIterator
 
-from domain.repositories.facility_repository import FacilityRepository
+from domain.entities.organization import Organization
 from domain.repositories.organization_repository import OrganizationRepository
 from domain.val_objs.coords import Coordinates
+from domain.val_objs.org_projection import OrganizationProjection, OrganizationView
+from domain.val_objs.page import OrganizationPage, PageRequest
 
 
 class ListOrganizationsInRadiusUseCase:
-    def __init__(
-        self,
-        facility_repo: FacilityRepository,
-        org_repo: OrganizationRepository,
-    ) -> None:
-        self._facility_repo = facility_repo
+    def __init__(self, org_repo: OrganizationRepository) -> None:
         self._org_repo = org_repo
 
-    async def execute(self, lat: Decimal, lon: Decimal, radius_meters: float):
+    async def execute(
+        self,
+        lat: Decimal,
+        lon: Decimal,
+        radius_meters: float,
+        page: PageRequest | None = None,
+        projection: OrganizationProjection | None = None,
+    ) -> OrganizationPage:
+        """With a projection, the page holds OrganizationViews."""
         center = Coordinates(lat=lat, lon=lon)
-        facilities = await self._facility_repo.list_in_radius(center, radius_meters)
 
-        orgs = []
-        for facility in facilities:
-            orgs.extend(await self._org_repo.list_by_facility(facility))
+        probe = page.lookahead() if page else None
+        if projection is None:
+            orgs = await self._org_repo.list_in_radius(center, radius_meters, probe)
+        else:
+            orgs = await self._org_repo.view_in_radius(
+                center, radius_meters, projection, probe
+            )
+        return OrganizationPage.of(orgs, page)
 
-        return orgs
+    async def stream(
+        self,
+        lat: Decimal,
+        lon: Decimal,
+        radius_meters: float,
+        projection: OrganizationProjection | None = None,
+    ) -> AsyncIterator[Organization] | AsyncIterator[OrganizationView]:
+        """With a projection, OrganizationViews are streamed."""
+        center = Coordinates(lat=lat, lon=lon)
+        if projection is None:
+            return self._org_repo.stream_in_radius(center, radius_meters)
+        return self._org_repo.stream_view_in_radius(center, radius_meters, projection)
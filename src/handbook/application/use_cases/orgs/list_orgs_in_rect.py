@@ -1,18 +1,16 @@
 from decimal import Decimal
+from typing import AsyncIterator
 
-from domain.repositories.facility_repository import FacilityRepository
+from domain.entities.organization import Organization
 from domain.repositories.organization_repository import OrganizationRepository
 from domain.val_objs.coords import Coordinates
+from domain.val_objs.org_projection import OrganizationProjection, OrganizationView
+from domain.val_objs.page import OrganizationPage, PageRequest
 
 
 class ListOrganizationsInRectangleUseCase:
-    def __init__(
-        self,
-        org_repo: OrganizationRepository,
-        facility_repo: FacilityRepository,
-    ) -> None:
+    def __init__(self, org_repo: OrganizationRepository) -> None:
         self.org_repo = org_repo
-        self.facility_repo = facility_repo
 
     async def execute(
         self,
@@ -20,14 +18,34 @@ class ListOrganizationsInRectangleUseCase:
         lon1: Decimal,
         lat2: Decimal,
         lon2: Decimal,
-    ):
+        page: PageRequest | None = None,
+        projection: OrganizationProjection | None = None,
+    ) -> OrganizationPage:
+        """With a projection, the page holds OrganizationViews."""
         p1 = Coordinates(lat=lat1, lon=lon1)
         p2 = Coordinates(lat=lat2, lon=lon2)
 
-        facilities = await self.facility_repo.list_in_rectangle(p1=p1, p2=p2)
+        probe = page.lookahead() if page else None
+        if projection is None:
+            orgs = await self.org_repo.list_in_rectangle(p1=p1, p2=p2, page=probe)
+        else:
+            orgs = await self.org_repo.view_in_rectangle(
+                p1=p1, p2=p2, projection=projection, page=probe
+            )
+        return OrganizationPage.of(orgs, page)
 
-        orgs = []
-        for facility in facilities:
-            orgs.extend(await self.org_repo.list_by_facility(facility))
+    async def stream(
+        self,
+        lat1: Decimal,
+        lon1: Decimal,
+        lat2: Decimal,
+        lon2: Decimal,
+        projection: OrganizationProjection | None = None,
+    ) -> AsyncIterator[Organization] | AsyncIterator[OrganizationView]:
+        """With a projection, OrganizationViews are streamed."""
+        p1 = Coordinates(lat=lat1, lon=lon1)
+        p2 = Coordinates(lat=lat2, lon=lon2)
 
-        return orgs
+        if projection is None:
+            return self.org_repo.stream_in_rectangle(p1=p1, p2=p2)
+        return self.org_repo.stream_view_in_rectangle(p1, p2, projection)
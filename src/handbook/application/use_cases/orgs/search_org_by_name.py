@@ -1,9 +1,33 @@
+from typing import AsyncIterator
+
+from domain.entities.organization import Organization
 from domain.repositories.organization_repository import OrganizationRepository
+from domain.val_objs.org_projection import OrganizationProjection, OrganizationView
+from domain.val_objs.page import OrganizationPage, PageRequest
 
 
 class SearchOrganizationByNameUseCase:
     def __init__(self, org_repo: OrganizationRepository) -> None:
         self._org_repo = org_repo
 
-    async def execute(self, query: str):
-        return await self._org_repo.search_by_name(query)
+    async def execute(
+        self,
+        query: str,
+        page: PageRequest | None = None,
+        projection: OrganizationProjection | None = None,
+    ) -> OrganizationPage:
+        """With a projection, the page holds OrganizationViews."""
+        probe = page.lookahead() if page else None
+        if projection is None:
+            orgs = await self._org_repo.search_by_name(query, probe)
+        else:
+            orgs = await self._org_repo.view_search_by_name(query, projection, probe)
+        return OrganizationPage.of(orgs, page)
+
+    async def stream(
+        self, query: str, projection: OrganizationProjection | None = None
+    ) -> AsyncIterator[Organization] | AsyncIterator[OrganizationView]:
+        """With a projection, OrganizationViews are streamed."""
+        if projection is None:
+            return self._org_repo.stream_search_by_name(query)
+        return self._org_repo.stream_view_search_by_name(query, projection)
@@ -0,0 +1,9 @@
+from domain.repositories.organization_repository import OrganizationRepository
+
+
+class SearchOrganizationsBySimilarityUseCase:
+    def __init__(self, org_repo: OrganizationRepository) -> None:
+        self._org_repo = org_repo
+
+    async def execute(self, query: str, threshold: float, limit: int):
+        return await self._org_repo.search_by_similarity(query, threshold, limit)
@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+from itertools import count
+from typing import Callable, Hashable, Iterable, TypeVar
+
 from domain.entities.base import Entity
 from domain.exceptions.business_type_err import (
     BusinessTypeError,
@@ -9,10 +12,34 @@ from domain.val_objs.business_name import BusinessName
 from domain.val_objs.ids import BusinessTypeId
 
 
+T = TypeVar("T")
+
+_label_versions = count()
+
+
+class _TreeLabels:
+    """
+    Shared by every node labelled in one pass over a tree.
+    Marked stale on any structural change to that tree; values memoized
+    for its nodes are dropped together with it.
+    """
+
+    __slots__ = ("stale", "version", "memo")
+
+    def __init__(self) -> None:
+        self.stale = False
+        self.version = next(_label_versions)
+        self.memo: dict[tuple[int, Hashable], object] = {}
+
+
 class BusinessType(Entity[BusinessTypeId]):
     """
     Represents a hierarchical business type.
     Example: Retail -> Clothing -> Sportswear
+
+    Every node carries a pre-order (enter, exit) interval and its depth
+    within its tree, so ancestry checks are integer comparisons. Labels
+    are recomputed lazily, one tree at a time, after that tree changes.
     """
 
     MAX_DEPTH = 3
@@ -30,6 +57,11 @@ class BusinessType(Entity[BusinessTypeId]):
         self._parent = None
         self._children: list[BusinessType] = []
 
+        self._labels = _TreeLabels()
+        self._enter = 0
+        self._exit = 1
+        self._level = 0
+
         if parent:
             self.set_parent(parent)
 
@@ -39,6 +71,66 @@ class BusinessType(Entity[BusinessTypeId]):
 
         self._validate_invariants()
 
+    # ---------------------------------------------------------
+    # Reconstitution
+    # ---------------------------------------------------------
+
+    @classmethod
+    def reconstitute(
+        cls,
+        records: Iterable[tuple[BusinessTypeId, BusinessName, BusinessTypeId | None]],
+    ) -> dict[BusinessTypeId, BusinessType]:
+        """
+        Rebuild a forest from already persisted (id, name, parent_id) rows.
+
+        Links are set directly in one pass, and cycles and depth are checked
+        once for the whole forest, instead of re-validating the subtree on
+        every set_parent/add_child. Rows whose parent is not among the
+        records become roots.
+        """
+        nodes: dict[BusinessTypeId, BusinessType] = {}
+        parent_ids: list[tuple[BusinessType, BusinessTypeId | None]] = []
+        for id_, name, parent_id in records:
+            node = cls(id_=id_, name=name)
+            nodes[id_] = node
+            parent_ids.append((node, parent_id))
+
+        roots: list[BusinessType] = []
+        for node, parent_id in parent_ids:
+            parent = nodes.get(parent_id) if parent_id is not None else None
+            if parent is None:
+                roots.append(node)
+            else:
+                node._parent = parent
+                parent._children.append(node)
+
+        cls._validate_forest(roots, len(nodes))
+        for root in roots:
+            root._relabel()
+        return nodes
+
+    @classmethod
+    def _validate_forest(cls, roots: list[BusinessType], size: int) -> None:
+        visited = 0
+        level = roots
+        depth = 0
+        while level:
+            if depth >= cls.MAX_DEPTH:
+                raise BusinessTypeHierarchyError(
+                    "Maximum hierarchy depth exceeded",
+                    context={
+                        "business_type": level[0].name.value,
+                        "depth": depth,
+                    },
+                )
+            visited += len(level)
+            level = [child for node in level for child in node._children]
+            depth += 1
+
+        # nodes on a parent cycle are never reached from a root
+        if visited != size:
+            raise BusinessTypeHierarchyError("Invalid hierarchy: cycle detected")
+
     # ---------------------------------------------------------
     # Properties
     # ---------------------------------------------------------
@@ -51,6 +143,38 @@ class BusinessType(Entity[BusinessTypeId]):
     def children(self) -> tuple[BusinessType, ...]:
         return tuple(self._children)
 
+    @property
+    def depth(self) -> int:
+        """Number of ancestors; 0 for a root."""
+        self._ensure_labels()
+        return self._level
+
+    @property
+    def interval(self) -> tuple[int, int]:
+        """Pre-order (enter, exit) label; nested for every descendant."""
+        self._ensure_labels()
+        return self._enter, self._exit
+
+    @property
+    def tree_version(self) -> int:
+        """Changes whenever the tree containing this node changes shape."""
+        self._ensure_labels()
+        return self._labels.version
+
+    def memoized(self, key: Hashable, compute: Callable[[BusinessType], T]) -> T:
+        """
+        Return `compute(self)`, cached until this node's tree changes.
+        `compute` must only depend on the tree's shape.
+        """
+        self._ensure_labels()
+        memo = self._labels.memo
+        entry = (id(self), key)
+        try:
+            return memo[entry]  # type: ignore[return-value]
+        except KeyError:
+            value = memo[entry] = compute(self)
+            return value
+
     # ---------------------------------------------------------
     # Parent / Child Management
     # ---------------------------------------------------------
@@ -59,7 +183,7 @@ class BusinessType(Entity[BusinessTypeId]):
         if child is self:
             raise BusinessTypeHierarchyError("BusinessType cannot be its own child")
 
-        if child.is_ancestor_of(self):
+        if self._has_ancestor(child):
             raise BusinessTypeHierarchyError("Hierarchy cycle detected")
 
         if child in self._children:
@@ -69,6 +193,8 @@ class BusinessType(Entity[BusinessTypeId]):
         if child._parent and child._parent is not self:
             child._parent.remove_child(child)
 
+        self._labels.stale = True
+        child._labels.stale = True
         self._children.append(child)
         child._parent = self
 
@@ -78,6 +204,7 @@ class BusinessType(Entity[BusinessTypeId]):
         if child not in self._children:
             raise BusinessTypeError("Child not found")
 
+        self._labels.stale = True
         self._children.remove(child)
         child._parent = None
 
@@ -87,7 +214,7 @@ class BusinessType(Entity[BusinessTypeId]):
         if new_parent is self:
             raise BusinessTypeHierarchyError("BusinessType cannot be its own parent")
 
-        if new_parent and self.is_ancestor_of(new_parent):
+        if new_parent and new_parent._has_ancestor(self):
             raise BusinessTypeHierarchyError("Hierarchy cycle detected")
 
         # detach from old parent
@@ -97,6 +224,8 @@ class BusinessType(Entity[BusinessTypeId]):
         self._parent = new_parent
 
         if new_parent:
+            new_parent._labels.stale = True
+            self._labels.stale = True
             new_parent._children.append(self)
 
         self._validate_invariants()
@@ -106,16 +235,24 @@ class BusinessType(Entity[BusinessTypeId]):
     # ---------------------------------------------------------
 
     def is_descendant_of(self, other: BusinessType) -> bool:
-        current = self._parent
-        while current:
-            if current is other:
-                return True
-            current = current._parent
-        return False
+        self._ensure_labels()
+        other._ensure_labels()
+        if self._labels is other._labels:
+            return other._enter < self._enter and self._exit < other._exit
+        # separately loaded trees: compare by ID along the parent chain
+        return self._has_ancestor(other)
 
     def is_ancestor_of(self, other: BusinessType) -> bool:
         return other.is_descendant_of(self)
 
+    def in_subtree_of(self, root: BusinessType) -> bool:
+        """True for `root` itself and for every descendant of it."""
+        self._ensure_labels()
+        root._ensure_labels()
+        if self._labels is root._labels:
+            return root._enter <= self._enter and self._exit <= root._exit
+        return self == root or self._has_ancestor(root)
+
     def root(self) -> BusinessType:
         current = self
         while current._parent:
@@ -128,6 +265,48 @@ class BusinessType(Entity[BusinessTypeId]):
             result.extend(child.get_recursive_business_types())
         return result
 
+    # ---------------------------------------------------------
+    # Interval labels
+    # ---------------------------------------------------------
+
+    def _ensure_labels(self) -> None:
+        if self._labels.stale:
+            self.root()._relabel()
+
+    def _relabel(self) -> None:
+        """Assign pre-order intervals and depths to this root's tree."""
+        labels = _TreeLabels()
+        clock = 0
+        self._level = 0
+        stack: list[tuple[BusinessType, bool]] = [(self, False)]
+
+        while stack:
+            node, leaving = stack.pop()
+            if leaving:
+                node._exit = clock
+                clock += 1
+                continue
+
+            node._labels = labels
+            node._enter = clock
+            clock += 1
+            stack.append((node, True))
+            for child in reversed(node._children):
+                child._level = node._level + 1
+                stack.append((child, False))
+
+    def _has_ancestor(self, other: BusinessType) -> bool:
+        """
+        Parent walk comparing by ID (depth <= MAX_DEPTH); used while the
+        tree is being changed and across separately loaded trees.
+        """
+        current = self._parent
+        while current:
+            if current == other:
+                return True
+            current = current._parent
+        return False
+
     # ---------------------------------------------------------
     # Invariants
     # ---------------------------------------------------------
@@ -137,19 +316,23 @@ class BusinessType(Entity[BusinessTypeId]):
         self._validate_depth()
 
     def _validate_no_cycles(self) -> None:
-        if self._parent and self.is_ancestor_of(self._parent):
+        if self._parent and self._parent._has_ancestor(self):
             raise BusinessTypeHierarchyError("Invalid hierarchy: cycle detected")
 
     def _validate_depth(self) -> None:
-        for bt in self.get_recursive_business_types():
-            if bt._depth() >= self.MAX_DEPTH:
+        depth = self._depth()
+        level = [self]
+        while level:
+            if depth >= self.MAX_DEPTH:
                 raise BusinessTypeHierarchyError(
                     "Maximum hierarchy depth exceeded",
                     context={
-                        "business_type": bt.name.value,
-                        "depth": bt._depth(),
+                        "business_type": level[0].name.value,
+                        "depth": depth,
                     },
                 )
+            level = [child for node in level for child in node._children]
+            depth += 1
 
     def _depth(self) -> int:
         depth = 0
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import Sequence
+from typing import Mapping, Sequence
 
 from domain.entities.business_type import BusinessType
 from domain.val_objs.business_name import BusinessName
@@ -26,14 +26,42 @@ class BusinessTypeRepository(ABC):
         """
         raise NotImplementedError
 
+    @abstractmethod
+    async def list_by_ids(self, ids: Sequence[BusinessTypeId]) -> Sequence[BusinessType]:
+        """
+        Retrieve the business types with the given IDs in no particular
+        order. Unknown IDs are skipped.
+        """
+        raise NotImplementedError
+
     @abstractmethod
     async def get_by_name(self, name: BusinessName) -> BusinessType:
         """
-        Retrieve a business type by its name.
+        Retrieve a business type by its name, ignoring case.
         Raises DomainResourceNotFoundError if not found.
         """
         raise NotImplementedError
 
+    @abstractmethod
+    async def list_by_name_prefix(
+        self, prefix: str, limit: int
+    ) -> Sequence[BusinessType]:
+        """
+        Return up to `limit` business types whose name starts with `prefix`,
+        ignoring case, ordered by name.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def search_by_name(
+        self, query: str, max_distance: int, limit: int
+    ) -> Sequence[BusinessType]:
+        """
+        Return up to `limit` business types whose name is within
+        `max_distance` edits of `query`, ignoring case, closest first.
+        """
+        raise NotImplementedError
+
     @abstractmethod
     async def list_all(self) -> Sequence[BusinessType]:
         """Return all business types."""
@@ -49,6 +77,14 @@ class BusinessTypeRepository(ABC):
         """Delete a business type."""
         raise NotImplementedError
 
+    @abstractmethod
+    async def data_version(self) -> int:
+        """
+        Return a token that changes whenever any business type changes.
+        Lets callers reuse results derived from an unchanged hierarchy.
+        """
+        raise NotImplementedError
+
     # ---------------------------------------------------------
     # Hierarchy-specific queries
     # ---------------------------------------------------------
@@ -67,3 +103,24 @@ class BusinessTypeRepository(ABC):
     async def list_descendants(self, root: BusinessType) -> Sequence[BusinessType]:
         """Return all descendants of a business type (recursive)."""
         raise NotImplementedError
+
+    @abstractmethod
+    async def list_paths(
+        self, ids: Sequence[BusinessTypeId]
+    ) -> Mapping[BusinessTypeId, Sequence[BusinessType]]:
+        """
+        Return, for each known ID, the path from its root down to the
+        business type itself. Unknown IDs are left out of the result.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_subtree(
+        self, id: BusinessTypeId, max_depth: int | None = None
+    ) -> BusinessType:
+        """
+        Return a detached copy of the subtree rooted at `id`, keeping only
+        nodes at most `max_depth` levels below it (all levels if None).
+        Raises DomainResourceNotFoundError if not found.
+        """
+        raise NotImplementedError
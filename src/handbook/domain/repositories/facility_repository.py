@@ -26,6 +26,14 @@ class FacilityRepository(ABC):
         """
         raise NotImplementedError
 
+    @abstractmethod
+    async def list_by_ids(self, ids: Sequence[FacilityId]) -> Sequence[Facility]:
+        """
+        Retrieve the facilities with the given IDs in no particular order.
+        Unknown IDs are skipped.
+        """
+        raise NotImplementedError
+
     @abstractmethod
     async def list_all(self) -> Sequence[Facility]:
         """
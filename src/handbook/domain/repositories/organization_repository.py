@@ -1,18 +1,33 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import Sequence
+from typing import AsyncIterator, Mapping, Sequence
 
 from domain.entities.business_type import BusinessType
 from domain.entities.facility import Facility
 from domain.entities.organization import Organization
-from domain.val_objs.ids import OrganizationId
+from domain.val_objs.coords import Coordinates
+from domain.val_objs.ids import BusinessTypeId, FacilityId, OrganizationId
+from domain.val_objs.org_count import OrganizationCount
+from domain.val_objs.org_projection import OrganizationProjection, OrganizationView
+from domain.val_objs.org_summary import OrganizationSummary
+from domain.val_objs.page import PageRequest
 
 
 class OrganizationRepository(ABC):
     """
     Repository interface for the Organization aggregate.
     Persistence-agnostic, domain-focused.
+
+    Queries taking a `page` return organizations in (name, id) order,
+    at most `page.limit` of them, starting after `page.after`. Without
+    a page they return every match in the same order.
+
+    The `stream_*` counterparts yield every match in that order without
+    materializing the whole result first.
+
+    The `view_*` counterparts return OrganizationView projections and
+    load only the parts the projection asks for.
     """
 
     # ---------------------------------------------------------
@@ -27,6 +42,14 @@ class OrganizationRepository(ABC):
         """
         raise NotImplementedError
 
+    @abstractmethod
+    async def list_by_ids(self, ids: Sequence[OrganizationId]) -> Sequence[Organization]:
+        """
+        Retrieve the organizations with the given IDs in no particular
+        order. Unknown IDs are skipped.
+        """
+        raise NotImplementedError
+
     @abstractmethod
     async def save(self, organization: Organization) -> None:
         """Persist a new or updated organization."""
@@ -42,15 +65,57 @@ class OrganizationRepository(ABC):
     # ---------------------------------------------------------
 
     @abstractmethod
-    async def list_by_facility(self, facility: Facility) -> Sequence[Organization]:
+    async def list_by_facility(
+        self, facility: Facility, page: PageRequest | None = None
+    ) -> Sequence[Organization]:
         """Organizations located in a specific facility."""
         raise NotImplementedError
 
+    @abstractmethod
+    async def list_by_facilities(
+        self, ids: Sequence[FacilityId]
+    ) -> Sequence[Organization]:
+        """Organizations located in any of the given facilities, in one lookup."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def list_in_radius(
+        self,
+        center: Coordinates,
+        radius_meters: float,
+        page: PageRequest | None = None,
+    ) -> Sequence[Organization]:
+        """
+        Organizations whose facility lies within a given radius from a
+        center point, returned with the facility attached.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def list_in_rectangle(
+        self,
+        p1: Coordinates,
+        p2: Coordinates,
+        page: PageRequest | None = None,
+    ) -> Sequence[Organization]:
+        """
+        Organizations whose facility lies inside the rectangle defined by
+        two opposite corner coordinates, returned with the facility attached.
+        """
+        raise NotImplementedError
+
     @abstractmethod
     async def list_by_business_type(self, bt: BusinessType) -> Sequence[Organization]:
         """Organizations with a specific business type (non-recursive)."""
         raise NotImplementedError
 
+    @abstractmethod
+    async def list_by_business_type_recursive(
+        self, bt: BusinessType, page: PageRequest | None = None
+    ) -> Sequence[Organization]:
+        """Organizations with the business type or any of its descendants."""
+        raise NotImplementedError
+
     @abstractmethod
     async def list_by_any_business_type(
         self, types: Sequence[BusinessType]
@@ -59,6 +124,184 @@ class OrganizationRepository(ABC):
         raise NotImplementedError
 
     @abstractmethod
-    async def search_by_name(self, query: str) -> Sequence[Organization]:
+    async def search_by_name(
+        self, query: str, page: PageRequest | None = None
+    ) -> Sequence[Organization]:
         """Case-insensitive substring search."""
         raise NotImplementedError
+
+    @abstractmethod
+    async def search_by_similarity(
+        self, query: str, threshold: float, limit: int
+    ) -> Sequence[Organization]:
+        """
+        Return up to `limit` organizations whose name has a trigram
+        similarity of at least `threshold` (0..1) to `query`, ignoring
+        case, most similar first.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def list_names_by_prefix(
+        self, prefix: str, limit: int
+    ) -> Sequence[OrganizationSummary]:
+        """
+        Return up to `limit` organizations whose name starts with `prefix`,
+        ignoring case, ordered by the case-folded name. Only id and name
+        are loaded.
+        """
+        raise NotImplementedError
+
+    # ---------------------------------------------------------
+    # Projections
+    # ---------------------------------------------------------
+
+    @abstractmethod
+    async def view_by_ids(
+        self, ids: Sequence[OrganizationId], projection: OrganizationProjection
+    ) -> Sequence[OrganizationView]:
+        """Project the organizations with the given IDs; unknown IDs are skipped."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def view_by_facility(
+        self,
+        facility: Facility,
+        projection: OrganizationProjection,
+        page: PageRequest | None = None,
+    ) -> Sequence[OrganizationView]:
+        """Project organizations located in a specific facility."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def view_in_radius(
+        self,
+        center: Coordinates,
+        radius_meters: float,
+        projection: OrganizationProjection,
+        page: PageRequest | None = None,
+    ) -> Sequence[OrganizationView]:
+        """Project organizations within a radius from a center point."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def view_in_rectangle(
+        self,
+        p1: Coordinates,
+        p2: Coordinates,
+        projection: OrganizationProjection,
+        page: PageRequest | None = None,
+    ) -> Sequence[OrganizationView]:
+        """Project organizations inside a rectangle given by opposite corners."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def view_by_business_type_recursive(
+        self,
+        bt: BusinessType,
+        projection: OrganizationProjection,
+        page: PageRequest | None = None,
+    ) -> Sequence[OrganizationView]:
+        """Project organizations with the business type or any descendant."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def view_search_by_name(
+        self,
+        query: str,
+        projection: OrganizationProjection,
+        page: PageRequest | None = None,
+    ) -> Sequence[OrganizationView]:
+        """Project organizations whose name contains `query`, ignoring case."""
+        raise NotImplementedError
+
+    # ---------------------------------------------------------
+    # Streaming
+    # ---------------------------------------------------------
+
+    @abstractmethod
+    def stream_by_facility(self, facility: Facility) -> AsyncIterator[Organization]:
+        """Stream organizations located in a specific facility."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def stream_in_radius(
+        self, center: Coordinates, radius_meters: float
+    ) -> AsyncIterator[Organization]:
+        """Stream organizations within a radius from a center point."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def stream_in_rectangle(
+        self, p1: Coordinates, p2: Coordinates
+    ) -> AsyncIterator[Organization]:
+        """Stream organizations inside a rectangle given by opposite corners."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def stream_by_business_type_recursive(
+        self, bt: BusinessType
+    ) -> AsyncIterator[Organization]:
+        """Stream organizations with the business type or any descendant."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def stream_search_by_name(self, query: str) -> AsyncIterator[Organization]:
+        """Stream the results of a case-insensitive substring search."""
+        raise NotImplementedError
+
+    # ---------------------------------------------------------
+    # Projected streaming
+    # ---------------------------------------------------------
+
+    @abstractmethod
+    def stream_view_by_facility(
+        self, facility: Facility, projection: OrganizationProjection
+    ) -> AsyncIterator[OrganizationView]:
+        """Stream projections of organizations located in a facility."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def stream_view_in_radius(
+        self,
+        center: Coordinates,
+        radius_meters: float,
+        projection: OrganizationProjection,
+    ) -> AsyncIterator[OrganizationView]:
+        """Stream projections of organizations within a radius."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def stream_view_in_rectangle(
+        self, p1: Coordinates, p2: Coordinates, projection: OrganizationProjection
+    ) -> AsyncIterator[OrganizationView]:
+        """Stream projections of organizations inside a rectangle."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def stream_view_by_business_type_recursive(
+        self, bt: BusinessType, projection: OrganizationProjection
+    ) -> AsyncIterator[OrganizationView]:
+        """Stream projections of organizations in a business type subtree."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def stream_view_search_by_name(
+        self, query: str, projection: OrganizationProjection
+    ) -> AsyncIterator[OrganizationView]:
+        """Stream projections of a case-insensitive substring search."""
+        raise NotImplementedError
+
+    # ---------------------------------------------------------
+    # Aggregates
+    # ---------------------------------------------------------
+
+    @abstractmethod
+    async def count_by_business_type(
+        self, root: BusinessType | None = None
+    ) -> Mapping[BusinessTypeId, OrganizationCount]:
+        """
+        Organization counts for every business type, or only for `root`
+        and its descendants when given.
+        """
+        raise NotImplementedError
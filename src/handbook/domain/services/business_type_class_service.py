@@ -6,50 +6,65 @@ from domain.entities.business_type import BusinessType
 class BusinessTypeClassificationService:
     """
     Read-only domain service for analyzing BusinessType hierarchies.
+
+    Results are memoized per node and dropped as soon as the node's tree
+    changes, so they are immutable frozensets safe to share as filters.
     """
 
     @staticmethod
-    def get_all_descendants(root: BusinessType) -> list[BusinessType]:
+    def get_all_descendants(root: BusinessType) -> frozenset[BusinessType]:
         """
         Retrieve all descendant business types.
         """
-        result: list[BusinessType] = []
-        stack = list(root.children)
-
-        while stack:
-            node = stack.pop()
-            result.append(node)
-            stack.extend(node.children)
-
-        return result
+        return root.memoized("descendants", _walk_descendants)
 
     @staticmethod
-    def get_all_ancestors(node: BusinessType) -> list[BusinessType]:
+    def get_all_ancestors(node: BusinessType) -> frozenset[BusinessType]:
         """
         Retrieve all ancestor business types.
         """
-        result: list[BusinessType] = []
-        current = node.parent
-
-        while current:
-            result.append(current)
-            current = current.parent
-
-        return result
+        return node.memoized("ancestors", _walk_ancestors)
 
     @staticmethod
-    def get_leaf_nodes(root: BusinessType) -> list[BusinessType]:
+    def get_leaf_nodes(root: BusinessType) -> frozenset[BusinessType]:
         """
         Find all leaf nodes in the business type hierarchy.
         """
-        leaves: list[BusinessType] = []
-        stack = [root]
+        return root.memoized("leaves", _walk_leaves)
+
+
+def _walk_descendants(root: BusinessType) -> frozenset[BusinessType]:
+    result: list[BusinessType] = []
+    stack = list(root.children)
+
+    while stack:
+        node = stack.pop()
+        result.append(node)
+        stack.extend(node.children)
 
-        while stack:
-            node = stack.pop()
-            if not node.children:
-                leaves.append(node)
-            else:
-                stack.extend(node.children)
+    return frozenset(result)
+
+
+def _walk_ancestors(node: BusinessType) -> frozenset[BusinessType]:
+    result: list[BusinessType] = []
+    current = node.parent
+
+    while current:
+        result.append(current)
+        current = current.parent
+
+    return frozenset(result)
+
+
+def _walk_leaves(root: BusinessType) -> frozenset[BusinessType]:
+    leaves: list[BusinessType] = []
+    stack = [root]
+
+    while stack:
+        node = stack.pop()
+        if not node.children:
+            leaves.append(node)
+        else:
+            stack.extend(node.children)
 
-        return leaves
+    return frozenset(leaves)
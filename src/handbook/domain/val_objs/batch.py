@@ -0,0 +1,32 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Generic, Iterable, Sequence, TypeVar
+from uuid import UUID
+
+# anything with an `id` value object: entities and their read projections
+E = TypeVar("E")
+
+
+@dataclass(frozen=True, slots=True)
+class BatchResult(Generic[E]):
+    """
+    Entities fetched for a list of IDs, in the order they were asked for,
+    and the IDs nothing was found for. Repeated IDs count once.
+    """
+
+    found: tuple[E, ...]
+    missing: tuple[UUID, ...]
+
+    @staticmethod
+    def of(ids: Sequence[UUID], entities: Iterable[E]) -> BatchResult[E]:
+        by_id = {entity.id.value: entity for entity in entities}
+        found: list[E] = []
+        missing: list[UUID] = []
+        for id_ in dict.fromkeys(ids):
+            entity = by_id.get(id_)
+            if entity is None:
+                missing.append(id_)
+            else:
+                found.append(entity)
+        return BatchResult(found=tuple(found), missing=tuple(missing))
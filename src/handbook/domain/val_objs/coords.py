@@ -1,10 +1,13 @@
 from dataclasses import dataclass, field
 from decimal import Decimal
+from math import atan2, cos, radians, sin, sqrt
 
 from domain.exceptions.base import DomainTypeError
 from domain.exceptions.facility_err import InvalidCoordinatesError
 from domain.val_objs.base import ValueObject
 
+EARTH_RADIUS_M = 6371000
+
 
 @dataclass(frozen=True, slots=True, repr=False)
 class Coordinates(ValueObject):
@@ -28,3 +31,21 @@ class Coordinates(ValueObject):
                 longitude=self.lon,
                 reason="Longitude must be between -180 and 180",
             )
+
+    def distance_to(self, other: "Coordinates") -> float:
+        """Great-circle (haversine) distance in meters."""
+        lat1, lon1 = radians(float(self.lat)), radians(float(self.lon))
+        lat2, lon2 = radians(float(other.lat)), radians(float(other.lon))
+
+        dlat = lat2 - lat1
+        dlon = lon2 - lon1
+
+        a = sin(dlat / 2) ** 2 + cos(lat1) * cos(lat2) * sin(dlon / 2) ** 2
+        return EARTH_RADIUS_M * 2 * atan2(sqrt(a), sqrt(1 - a))
+
+    def in_rectangle(self, p1: "Coordinates", p2: "Coordinates") -> bool:
+        """Whether the point lies in the box spanned by two opposite corners."""
+        return (
+            min(p1.lat, p2.lat) <= self.lat <= max(p1.lat, p2.lat)
+            and min(p1.lon, p2.lon) <= self.lon <= max(p1.lon, p2.lon)
+        )
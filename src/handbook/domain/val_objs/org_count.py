@@ -0,0 +1,14 @@
+from dataclasses import dataclass, field
+
+from domain.val_objs.base import ValueObject
+
+
+@dataclass(frozen=True, slots=True, repr=False)
+class OrganizationCount(ValueObject):
+    """
+    Organizations linked to a business type: `direct` to the type itself,
+    `total` to the type or any descendant, each organization counted once.
+    """
+
+    direct: int = field(repr=True)
+    total: int = field(repr=True)
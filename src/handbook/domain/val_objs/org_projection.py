@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+
+from domain.entities.business_type import BusinessType
+from domain.entities.facility import Facility
+from domain.entities.organization import Organization
+from domain.exceptions.base import DomainTypeError
+from domain.val_objs.base import ValueObject
+from domain.val_objs.ids import BusinessTypeId, FacilityId, OrganizationId
+from domain.val_objs.organization_name import OrganizationName
+from domain.val_objs.phone import PhoneNumber
+
+ORGANIZATION_FIELDS = frozenset({"id", "name", "phones", "facility", "business_types"})
+ORGANIZATION_RELATIONS = frozenset({"facility", "business_types"})
+
+
+@dataclass(frozen=True, slots=True, repr=False)
+class OrganizationProjection(ValueObject):
+    """
+    The parts of an organization a read asks for. Relations listed in
+    `fields` but not in `expand` are referenced by ID only. The default
+    is everything, fully expanded.
+    """
+
+    fields: frozenset[str] = field(default=ORGANIZATION_FIELDS, repr=True)
+    expand: frozenset[str] = field(default=ORGANIZATION_RELATIONS, repr=True)
+
+    def __post_init__(self) -> None:
+        unknown = (self.fields - ORGANIZATION_FIELDS) | (
+            self.expand - ORGANIZATION_RELATIONS
+        )
+        if unknown:
+            raise DomainTypeError(
+                message=f"Unknown organization fields: {', '.join(sorted(unknown))}"
+            )
+
+    def wants(self, name: str) -> bool:
+        return name in self.fields
+
+    def expands(self, relation: str) -> bool:
+        return relation in self.fields and relation in self.expand
+
+
+@dataclass(frozen=True, slots=True)
+class OrganizationView:
+    """
+    Read-only projection of an organization. Id and name are always
+    present (they are its identity and sort key); what the projection
+    left out is None, and unexpanded relations carry only their IDs.
+    """
+
+    id: OrganizationId
+    name: OrganizationName
+    phone_numbers: tuple[PhoneNumber, ...] | None = None
+    facility_id: FacilityId | None = None
+    facility: Facility | None = None
+    business_type_ids: tuple[BusinessTypeId, ...] | None = None
+    business_types: tuple[BusinessType, ...] | None = None
+
+    @staticmethod
+    def of(org: Organization, projection: OrganizationProjection) -> OrganizationView:
+        wants, expands = projection.wants, projection.expands
+        return OrganizationView(
+            id=org.id,
+            name=org.name,
+            phone_numbers=org.phone_numbers if wants("phones") else None,
+            facility_id=org.facility.id if wants("facility") else None,
+            facility=org.facility if expands("facility") else None,
+            business_type_ids=(
+                tuple(bt.id for bt in org.business_types)
+                if wants("business_types")
+                else None
+            ),
+            business_types=(
+                org.business_types if expands("business_types") else None
+            ),
+        )
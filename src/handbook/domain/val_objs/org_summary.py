@@ -0,0 +1,22 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from uuid import UUID
+
+from domain.entities.organization import Organization
+from domain.val_objs.base import ValueObject
+
+
+@dataclass(frozen=True, slots=True, repr=False)
+class OrganizationSummary(ValueObject):
+    """
+    Just the identity and name of an organization, for listings that
+    do not need its facility, phones or business types (e.g. typeahead).
+    """
+
+    id: UUID = field(repr=True)
+    name: str = field(repr=True)
+
+    @classmethod
+    def of(cls, org: Organization) -> OrganizationSummary:
+        return cls(id=org.id.value, name=org.name.value)
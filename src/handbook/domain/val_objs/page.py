@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Sequence
+from uuid import UUID
+
+from domain.entities.organization import Organization
+from domain.exceptions.base import DomainTypeError
+from domain.val_objs.base import ValueObject
+from domain.val_objs.org_projection import OrganizationView
+
+# pages hold full organizations or projections of them
+ListedOrganization = Organization | OrganizationView
+
+
+@dataclass(frozen=True, slots=True, repr=False)
+class OrganizationCursor(ValueObject):
+    """
+    Position in the (name, id) ordering of organizations.
+    A page requested after a cursor starts strictly past it.
+    """
+
+    name: str = field(repr=True)
+    id: UUID = field(repr=True)
+
+    @classmethod
+    def of(cls, org: ListedOrganization) -> OrganizationCursor:
+        return cls(name=org.name.value, id=org.id.value)
+
+    def __post_init__(self) -> None:
+        if not isinstance(self.name, str) or not isinstance(self.id, UUID):
+            raise DomainTypeError(message="Cursor needs a str name and a UUID id")
+
+
+def sort_key(org: ListedOrganization) -> tuple[str, UUID]:
+    """The (name, id) order every paginated organization listing uses."""
+    return org.name.value, org.id.value
+
+
+@dataclass(frozen=True, slots=True, repr=False)
+class PageRequest(ValueObject):
+    """At most `limit` organizations in (name, id) order, starting after `after`."""
+
+    limit: int = field(repr=True)
+    after: OrganizationCursor | None = field(default=None, repr=True)
+
+    def __post_init__(self) -> None:
+        if not isinstance(self.limit, int) or self.limit < 1:
+            raise DomainTypeError(message="Page limit must be a positive integer")
+
+    def lookahead(self) -> PageRequest:
+        """
+        The same request with room for one more item, so whether a next
+        page exists is known without another query.
+        """
+        return PageRequest(limit=self.limit + 1, after=self.after)
+
+    def page_of(self, items: Sequence[ListedOrganization]) -> OrganizationPage:
+        """Cut the result of a `lookahead()` request down to this page."""
+        if len(items) <= self.limit:
+            return OrganizationPage(items=tuple(items), next=None)
+
+        kept = tuple(items[: self.limit])
+        return OrganizationPage(items=kept, next=OrganizationCursor.of(kept[-1]))
+
+
+@dataclass(frozen=True, slots=True)
+class OrganizationPage:
+    """One page of organizations; `next` is None on the last page."""
+
+    items: tuple[ListedOrganization, ...]
+    next: OrganizationCursor | None = None
+
+    @staticmethod
+    def of(
+        items: Sequence[ListedOrganization], page: PageRequest | None
+    ) -> OrganizationPage:
+        """Page out of a `lookahead()` result; without a page, everything."""
+        if page is None:
+            return OrganizationPage(items=tuple(items))
+        return page.page_of(items)
@@ -0,0 +1,221 @@
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Callable, Hashable, Mapping, TypeVar
+from uuid import UUID
+
+from sqlalchemy import event, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy.orm import Session
+from structlog import get_logger
+
+from domain.entities.business_type import BusinessType
+from infra.db.models.business_type import BusinessTypeModel
+from infra.indexes.bk_tree import BKTree
+from infra.indexes.prefix_index import PrefixIndex
+from infra.repositories.mappers.business_type_mapper import BusinessTypeMapper
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+_TRACKED_KEY = "bt_tree_cache_tracked"
+_LISTENING_KEY = "bt_tree_cache_listening"
+
+
+@dataclass(frozen=True, slots=True)
+class BusinessTypeTreeSnapshot:
+    """
+    Immutable view of the whole BusinessType hierarchy at one data version.
+
+    Entities are shared between all readers of the snapshot and must be
+    treated as read-only; changes go through the repository, which
+    invalidates the snapshot once they are committed.
+    """
+
+    version: int
+    by_id: Mapping[UUID, BusinessType]
+    names: PrefixIndex[BusinessType]
+    roots: tuple[BusinessType, ...]
+    _derived: dict[Hashable, object] = field(
+        default_factory=dict, repr=False, compare=False
+    )
+
+    @classmethod
+    def build(
+        cls, version: int, items: Mapping[UUID, BusinessType]
+    ) -> BusinessTypeTreeSnapshot:
+        return cls(
+            version=version,
+            by_id=MappingProxyType(dict(items)),
+            names=PrefixIndex.build(items.values(), key=_name_of),
+            roots=tuple(bt for bt in items.values() if bt.parent is None),
+        )
+
+    def derived(self, key: Hashable, build: Callable[[], T]) -> T:
+        """
+        Build an artifact from this snapshot on first use and keep it for
+        as long as the snapshot lives, i.e. until the next data version.
+        """
+        try:
+            return self._derived[key]  # type: ignore[return-value]
+        except KeyError:
+            value = self._derived[key] = build()
+            return value
+
+    def fuzzy_names(self) -> BKTree[BusinessType]:
+        return self.derived(
+            "fuzzy_names", lambda: BKTree.build(self.by_id.values(), key=_name_of)
+        )
+
+    def descendants(self, root_id: UUID) -> list[BusinessType]:
+        """Return all descendants of a node, walking only its subtree."""
+        root = self.by_id.get(root_id)
+        if root is None:
+            return []
+
+        result: list[BusinessType] = []
+        stack = list(root.children)
+        while stack:
+            node = stack.pop()
+            result.append(node)
+            stack.extend(node.children)
+        return result
+
+
+class BusinessTypeTreeCache:
+    """
+    Process-wide holder of the current BusinessTypeTreeSnapshot.
+
+    - Every committed write to the hierarchy bumps the data version.
+    - Readers get the snapshot for the current version; only one of them
+      reloads the table when it is stale, the rest wait for that load.
+    - When a session factory is configured, a new snapshot is built in the
+      background right after the commit, so readers rarely have to wait.
+    """
+
+    def __init__(self) -> None:
+        self._version = 0
+        self._snapshot: BusinessTypeTreeSnapshot | None = None
+        self._lock = asyncio.Lock()
+        self._session_factory: async_sessionmaker[AsyncSession] | None = None
+        self._refresh_task: asyncio.Task | None = None
+
+    @property
+    def version(self) -> int:
+        return self._version
+
+    def configure(self, session_factory: async_sessionmaker[AsyncSession]) -> None:
+        """Enable background rebuilds using sessions from `session_factory`."""
+        self._session_factory = session_factory
+
+    def clear(self) -> None:
+        """Drop the current snapshot and any background rebuild."""
+        if self._refresh_task is not None and not self._refresh_task.done():
+            self._refresh_task.cancel()
+        self._refresh_task = None
+        self._snapshot = None
+        self._version += 1
+        self._lock = asyncio.Lock()
+
+    # ---------------------------------------------------------
+    # Reads
+    # ---------------------------------------------------------
+
+    def _current(self) -> BusinessTypeTreeSnapshot | None:
+        snapshot = self._snapshot
+        if snapshot is not None and snapshot.version == self._version:
+            return snapshot
+        return None
+
+    async def get(self, session: AsyncSession) -> BusinessTypeTreeSnapshot:
+        snapshot = self._current()
+        if snapshot is not None:
+            return snapshot
+
+        async with self._lock:
+            snapshot = self._current()
+            if snapshot is not None:
+                return snapshot
+            return await self._rebuild(session)
+
+    async def _rebuild(self, session: AsyncSession) -> BusinessTypeTreeSnapshot:
+        # A commit landing while we load leaves this snapshot one version
+        # behind, so the next reader rebuilds again instead of serving it.
+        # Rows the caller has flushed but not committed must not become
+        # the current version: load through a fresh session when we can,
+        # and otherwise keep a snapshot that saw pending writes private.
+        version = self._version
+        if self._session_factory is not None:
+            async with self._session_factory() as own_session:
+                items = await _load_tree(own_session)
+            pending = False
+        else:
+            items = await _load_tree(session)
+            pending = bool(session.sync_session.info.get(_TRACKED_KEY))
+        snapshot = BusinessTypeTreeSnapshot.build(version, items)
+        if not pending:
+            self._snapshot = snapshot
+        return snapshot
+
+    # ---------------------------------------------------------
+    # Invalidation
+    # ---------------------------------------------------------
+
+    def track(self, session: AsyncSession) -> None:
+        """Invalidate the snapshot once `session` commits its transaction."""
+        sync_session = session.sync_session
+        sync_session.info[_TRACKED_KEY] = True
+        if sync_session.info.get(_LISTENING_KEY):
+            return
+        sync_session.info[_LISTENING_KEY] = True
+        event.listen(sync_session, "after_commit", self._on_commit)
+        event.listen(sync_session, "after_rollback", self._on_rollback)
+
+    def _on_commit(self, session: Session) -> None:
+        if session.info.pop(_TRACKED_KEY, False):
+            self.invalidate()
+
+    def _on_rollback(self, session: Session) -> None:
+        # nothing built while the transaction was open outlives it
+        if session.info.pop(_TRACKED_KEY, False):
+            self.invalidate()
+
+    def invalidate(self) -> None:
+        self._version += 1
+
+        if self._session_factory is None:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        if self._refresh_task is None or self._refresh_task.done():
+            self._refresh_task = loop.create_task(self._refresh())
+
+    async def _refresh(self) -> None:
+        try:
+            async with self._session_factory() as session:
+                while self._current() is None:
+                    await self.get(session)
+        except Exception:
+            logger.exception("business type tree refresh failed")
+
+
+def _name_of(bt: BusinessType) -> str:
+    return bt.name.value
+
+
+async def _load_tree(session: AsyncSession) -> dict[UUID, BusinessType]:
+    stmt = select(
+        BusinessTypeModel.id,
+        BusinessTypeModel.name,
+        BusinessTypeModel.parent_id,
+    )
+    result = await session.execute(stmt)
+    return BusinessTypeMapper.to_domain_tree(result.all())
+
+
+bt_tree_cache = BusinessTypeTreeCache()
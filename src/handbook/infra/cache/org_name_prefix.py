@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from typing import Callable
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from domain.val_objs.org_summary import OrganizationSummary
+
+Suggestions = tuple[OrganizationSummary, ...]
+
+_TRACKED_KEY = "org_name_cache_tracked"
+_LISTENING_KEY = "org_name_cache_listening"
+
+
+def normalize_prefix(prefix: str) -> str:
+    """
+    The form a prefix is matched and cached in. It must agree with SQL
+    lower(name), so unlike normalize_key it does not casefold: "Straße"
+    and "STRASSE" are different prefixes there.
+    """
+    return prefix.strip().lower()
+
+
+class OrganizationNamePrefixCache:
+    """
+    Recently served organization name suggestions, keyed by the
+    lowercased prefix and the limit, least recently used evicted first.
+
+    Writes through this process's repository clear the cache; entries
+    older than `ttl` seconds are dropped on access, which bounds how long
+    changes made elsewhere (other workers, scripts) stay invisible.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 4096,
+        ttl: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._maxsize = maxsize
+        self._ttl = ttl
+        self._clock = clock
+        self._entries: OrderedDict[tuple[str, int], tuple[float, Suggestions]] = (
+            OrderedDict()
+        )
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def key(prefix: str, limit: int) -> tuple[str, int]:
+        return normalize_prefix(prefix), limit
+
+    def get(self, prefix: str, limit: int) -> Suggestions | None:
+        key = self.key(prefix, limit)
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        expires_at, suggestions = entry
+        if expires_at <= self._clock():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return suggestions
+
+    def put(self, prefix: str, limit: int, suggestions: Suggestions) -> None:
+        key = self.key(prefix, limit)
+        self._entries[key] = (self._clock() + self._ttl, suggestions)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    # ---------------------------------------------------------
+    # Invalidation
+    # ---------------------------------------------------------
+
+    def track(self, session: AsyncSession) -> None:
+        """Clear the cache once `session` commits its transaction."""
+        sync_session = session.sync_session
+        sync_session.info[_TRACKED_KEY] = True
+        if sync_session.info.get(_LISTENING_KEY):
+            return
+        sync_session.info[_LISTENING_KEY] = True
+        event.listen(sync_session, "after_commit", self._on_commit)
+        event.listen(sync_session, "after_rollback", self._on_rollback)
+
+    def has_pending_writes(self, session: AsyncSession) -> bool:
+        """Whether `session` wrote organizations it has not committed yet."""
+        return bool(session.sync_session.info.get(_TRACKED_KEY))
+
+    def _on_commit(self, session: Session) -> None:
+        if session.info.pop(_TRACKED_KEY, False):
+            self.clear()
+
+    def _on_rollback(self, session: Session) -> None:
+        session.info.pop(_TRACKED_KEY, None)
+
+
+org_name_prefix_cache = OrganizationNamePrefixCache()
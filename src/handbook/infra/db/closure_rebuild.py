@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from time import perf_counter
+
+from sqlalchemy import Uuid, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from domain.exceptions.business_type_err import BusinessTypeHierarchyError
+from infra.db.locks import lock_hierarchy_exclusive
+
+STAGING_TABLE = "business_type_closure_staging"
+
+# Generous bound on the recursion, so a parent_id cycle cannot run forever;
+# reaching it fails the rebuild instead of leaving a truncated closure.
+MAX_RECURSION_DEPTH = 64
+
+_BUILD_STAGING = f"""
+CREATE TEMPORARY TABLE {STAGING_TABLE} AS
+WITH RECURSIVE closure (ancestor_id, descendant_id, depth) AS (
+    SELECT id, id, 0
+    FROM business_type
+    UNION ALL
+    SELECT closure.ancestor_id, child.id, closure.depth + 1
+    FROM closure
+    JOIN business_type AS child ON child.parent_id = closure.descendant_id
+    WHERE closure.depth < {MAX_RECURSION_DEPTH}
+)
+SELECT ancestor_id, descendant_id, depth FROM closure
+"""
+
+# A node reachable from itself is on a cycle; hitting the depth bound means
+# a longer cycle (or a hierarchy deeper than we support).
+_FIND_BROKEN = f"""
+SELECT descendant_id FROM {STAGING_TABLE}
+WHERE (ancestor_id = descendant_id AND depth > 0) OR depth >= {MAX_RECURSION_DEPTH}
+LIMIT 10
+"""
+
+
+@dataclass(frozen=True, slots=True)
+class ClosureRebuildReport:
+    business_types: int
+    closure_rows: int
+    build_seconds: float
+    swap_seconds: float
+
+    @property
+    def total_seconds(self) -> float:
+        return self.build_seconds + self.swap_seconds
+
+
+async def rebuild_business_type_closure(session: AsyncSession) -> ClosureRebuildReport:
+    """
+    Regenerate business_type_closure from business_type.parent_id.
+
+    The closure is computed in one recursive CTE into a temporary staging
+    table, then copied over the live table. Both steps run in the caller's
+    transaction and the caller commits, so the swap is atomic. On Postgres
+    the live table is emptied with TRUNCATE, whose ACCESS EXCLUSIVE lock
+    blocks readers of the closure from the swap until that commit.
+    Incremental writers are held off by the exclusive hierarchy lock for
+    the duration.
+
+    Raises BusinessTypeHierarchyError, before the live table is touched,
+    when parent_id contains a cycle.
+    """
+    await lock_hierarchy_exclusive(session)
+
+    started = perf_counter()
+    await session.execute(text(f"DROP TABLE IF EXISTS {STAGING_TABLE}"))
+    await session.execute(text(_BUILD_STAGING))
+    find_broken = text(_FIND_BROKEN).columns(descendant_id=Uuid)
+    broken = (await session.scalars(find_broken)).all()
+    if broken:
+        raise BusinessTypeHierarchyError(
+            "Hierarchy cycle detected",
+            context={"business_type_ids": sorted({str(i) for i in broken})},
+        )
+    closure_rows = await session.scalar(text(f"SELECT count(*) FROM {STAGING_TABLE}"))
+    built = perf_counter()
+
+    if session.get_bind().dialect.name == "postgresql":
+        await session.execute(text("TRUNCATE business_type_closure"))
+    else:
+        await session.execute(text("DELETE FROM business_type_closure"))
+    await session.execute(
+        text(
+            "INSERT INTO business_type_closure (ancestor_id, descendant_id, depth) "
+            f"SELECT ancestor_id, descendant_id, depth FROM {STAGING_TABLE}"
+        )
+    )
+    await session.execute(text(f"DROP TABLE {STAGING_TABLE}"))
+    swapped = perf_counter()
+
+    business_types = await session.scalar(text("SELECT count(*) FROM business_type"))
+
+    return ClosureRebuildReport(
+        business_types=business_types or 0,
+        closure_rows=closure_rows or 0,
+        build_seconds=built - started,
+        swap_seconds=swapped - built,
+    )
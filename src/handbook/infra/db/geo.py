@@ -0,0 +1,40 @@
+from sqlalchemy import ColumnElement, Double, case, cast, func
+
+from domain.val_objs.coords import EARTH_RADIUS_M, Coordinates
+from infra.db.models.facility import FacilityModel
+
+
+def _lat_lon() -> tuple[ColumnElement[float], ColumnElement[float]]:
+    return cast(FacilityModel.lat, Double), cast(FacilityModel.lon, Double)
+
+
+def within_radius(center: Coordinates, radius_meters: float) -> ColumnElement[bool]:
+    """Facilities whose great-circle distance to `center` is at most the radius."""
+    lat0 = float(center.lat)
+    lon0 = float(center.lon)
+    lat_col, lon_col = _lat_lon()
+
+    acos_arg = (
+        func.cos(func.radians(lat0))
+        * func.cos(func.radians(lat_col))
+        * func.cos(func.radians(lon_col) - func.radians(lon0))
+        + func.sin(func.radians(lat0)) * func.sin(func.radians(lat_col))
+    )
+
+    clamped = case(
+        (acos_arg < -1.0, -1.0),
+        (acos_arg > 1.0, 1.0),
+        else_=acos_arg,
+    )
+
+    return EARTH_RADIUS_M * func.acos(clamped) <= radius_meters
+
+
+def within_rectangle(p1: Coordinates, p2: Coordinates) -> ColumnElement[bool]:
+    """Facilities inside the box spanned by two opposite corners."""
+    lat_col, lon_col = _lat_lon()
+
+    return (
+        lat_col.between(float(min(p1.lat, p2.lat)), float(max(p1.lat, p2.lat)))
+        & lon_col.between(float(min(p1.lon, p2.lon)), float(max(p1.lon, p2.lon)))
+    )
@@ -0,0 +1,97 @@
+from typing import Collection
+from uuid import UUID
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from infra.db.models.business_type_closure import BusinessTypeClosureModel
+
+# Arbitrary constant shared by every writer of the business type hierarchy.
+BUSINESS_TYPE_HIERARCHY_LOCK = 0x6274_7265_6500
+
+
+def advisory_lock_key(value: UUID) -> int:
+    """Map a UUID onto the signed bigint space used by pg advisory locks."""
+    return int.from_bytes(value.bytes[:8], "big", signed=True)
+
+
+def supports_advisory_locks(session: AsyncSession) -> bool:
+    return session.get_bind().dialect.name == "postgresql"
+
+
+async def lock_hierarchy_shared(session: AsyncSession) -> None:
+    """
+    Taken by writers touching a single tree; lets them run concurrently
+    with each other but not with a full hierarchy rebuild.
+    """
+    if supports_advisory_locks(session):
+        await session.execute(
+            select(func.pg_advisory_xact_lock_shared(BUSINESS_TYPE_HIERARCHY_LOCK))
+        )
+
+
+async def lock_hierarchy_exclusive(session: AsyncSession) -> None:
+    """Taken by operations that rewrite the whole hierarchy."""
+    if supports_advisory_locks(session):
+        await session.execute(
+            select(func.pg_advisory_xact_lock(BUSINESS_TYPE_HIERARCHY_LOCK))
+        )
+
+
+async def lock_trees(session: AsyncSession, root_ids: set[UUID]) -> None:
+    """
+    Serialize writers of the given trees until the transaction ends.
+    Keys are taken in a fixed order so two writers never deadlock.
+    """
+    if not supports_advisory_locks(session):
+        return
+
+    await lock_hierarchy_shared(session)
+    for key in sorted(advisory_lock_key(root_id) for root_id in root_ids):
+        await session.execute(select(func.pg_advisory_xact_lock(key)))
+
+
+
+async def _root_of(session: AsyncSession, bt_id: UUID) -> UUID:
+    c = BusinessTypeClosureModel
+    stmt = (
+        select(c.ancestor_id)
+        .where(c.descendant_id == bt_id)
+        .order_by(c.depth.desc())
+        .limit(1)
+    )
+    root_id = await session.scalar(stmt)
+    return root_id if root_id is not None else bt_id
+
+
+async def lock_trees_of(session: AsyncSession, bt_ids: Collection[UUID]) -> None:
+    """
+    Lock the trees holding `bt_ids` until the transaction ends.
+
+    A concurrent move can change a node's root between reading it and
+    getting the lock, so roots are read again under the lock until
+    every tree they name is locked. Trees found late are locked out of
+    the usual order; the rare deadlock that allows is reported by the
+    database and fails one of the two writers.
+    """
+    if not bt_ids or not supports_advisory_locks(session):
+        return
+
+    locked: set[UUID] = set()
+    while True:
+        roots = {await _root_of(session, bt_id) for bt_id in bt_ids}
+        if roots <= locked:
+            return
+        await lock_trees(session, roots - locked)
+        locked |= roots
+
+async def lock_organization(session: AsyncSession, org_id: UUID) -> None:
+    """
+    Serialize writers of one organization until the transaction ends, so
+    the links each of them reads before updating the counts are current.
+    Works for organizations that have no row yet, unlike SELECT FOR UPDATE.
+    """
+    if supports_advisory_locks(session):
+        await session.execute(
+            select(func.pg_advisory_xact_lock(advisory_lock_key(org_id)))
+        )
@@ -3,3 +3,4 @@ from .phone import PhoneModel
 from .facility import FacilityModel
 from .business_type import BusinessTypeModel
 from .business_type_closure import BusinessTypeClosureModel
+from .business_type_org_count import BusinessTypeOrgCountModel
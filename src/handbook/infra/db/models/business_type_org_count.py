@@ -0,0 +1,26 @@
+import uuid
+
+from sqlalchemy import ForeignKey, Integer
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from infra.db.base import Base
+
+
+class BusinessTypeOrgCountModel(Base):
+    """
+    Organizations linked to a business type: `direct_count` to the type
+    itself, `total_count` to the type or any of its descendants, each
+    organization counted once.
+    """
+
+    __tablename__ = "business_type_org_count"
+
+    business_type_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("business_type.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+
+    direct_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    total_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
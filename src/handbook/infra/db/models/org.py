@@ -3,7 +3,7 @@ from __future__ import annotations
 import uuid
 from typing import List
 
-from sqlalchemy import ForeignKey, String
+from sqlalchemy import ForeignKey, Index, String
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -11,6 +11,10 @@ from infra.db.base import Base
 
 class OrganizationModel(Base):
     __tablename__ = "organization"
+    __table_args__ = (
+        Index("ix_organization_name", "name", "id"),
+        Index("ix_organization_facility", "facility_id", "name", "id"),
+    )
 
     id: Mapped[UUID] = mapped_column(
         UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
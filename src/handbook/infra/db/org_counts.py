@@ -0,0 +1,160 @@
+from __future__ import annotations
+
+from typing import Collection
+from uuid import UUID
+
+from sqlalchemy import delete, func, insert, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from infra.db.locks import lock_trees_of
+from infra.db.models.business_type import BusinessTypeModel
+from infra.db.models.business_type_closure import BusinessTypeClosureModel
+from infra.db.models.business_type_org_count import BusinessTypeOrgCountModel
+from infra.db.models.links import organization_business_type
+
+_links = organization_business_type.c
+
+
+def _direct_count(bt_id):
+    return (
+        select(func.count())
+        .select_from(organization_business_type)
+        .where(_links.business_type_id == bt_id)
+        .scalar_subquery()
+    )
+
+
+def _total_count(bt_id):
+    c = BusinessTypeClosureModel
+    return (
+        select(func.count(func.distinct(_links.organization_id)))
+        .select_from(organization_business_type)
+        .join(c, c.descendant_id == _links.business_type_id)
+        .where(c.ancestor_id == bt_id)
+        .scalar_subquery()
+    )
+
+
+async def add_count_row(session: AsyncSession, bt_id: UUID) -> None:
+    """Start counting a new business type; it has no links or children yet."""
+    await session.execute(
+        insert(BusinessTypeOrgCountModel).values(
+            business_type_id=bt_id, direct_count=0, total_count=0
+        )
+    )
+
+
+async def _ancestors_of(session: AsyncSession, bt_ids: Collection[UUID]) -> set[UUID]:
+    if not bt_ids:
+        return set()
+    c = BusinessTypeClosureModel
+    stmt = select(c.ancestor_id).where(c.descendant_id.in_(bt_ids)).distinct()
+    return set((await session.scalars(stmt)).all())
+
+
+async def _shift(
+    session: AsyncSession, column: str, bt_ids: Collection[UUID], delta: int
+) -> None:
+    if not bt_ids:
+        return
+    m = BusinessTypeOrgCountModel
+    await session.execute(
+        update(m)
+        .where(m.business_type_id.in_(bt_ids))
+        .values({column: getattr(m, column) + delta})
+        .execution_options(synchronize_session=False)
+    )
+
+
+async def _add_missing_rows(session: AsyncSession, bt_ids: set[UUID]) -> set[UUID]:
+    """
+    Insert count rows, computed from scratch, for the types in `bt_ids`
+    that have none (e.g. created through an organization's cascade rather
+    than the business type repository). Returns the types inserted.
+    """
+    if not bt_ids:
+        return set()
+    m, bt = BusinessTypeOrgCountModel, BusinessTypeModel
+    counted = await session.scalars(
+        select(m.business_type_id).where(m.business_type_id.in_(bt_ids))
+    )
+    missing = bt_ids - set(counted.all())
+    if not missing:
+        return set()
+
+    await session.execute(
+        insert(m).from_select(
+            ["business_type_id", "direct_count", "total_count"],
+            select(bt.id, _direct_count(bt.id), _total_count(bt.id)).where(
+                bt.id.in_(missing)
+            ),
+        )
+    )
+    return missing
+
+
+async def apply_link_changes(
+    session: AsyncSession, old_bt_ids: set[UUID], new_bt_ids: set[UUID]
+) -> None:
+    """
+    Update counts after one organization's business types changed from
+    `old_bt_ids` to `new_bt_ids`.
+
+    A type's total changes only when the organization enters or leaves
+    its subtree as a whole, so linking one organization to two types
+    under the same ancestor still counts it once there.
+    """
+    if old_bt_ids == new_bt_ids:
+        return
+
+    # a concurrent move recounts the totals of the trees it touches; with
+    # their locks held the ancestors read below cannot go stale first
+    await lock_trees_of(session, old_bt_ids | new_bt_ids)
+
+    old_scope = await _ancestors_of(session, old_bt_ids)
+    new_scope = await _ancestors_of(session, new_bt_ids)
+
+    # rows inserted here already reflect the flushed links; shifting
+    # them as well would count this organization twice
+    await session.flush()
+    fresh = await _add_missing_rows(
+        session, old_bt_ids | new_bt_ids | old_scope | new_scope
+    )
+
+    await _shift(session, "direct_count", new_bt_ids - old_bt_ids - fresh, 1)
+    await _shift(session, "direct_count", old_bt_ids - new_bt_ids - fresh, -1)
+    await _shift(session, "total_count", new_scope - old_scope - fresh, 1)
+    await _shift(session, "total_count", old_scope - new_scope - fresh, -1)
+
+
+async def recount_totals(session: AsyncSession, bt_ids: Collection[UUID]) -> None:
+    """
+    Recompute total_count for the given types from scratch. Used when the
+    hierarchy itself changes, which is rare and touches few ancestors.
+    """
+    if not bt_ids:
+        return
+    m = BusinessTypeOrgCountModel
+    await session.execute(
+        update(m)
+        .where(m.business_type_id.in_(bt_ids))
+        .values(total_count=_total_count(m.business_type_id))
+        .execution_options(synchronize_session=False)
+    )
+
+
+async def rebuild_org_counts(session: AsyncSession) -> int:
+    """
+    Regenerate business_type_org_count for every business type from the
+    links and the closure table. Returns the number of rows written;
+    the caller commits.
+    """
+    bt = BusinessTypeModel
+    await session.execute(delete(BusinessTypeOrgCountModel))
+    result = await session.execute(
+        insert(BusinessTypeOrgCountModel).from_select(
+            ["business_type_id", "direct_count", "total_count"],
+            select(bt.id, _direct_count(bt.id), _total_count(bt.id)),
+        )
+    )
+    return result.rowcount
@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+from typing import Callable, Generic, Iterable, TypeVar
+
+from infra.indexes.prefix_index import normalize_key
+
+T = TypeVar("T")
+
+
+def levenshtein(a: str, b: str) -> int:
+    """Edit distance with unit cost insertions, deletions and substitutions."""
+    if len(a) < len(b):
+        a, b = b, a
+    previous = list(range(len(b) + 1))
+    for i, ca in enumerate(a, 1):
+        current = [i]
+        for j, cb in enumerate(b, 1):
+            current.append(
+                min(
+                    previous[j] + 1,
+                    current[j - 1] + 1,
+                    previous[j - 1] + (ca != cb),
+                )
+            )
+        previous = current
+    return previous[-1]
+
+
+class _Node(Generic[T]):
+    __slots__ = ("key", "items", "children")
+
+    def __init__(self, key: str, item: T) -> None:
+        self.key = key
+        self.items = [item]
+        self.children: dict[int, _Node[T]] = {}
+
+
+class BKTree(Generic[T]):
+    """
+    Burkhard-Keller tree over normalized names.
+
+    Edit distance is a metric, so while searching within `k` of a query
+    that is `d` away from a node, only the children whose edge label is in
+    [d - k, d + k] can hold matches; the rest of the tree is skipped.
+    """
+
+    def __init__(self, key: Callable[[T], str]) -> None:
+        self._key = key
+        self._root: _Node[T] | None = None
+        self._size = 0
+
+    @classmethod
+    def build(cls, items: Iterable[T], key: Callable[[T], str]) -> BKTree[T]:
+        tree = cls(key)
+        for item in items:
+            tree.add(item)
+        return tree
+
+    def __len__(self) -> int:
+        return self._size
+
+    def add(self, item: T) -> None:
+        key = normalize_key(self._key(item))
+        self._size += 1
+        if self._root is None:
+            self._root = _Node(key, item)
+            return
+
+        node = self._root
+        while True:
+            distance = levenshtein(key, node.key)
+            if distance == 0:
+                node.items.append(item)
+                return
+            child = node.children.get(distance)
+            if child is None:
+                node.children[distance] = _Node(key, item)
+                return
+            node = child
+
+    def search(self, query: str, max_distance: int) -> list[tuple[int, T]]:
+        """Items within `max_distance` edits of `query`, closest first."""
+        if self._root is None:
+            return []
+
+        needle = normalize_key(query)
+        found: list[tuple[int, str, T]] = []
+        stack = [self._root]
+        while stack:
+            node = stack.pop()
+            distance = levenshtein(needle, node.key)
+            if distance <= max_distance:
+                found.extend((distance, node.key, item) for item in node.items)
+            low, high = distance - max_distance, distance + max_distance
+            stack.extend(
+                child for edge, child in node.children.items() if low <= edge <= high
+            )
+
+        found.sort(key=lambda match: match[:2])
+        return [(distance, item) for distance, _, item in found]
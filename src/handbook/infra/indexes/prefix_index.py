@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+from bisect import bisect_left, insort
+from typing import Callable, Generic, Hashable, Iterable, TypeVar
+
+T = TypeVar("T", bound=Hashable)
+
+
+def normalize_key(value: str) -> str:
+    """Case-insensitive form used for every name lookup."""
+    return value.strip().casefold()
+
+
+def _order(entry: tuple[str, int, object]) -> tuple[str, int]:
+    return entry[0], entry[1]
+
+
+class PrefixIndex(Generic[T]):
+    """
+    Items kept sorted by their normalized key.
+
+    Exact lookups go through a dict; prefix lookups bisect to the first
+    matching key and read forward, so a query costs O(log n + k).
+    Entries with the same key keep insertion order.
+    """
+
+    def __init__(self, key: Callable[[T], str]) -> None:
+        self._key = key
+        self._seq = 0
+        self._entries: list[tuple[str, int, T]] = []
+        self._exact: dict[str, T] = {}
+        self._positions: dict[T, tuple[str, int]] = {}
+
+    @classmethod
+    def build(cls, items: Iterable[T], key: Callable[[T], str]) -> PrefixIndex[T]:
+        index = cls(key)
+        for item in items:
+            normalized = normalize_key(key(item))
+            index._positions[item] = (normalized, index._seq)
+            index._entries.append((normalized, index._seq, item))
+            index._exact.setdefault(normalized, item)
+            index._seq += 1
+        index._entries.sort(key=_order)
+        return index
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    # ---------------------------------------------------------
+    # Lookups
+    # ---------------------------------------------------------
+
+    def get(self, name: str) -> T | None:
+        return self._exact.get(normalize_key(name))
+
+    def prefix(self, prefix: str, limit: int | None = None) -> list[T]:
+        needle = normalize_key(prefix)
+        result: list[T] = []
+        entries = self._entries
+        position = bisect_left(entries, (needle, -1), key=_order)
+        # walk by index: slicing would copy the whole tail of the list
+        for position in range(position, len(entries)):
+            key, _, item = entries[position]
+            if not key.startswith(needle):
+                break
+            if limit is not None and len(result) >= limit:
+                break
+            result.append(item)
+        return result
+
+    # ---------------------------------------------------------
+    # Maintenance
+    # ---------------------------------------------------------
+
+    def add(self, item: T) -> None:
+        """Insert `item`, replacing its previous entry if the key changed."""
+        if item in self._positions:
+            self.remove(item)
+
+        normalized = normalize_key(self._key(item))
+        self._positions[item] = (normalized, self._seq)
+        insort(self._entries, (normalized, self._seq, item), key=_order)
+        self._exact.setdefault(normalized, item)
+        self._seq += 1
+
+    def remove(self, item: T) -> None:
+        position = self._positions.pop(item, None)
+        if position is None:
+            return
+
+        index = bisect_left(self._entries, position, key=_order)
+        del self._entries[index]
+
+        normalized = position[0]
+        if self._exact.get(normalized) == item:
+            del self._exact[normalized]
+            # promote the next entry with the same key, if any
+            following = bisect_left(self._entries, (normalized, -1), key=_order)
+            if following < len(self._entries) and self._entries[following][0] == normalized:
+                self._exact[normalized] = self._entries[following][2]
@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+import heapq
+import re
+from typing import Callable, Generic, Hashable, Iterable, TypeVar
+
+from infra.indexes.prefix_index import normalize_key
+
+T = TypeVar("T")
+K = TypeVar("K", bound=Hashable)
+
+# pg_trgm splits on anything that is not a letter or digit
+_WORD = re.compile(r"[^\W_]+")
+
+
+def trigrams(text: str) -> frozenset[str]:
+    """
+    Trigrams of `text` the way pg_trgm extracts them: per word, case
+    folded, padded with two spaces in front and one behind.
+    """
+    grams: set[str] = set()
+    for word in _WORD.findall(normalize_key(text)):
+        padded = f"  {word} "
+        grams.update(padded[i : i + 3] for i in range(len(padded) - 2))
+    return frozenset(grams)
+
+
+def jaccard(a: frozenset[str], b: frozenset[str]) -> float:
+    if not a or not b:
+        return 0.0
+    shared = len(a & b)
+    return shared / (len(a) + len(b) - shared)
+
+
+def similarity(a: str, b: str) -> float:
+    """Same value as pg_trgm's similarity(a, b)."""
+    return jaccard(trigrams(a), trigrams(b))
+
+
+def most_similar(
+    query: str,
+    items: Iterable[T],
+    key: Callable[[T], str],
+    threshold: float,
+    limit: int,
+) -> list[T]:
+    """
+    Up to `limit` items whose key is at least `threshold` similar to
+    `query`, most similar first and then by key.
+    """
+    wanted = trigrams(query)
+    scored = []
+    for item in items:
+        name = key(item)
+        score = jaccard(wanted, trigrams(name))
+        if score >= threshold:
+            scored.append((score, name, item))
+
+    best = heapq.nsmallest(limit, scored, key=lambda entry: (-entry[0], entry[1]))
+    return [item for _, _, item in best]
+
+
+class TrigramIndex(Generic[K]):
+    """
+    Inverted index from the trigrams of lowercased texts to their keys,
+    for substring search.
+
+    A text containing the query contains every trigram of the query, so
+    intersecting those posting lists (smallest first) yields a candidate
+    set; only candidates are checked with `in`. Queries shorter than a
+    trigram have no postings and fall back to checking every text.
+    """
+
+    def __init__(self) -> None:
+        self._texts: dict[K, str] = {}
+        self._postings: dict[str, set[K]] = {}
+
+    def __len__(self) -> int:
+        return len(self._texts)
+
+    @staticmethod
+    def _grams(text: str) -> set[str]:
+        return {text[i : i + 3] for i in range(len(text) - 2)}
+
+    def add(self, key: K, text: str) -> None:
+        """Index `text` under `key`, replacing what the key had before."""
+        text = text.lower()
+        if self._texts.get(key) == text:
+            return
+        self.remove(key)
+
+        self._texts[key] = text
+        for gram in self._grams(text):
+            self._postings.setdefault(gram, set()).add(key)
+
+    def remove(self, key: K) -> None:
+        text = self._texts.pop(key, None)
+        if text is None:
+            return
+        for gram in self._grams(text):
+            posting = self._postings[gram]
+            posting.discard(key)
+            if not posting:
+                del self._postings[gram]
+
+    def search(self, query: str) -> list[K]:
+        """Keys whose text contains `query`, ignoring case, in no particular order."""
+        query = query.lower()
+        grams = self._grams(query)
+        if not grams:
+            return [k for k, text in self._texts.items() if query in text]
+
+        postings = []
+        for gram in grams:
+            posting = self._postings.get(gram)
+            if not posting:
+                return []
+            postings.append(posting)
+        postings.sort(key=len)
+
+        candidates = set(postings[0])
+        for posting in postings[1:]:
+            candidates &= posting
+            if not candidates:
+                return []
+        return [k for k in candidates if query in self._texts[k]]
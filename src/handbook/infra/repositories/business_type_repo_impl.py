@@ -1,123 +1,328 @@
 from __future__ import annotations
 
+from typing import Sequence
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import delete, insert, literal, select, true
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload, raiseload
+from sqlalchemy.orm import aliased
 
 from domain.entities.business_type import BusinessType
 from domain.exceptions.base import DomainResourceNotFoundError
+from domain.exceptions.business_type_err import BusinessTypeHierarchyError
 from domain.repositories.business_type_repository import BusinessTypeRepository
 from domain.val_objs.business_name import BusinessName
 from domain.val_objs.ids import BusinessTypeId
 
+from infra.cache.business_type_tree import (
+    BusinessTypeTreeCache,
+    BusinessTypeTreeSnapshot,
+    bt_tree_cache,
+)
+from infra.db.locks import lock_trees_of
 from infra.db.models.business_type import BusinessTypeModel
+from infra.db.models.business_type_closure import BusinessTypeClosureModel
+from infra.db.org_counts import add_count_row, recount_totals
 from infra.repositories.mappers.business_type_mapper import BusinessTypeMapper
 
 
 class BusinessTypeRepositoryImpl(BusinessTypeRepository):
-    def __init__(self, session: AsyncSession):
+    def __init__(
+        self,
+        session: AsyncSession,
+        tree_cache: BusinessTypeTreeCache = bt_tree_cache,
+    ):
         self._session = session
+        self._tree_cache = tree_cache
 
     # ---------------------------------------------------------
     # Helpers
     # ---------------------------------------------------------
 
-    async def _load_all_models(self) -> list[BusinessTypeModel]:
-        stmt = (
-            select(BusinessTypeModel)
-            .options(
-                selectinload(BusinessTypeModel.children),
-                selectinload(BusinessTypeModel.parent),
-                raiseload("*"),
-            )
-        )
-        result = await self._session.execute(stmt)
-        return result.scalars().all()
-
-    def _hydrate_tree(
-        self, models: list[BusinessTypeModel]
-    ) -> dict[UUID, BusinessType]:
-        cache = {m.id: BusinessTypeMapper.to_domain(m) for m in models}
-        for m in models:
-            BusinessTypeMapper.attach_relations(cache[m.id], m, cache)
-        return cache
+    async def _snapshot(self) -> BusinessTypeTreeSnapshot:
+        return await self._tree_cache.get(self._session)
 
     # ---------------------------------------------------------
     # Queries
     # ---------------------------------------------------------
 
     async def get_by_id(self, id: BusinessTypeId) -> BusinessType:
-        models = await self._load_all_models()
-        cache = self._hydrate_tree(models)
+        snapshot = await self._snapshot()
 
-        if id.value not in cache:
+        bt = snapshot.by_id.get(id.value)
+        if bt is None:
             raise DomainResourceNotFoundError(
                 "BusinessType not found",
                 context={"business_type_id": str(id.value)},
             )
 
-        return cache[id.value]
+        return bt
+
+    async def list_by_ids(self, ids: Sequence[BusinessTypeId]) -> list[BusinessType]:
+        snapshot = await self._snapshot()
+        keys = dict.fromkeys(i.value for i in ids)
+        return [snapshot.by_id[key] for key in keys if key in snapshot.by_id]
 
     async def get_by_name(self, name: BusinessName) -> BusinessType:
-        models = await self._load_all_models()
-        cache = self._hydrate_tree(models)
+        snapshot = await self._snapshot()
+
+        bt = snapshot.names.get(name.value)
+        if bt is None:
+            raise DomainResourceNotFoundError(
+                "BusinessType not found",
+                context={"business_type_name": name.value},
+            )
 
-        for bt in cache.values():
-            if bt.name.value == name.value:
-                return bt
+        return bt
 
-        raise DomainResourceNotFoundError(
-            "BusinessType not found",
-            context={"business_type_name": name.value},
-        )
+    async def list_by_name_prefix(
+        self, prefix: str, limit: int
+    ) -> list[BusinessType]:
+        snapshot = await self._snapshot()
+        return snapshot.names.prefix(prefix, limit)
+
+    async def search_by_name(
+        self, query: str, max_distance: int, limit: int
+    ) -> list[BusinessType]:
+        snapshot = await self._snapshot()
+        matches = snapshot.fuzzy_names().search(query, max_distance)
+        return [bt for _, bt in matches[:limit]]
+
+    async def data_version(self) -> int:
+        snapshot = await self._snapshot()
+        return snapshot.version
 
     async def list_all(self) -> list[BusinessType]:
-        models = await self._load_all_models()
-        cache = self._hydrate_tree(models)
-        return list(cache.values())
+        snapshot = await self._snapshot()
+        return list(snapshot.by_id.values())
 
     async def list_children(self, parent: BusinessType) -> list[BusinessType]:
-        models = await self._load_all_models()
-        cache = self._hydrate_tree(models)
+        snapshot = await self._snapshot()
+
+        node = snapshot.by_id.get(parent.id.value)
+        return list(node.children) if node else []
+
+    async def list_roots(self) -> list[BusinessType]:
+        snapshot = await self._snapshot()
+        return list(snapshot.roots)
+
+    async def list_descendants(self, root: BusinessType) -> list[BusinessType]:
+        stmt = (
+            select(BusinessTypeClosureModel.descendant_id)
+            .where(BusinessTypeClosureModel.ancestor_id == root.id.value)
+            .where(BusinessTypeClosureModel.depth > 0)
+            .order_by(BusinessTypeClosureModel.depth)
+        )
+        result = await self._session.execute(stmt)
+        snapshot = await self._snapshot()
 
         return [
-            bt for bt in cache.values()
-            if bt.parent and bt.parent.id.value == parent.id.value
+            snapshot.by_id[bt_id]
+            for bt_id in result.scalars().all()
+            if bt_id in snapshot.by_id
         ]
 
-    async def list_roots(self) -> list[BusinessType]:
-        models = await self._load_all_models()
-        cache = self._hydrate_tree(models)
+    async def list_paths(
+        self, ids: Sequence[BusinessTypeId]
+    ) -> dict[BusinessTypeId, list[BusinessType]]:
+        if not ids:
+            return {}
 
-        return [bt for bt in cache.values() if bt.parent is None]
+        c = BusinessTypeClosureModel
+        stmt = (
+            select(c.descendant_id, c.ancestor_id)
+            .where(c.descendant_id.in_({id_.value for id_ in ids}))
+            .order_by(c.descendant_id, c.depth.desc())
+        )
+        result = await self._session.execute(stmt)
+        snapshot = await self._snapshot()
 
-    async def list_descendants(self, root: BusinessType) -> list[BusinessType]:
-        models = await self._load_all_models()
-        cache = self._hydrate_tree(models)
+        paths: dict[BusinessTypeId, list[BusinessType]] = {}
+        for descendant_id, ancestor_id in result.all():
+            if descendant_id not in snapshot.by_id or ancestor_id not in snapshot.by_id:
+                continue
+            paths.setdefault(BusinessTypeId(descendant_id), []).append(
+                snapshot.by_id[ancestor_id]
+            )
+        return paths
+
+    async def get_subtree(
+        self, id: BusinessTypeId, max_depth: int | None = None
+    ) -> BusinessType:
+        c = BusinessTypeClosureModel
+        stmt = (
+            select(
+                BusinessTypeModel.id,
+                BusinessTypeModel.name,
+                BusinessTypeModel.parent_id,
+            )
+            .join(c, c.descendant_id == BusinessTypeModel.id)
+            .where(c.ancestor_id == id.value)
+            .order_by(c.depth, BusinessTypeModel.name)
+        )
+        if max_depth is not None:
+            stmt = stmt.where(c.depth <= max_depth)
+
+        result = await self._session.execute(stmt)
+        nodes = BusinessTypeMapper.to_domain_tree(result.all())
+
+        root = nodes.get(id.value)
+        if root is None:
+            raise DomainResourceNotFoundError(
+                "BusinessType not found",
+                context={"business_type_id": str(id.value)},
+            )
+        # its parent is not among the rows, so the copy comes back as a root
+        return root
+
+    # ---------------------------------------------------------
+    # Closure table
+    # ---------------------------------------------------------
+
+    async def _strict_ancestors(self, bt_id: UUID) -> set[UUID]:
+        c = BusinessTypeClosureModel
+        stmt = select(c.ancestor_id).where(c.descendant_id == bt_id, c.depth > 0)
+        return set((await self._session.scalars(stmt)).all())
+
+    async def _has_closure(self, bt_id: UUID) -> bool:
+        stmt = select(BusinessTypeClosureModel.depth).where(
+            BusinessTypeClosureModel.ancestor_id == bt_id,
+            BusinessTypeClosureModel.descendant_id == bt_id,
+        )
+        return await self._session.scalar(stmt) is not None
 
-        result = []
-        stack = [root.id.value]
+    async def _insert_closure(self, bt: BusinessType) -> None:
+        """
+        Add the self row of a new node plus one row per ancestor,
+        copied from the parent's own closure rows.
+        """
+        c = BusinessTypeClosureModel
+        node_id = literal(bt.id.value, type_=c.descendant_id.type)
 
-        while stack:
-            current = stack.pop()
-            for bt in cache.values():
-                if bt.parent and bt.parent.id.value == current:
-                    result.append(bt)
-                    stack.append(bt.id.value)
+        rows = select(node_id, node_id, literal(0))
+        if bt.parent is not None:
+            rows = rows.union_all(
+                select(c.ancestor_id, node_id, c.depth + 1).where(
+                    c.descendant_id == bt.parent.id.value
+                )
+            )
+
+        await self._session.execute(
+            insert(c).from_select(["ancestor_id", "descendant_id", "depth"], rows)
+        )
 
-        return result
+    async def _move_closure(self, node_id: UUID, new_parent_id: UUID | None) -> None:
+        """
+        Re-hang the subtree of `node_id` under `new_parent_id`:
+        drop the rows linking the old ancestors to the subtree, then add
+        the cross product of the new ancestors and the subtree.
+        """
+        c = BusinessTypeClosureModel
+
+        subtree = select(c.descendant_id).where(c.ancestor_id == node_id)
+        old_ancestors = select(c.ancestor_id).where(
+            c.descendant_id == node_id, c.ancestor_id != node_id
+        )
+        await self._session.execute(
+            delete(c)
+            .where(c.descendant_id.in_(subtree), c.ancestor_id.in_(old_ancestors))
+            .execution_options(synchronize_session=False)
+        )
+
+        if new_parent_id is None:
+            return
+
+        above = aliased(c)
+        below = aliased(c)
+        rows = (
+            select(
+                above.ancestor_id,
+                below.descendant_id,
+                above.depth + below.depth + 1,
+            )
+            .select_from(above)
+            .join(below, true())
+            .where(above.descendant_id == new_parent_id)
+            .where(below.ancestor_id == node_id)
+        )
+        await self._session.execute(
+            insert(c).from_select(["ancestor_id", "descendant_id", "depth"], rows)
+        )
+
+    async def _ensure_not_below(self, node_id: UUID, new_parent_id: UUID) -> None:
+        c = BusinessTypeClosureModel
+        stmt = select(c.depth).where(
+            c.ancestor_id == node_id, c.descendant_id == new_parent_id
+        )
+        if await self._session.scalar(stmt) is not None:
+            raise BusinessTypeHierarchyError(
+                "Hierarchy cycle detected",
+                context={
+                    "business_type_id": str(node_id),
+                    "parent_id": str(new_parent_id),
+                },
+            )
 
     # ---------------------------------------------------------
     # Persistence
     # ---------------------------------------------------------
 
     async def save(self, bt: BusinessType) -> None:
+        node_id = bt.id.value
+        new_parent_id = bt.parent.id.value if bt.parent else None
+
+        nodes = {node_id}
+        if new_parent_id is not None:
+            nodes.add(new_parent_id)
+        await lock_trees_of(self._session, nodes)
+
+        stored = (
+            await self._session.execute(
+                select(BusinessTypeModel.parent_id).where(
+                    BusinessTypeModel.id == node_id
+                )
+            )
+        ).first()
+
+        moved_from: set[UUID] = set()
+        if stored is not None and stored.parent_id != new_parent_id:
+            if new_parent_id is not None:
+                await self._ensure_not_below(node_id, new_parent_id)
+            moved_from = await self._strict_ancestors(node_id)
+            await self._move_closure(node_id, new_parent_id)
+
         model = BusinessTypeMapper.to_model(bt)
         await self._session.merge(model)
+        await self._session.flush()
+
+        if stored is None or not await self._has_closure(node_id):
+            await self._insert_closure(bt)
+        if stored is None:
+            await add_count_row(self._session, node_id)
+        elif stored.parent_id != new_parent_id:
+            moved_to = await self._strict_ancestors(node_id)
+            await recount_totals(self._session, moved_from | moved_to)
+
+        self._tree_cache.track(self._session)
 
     async def delete(self, bt: BusinessType) -> None:
         db_model = await self._session.get(BusinessTypeModel, bt.id.value)
-        if db_model is not None:
-            await self._session.delete(db_model)
+        if db_model is None:
+            return
+
+        await lock_trees_of(self._session, {bt.id.value})
+        ancestors = await self._strict_ancestors(bt.id.value)
+
+        c = BusinessTypeClosureModel
+        subtree = select(c.descendant_id).where(c.ancestor_id == bt.id.value)
+        await self._session.execute(
+            delete(c)
+            .where(c.descendant_id.in_(subtree))
+            .execution_options(synchronize_session=False)
+        )
+
+        await self._session.delete(db_model)
+        await self._session.flush()
+        await recount_totals(self._session, ancestors)
+
+        self._tree_cache.track(self._session)
@@ -1,13 +1,15 @@
-from sqlalchemy import Double, cast, func, select
+from typing import Sequence
+
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import raiseload, selectinload
-from sqlalchemy import case
+from sqlalchemy.orm import raiseload
 
 from domain.entities.facility import Facility
 from domain.exceptions.base import DomainResourceNotFoundError
 from domain.repositories.facility_repository import FacilityRepository
 from domain.val_objs.coords import Coordinates
 from domain.val_objs.ids import FacilityId
+from infra.db.geo import within_radius, within_rectangle
 from infra.db.models.facility import FacilityModel
 from infra.repositories.mappers.facility_mapper import FacilityMapper
 
@@ -24,10 +26,7 @@ class FacilityRepositoryImpl(FacilityRepository):
         stmt = (
             select(FacilityModel)
             .where(FacilityModel.id == id.value)
-            .options(
-                selectinload(FacilityModel.organizations),
-                raiseload("*"),
-            )
+            .options(raiseload("*"))
         )
 
         result = await self._session.execute(stmt)
@@ -41,13 +40,23 @@ class FacilityRepositoryImpl(FacilityRepository):
 
         return FacilityMapper.to_domain(model)
 
+    async def list_by_ids(self, ids: Sequence[FacilityId]) -> list[Facility]:
+        facility_ids = {i.value for i in ids}
+        if not facility_ids:
+            return []
+
+        stmt = (
+            select(FacilityModel)
+            .where(FacilityModel.id.in_(facility_ids))
+            .options(raiseload("*"))
+        )
+        result = await self._session.execute(stmt)
+        return [FacilityMapper.to_domain(m) for m in result.scalars().all()]
+
     async def list_all(self):
         stmt = (
             select(FacilityModel)
-            .options(
-                selectinload(FacilityModel.organizations),
-                raiseload("*"),
-            )
+            .options(raiseload("*"))
         )
         result = await self._session.execute(stmt)
         return [FacilityMapper.to_domain(m) for m in result.scalars().all()]
@@ -66,62 +75,20 @@ class FacilityRepositoryImpl(FacilityRepository):
     # ---------------------------------------------------------
 
     async def list_in_radius(self, center: Coordinates, radius_meters: float):
-        EARTH_RADIUS_M = 6371000
-
-        lat0 = float(center.lat)
-        lon0 = float(center.lon)
-
-        lat_col = cast(FacilityModel.lat, Double)
-        lon_col = cast(FacilityModel.lon, Double)
-
-
-
-        acos_arg = (
-            func.cos(func.radians(lat0))
-            * func.cos(func.radians(lat_col))
-            * func.cos(func.radians(lon_col) - func.radians(lon0))
-            + func.sin(func.radians(lat0)) * func.sin(func.radians(lat_col))
-        )
-
-        clamped = case(
-            (acos_arg < -1.0, -1.0),
-            (acos_arg > 1.0, 1.0),
-            else_=acos_arg,
-        )
-
-        distance_expr = EARTH_RADIUS_M * func.acos(clamped)
-
         stmt = (
             select(FacilityModel)
-            .where(distance_expr <= radius_meters)
-            .options(
-                selectinload(FacilityModel.organizations),
-                raiseload("*"),
-            )
+            .where(within_radius(center, radius_meters))
+            .options(raiseload("*"))
         )
 
         result = await self._session.execute(stmt)
         return [FacilityMapper.to_domain(m) for m in result.scalars().all()]
 
     async def list_in_rectangle(self, p1: Coordinates, p2: Coordinates):
-        min_lat = float(min(p1.lat, p2.lat))
-        max_lat = float(max(p1.lat, p2.lat))
-        min_lon = float(min(p1.lon, p2.lon))
-        max_lon = float(max(p1.lon, p2.lon))
-
-        lat_col = cast(FacilityModel.lat, Double)
-        lon_col = cast(FacilityModel.lon, Double)
-
         stmt = (
             select(FacilityModel)
-            .where(lat_col >= min_lat)
-            .where(lat_col <= max_lat)
-            .where(lon_col >= min_lon)
-            .where(lon_col <= max_lon)
-            .options(
-                selectinload(FacilityModel.organizations),
-                raiseload("*"),
-            )
+            .where(within_rectangle(p1, p2))
+            .options(raiseload("*"))
         )
 
         result = await self._session.execute(stmt)
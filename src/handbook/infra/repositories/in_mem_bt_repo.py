@@ -1,6 +1,7 @@
 
 from __future__ import annotations
 
+from itertools import count
 from typing import Sequence
 from uuid import UUID
 
@@ -12,12 +13,20 @@ from domain.services.business_type_class_service import (
 )
 from domain.val_objs.business_name import BusinessName
 from domain.val_objs.ids import BusinessTypeId
+from infra.indexes.bk_tree import BKTree
+from infra.indexes.prefix_index import PrefixIndex
+
+# Shared across instances so versions from different repositories never collide.
+_versions = count(1)
 
 
 class InMemoryBusinessTypeRepository(BusinessTypeRepository):
     def __init__(self):
         # Store by raw UUID for type safety and simplicity
         self._items: dict[UUID, BusinessType] = {}
+        self._names: PrefixIndex[BusinessType] = PrefixIndex(key=lambda bt: bt.name.value)
+        self._version = next(_versions)
+        self._fuzzy: tuple[int, BKTree[BusinessType]] | None = None
 
     # ---------------------------------------------------------
     # CRUD
@@ -30,20 +39,46 @@ class InMemoryBusinessTypeRepository(BusinessTypeRepository):
         except KeyError:
             raise DomainResourceNotFoundError(f"BusinessType {id} not found")
 
+    async def list_by_ids(self, ids: Sequence[BusinessTypeId]) -> Sequence[BusinessType]:
+        keys = dict.fromkeys(i.value for i in ids)
+        return [self._items[key] for key in keys if key in self._items]
+
     async def get_by_name(self, name: BusinessName) -> BusinessType:
-        for bt in self._items.values():
-            if bt.name == name:
-                return bt
-        raise DomainResourceNotFoundError(f"BusinessType '{name.value}' not found")
+        bt = self._names.get(name.value)
+        if bt is None:
+            raise DomainResourceNotFoundError(f"BusinessType '{name.value}' not found")
+        return bt
+
+    async def list_by_name_prefix(
+        self, prefix: str, limit: int
+    ) -> Sequence[BusinessType]:
+        return self._names.prefix(prefix, limit)
+
+    async def search_by_name(
+        self, query: str, max_distance: int, limit: int
+    ) -> Sequence[BusinessType]:
+        if self._fuzzy is None or self._fuzzy[0] != self._version:
+            tree = BKTree.build(self._items.values(), key=lambda bt: bt.name.value)
+            self._fuzzy = (self._version, tree)
+
+        matches = self._fuzzy[1].search(query, max_distance)
+        return [bt for _, bt in matches[:limit]]
 
     async def list_all(self) -> Sequence[BusinessType]:
         return list(self._items.values())
 
     async def save(self, bt: BusinessType) -> None:
         self._items[bt.id.value] = bt
+        self._names.add(bt)
+        self._version = next(_versions)
 
     async def delete(self, bt: BusinessType) -> None:
         self._items.pop(bt.id.value, None)
+        self._names.remove(bt)
+        self._version = next(_versions)
+
+    async def data_version(self) -> int:
+        return self._version
 
     # ---------------------------------------------------------
     # Hierarchy-specific queries
@@ -56,4 +91,32 @@ class InMemoryBusinessTypeRepository(BusinessTypeRepository):
         return [bt for bt in self._items.values() if bt.parent is None]
 
     async def list_descendants(self, root: BusinessType) -> Sequence[BusinessType]:
-        return BusinessTypeClassificationService.get_all_descendants(root)
+        return list(BusinessTypeClassificationService.get_all_descendants(root))
+
+    async def list_paths(
+        self, ids: Sequence[BusinessTypeId]
+    ) -> dict[BusinessTypeId, list[BusinessType]]:
+        paths: dict[BusinessTypeId, list[BusinessType]] = {}
+        for id_ in ids:
+            bt = self._items.get(id_.value)
+            if bt is None:
+                continue
+            path = [bt]
+            while path[-1].parent is not None:
+                path.append(path[-1].parent)
+            paths[id_] = path[::-1]
+        return paths
+
+    async def get_subtree(
+        self, id: BusinessTypeId, max_depth: int | None = None
+    ) -> BusinessType:
+        root = await self.get_by_id(id)
+
+        records = [(root.id, root.name, None)]
+        level, depth = list(root.children), 1
+        while level and (max_depth is None or depth <= max_depth):
+            records.extend((bt.id, bt.name, bt.parent.id) for bt in level)
+            level = [child for bt in level for child in bt.children]
+            depth += 1
+
+        return BusinessType.reconstitute(records)[root.id]
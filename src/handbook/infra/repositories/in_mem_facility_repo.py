@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-from math import radians, sin, cos, sqrt, atan2
 from typing import Sequence
 from uuid import UUID
 
@@ -28,6 +27,10 @@ class InMemoryFacilityRepository(FacilityRepository):
         except KeyError:
             raise DomainResourceNotFoundError(f"Facility {id} not found")
 
+    async def list_by_ids(self, ids: Sequence[FacilityId]) -> Sequence[Facility]:
+        keys = dict.fromkeys(i.value for i in ids)
+        return [self._items[key] for key in keys if key in self._items]
+
     async def list_all(self) -> Sequence[Facility]:
         return list(self._items.values())
 
@@ -46,28 +49,10 @@ class InMemoryFacilityRepository(FacilityRepository):
         center: Coordinates,
         radius_meters: float,
     ) -> Sequence[Facility]:
-
-        def haversine(c1: Coordinates, c2: Coordinates) -> float:
-            R = 6371000  # meters
-
-            lat1, lon1 = radians(float(c1.lat)), radians(float(c1.lon))
-            lat2, lon2 = radians(float(c2.lat)), radians(float(c2.lon))
-
-            dlat = lat2 - lat1
-            dlon = lon2 - lon1
-
-            a = (
-                sin(dlat / 2) ** 2
-                + cos(lat1) * cos(lat2) * sin(dlon / 2) ** 2
-            )
-            c = 2 * atan2(sqrt(a), sqrt(1 - a))
-
-            return R * c
-
         return [
             f
             for f in self._items.values()
-            if haversine(center, f.coordinates) <= radius_meters
+            if center.distance_to(f.coordinates) <= radius_meters
         ]
 
     async def list_in_rectangle(
@@ -75,17 +60,4 @@ class InMemoryFacilityRepository(FacilityRepository):
         p1: Coordinates,
         p2: Coordinates,
     ) -> Sequence[Facility]:
-
-        min_lat = min(p1.lat, p2.lat)
-        max_lat = max(p1.lat, p2.lat)
-        min_lon = min(p1.lon, p2.lon)
-        max_lon = max(p1.lon, p2.lon)
-
-        return [
-            f
-            for f in self._items.values()
-            if (
-                min_lat <= f.coordinates.lat <= max_lat
-                and min_lon <= f.coordinates.lon <= max_lon
-            )
-        ]
+        return [f for f in self._items.values() if f.coordinates.in_rectangle(p1, p2)]
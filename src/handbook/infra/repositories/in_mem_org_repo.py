@@ -1,21 +1,118 @@
 from __future__ import annotations
 
-from typing import Sequence
+import heapq
+from collections import Counter
+from typing import AsyncIterator, Iterable, Sequence
 from domain.entities.organization import Organization
 from domain.entities.facility import Facility
 from domain.entities.business_type import BusinessType
-from domain.val_objs.ids import OrganizationId
+from domain.val_objs.coords import Coordinates
+from domain.val_objs.ids import BusinessTypeId, FacilityId, OrganizationId
+from domain.val_objs.org_count import OrganizationCount
+from domain.val_objs.org_projection import OrganizationProjection, OrganizationView
+from domain.val_objs.org_summary import OrganizationSummary
+from domain.val_objs.page import PageRequest, sort_key
 from domain.exceptions.base import DomainResourceNotFoundError
 
 from domain.repositories.organization_repository import OrganizationRepository
 from domain.services.business_type_class_service import (
     BusinessTypeClassificationService,
 )
+from infra.indexes.prefix_index import PrefixIndex
+from infra.indexes.trigram import TrigramIndex, most_similar
 
 
 class InMemoryOrganizationRepository(OrganizationRepository):
+    """
+    Business type filters run on bitmasks: every business type seen on a
+    saved organization gets a dense bit position, and every organization
+    keeps the OR of its types' bits. A filter is then one AND per
+    organization against the query mask.
+
+    `_masks` is keyed and ordered exactly like `_items`, so both can be
+    walked in lockstep.
+
+    `_by_facility` maps each facility to the IDs of its organizations
+    (a dict used as an insertion-ordered set), so facility lookups never
+    scan `_items`.
+
+    `_names` is a trigram inverted index over organization names; name
+    search only checks the organizations that contain every trigram of
+    the query. `_prefixes` keeps organizations sorted by case-folded
+    name, so name prefix suggestions are a bisect and a short walk.
+    """
+
     def __init__(self):
         self._items: dict[OrganizationId, Organization] = {}
+        self._masks: dict[OrganizationId, int] = {}
+        self._bits: dict[BusinessType, int] = {}
+        self._by_facility: dict[FacilityId, dict[OrganizationId, None]] = {}
+        self._facility_of: dict[OrganizationId, FacilityId] = {}
+        self._names: TrigramIndex[OrganizationId] = TrigramIndex()
+        self._prefixes: PrefixIndex[Organization] = PrefixIndex(key=_name_of)
+
+    # ---------------------------------------------------------
+    # Bitmasks
+    # ---------------------------------------------------------
+
+    def _bit(self, bt: BusinessType) -> int:
+        bit = self._bits.get(bt)
+        if bit is None:
+            bit = 1 << len(self._bits)
+            self._bits[bt] = bit
+        return bit
+
+    def _mask_of(self, types: Iterable[BusinessType]) -> int:
+        """Query mask; types no organization was saved with add nothing."""
+        mask = 0
+        for bt in types:
+            mask |= self._bits.get(bt, 0)
+        return mask
+
+    def _matching(self, mask: int) -> list[Organization]:
+        if not mask:
+            return []
+        return [
+            org
+            for org, org_mask in zip(self._items.values(), self._masks.values())
+            if org_mask & mask
+        ]
+
+    # ---------------------------------------------------------
+    # Paging
+    # ---------------------------------------------------------
+
+    @staticmethod
+    def _paged(
+        orgs: Iterable[Organization], page: PageRequest | None
+    ) -> list[Organization]:
+        """Same (name, id) keyset contract as the SQL repository."""
+        if page is None:
+            return sorted(orgs, key=sort_key)
+
+        if page.after is not None:
+            after = (page.after.name, page.after.id)
+            orgs = (org for org in orgs if sort_key(org) > after)
+        return heapq.nsmallest(page.limit, orgs, key=sort_key)
+
+    # ---------------------------------------------------------
+    # Facility index
+    # ---------------------------------------------------------
+
+    def _index_facility(self, organization: Organization) -> None:
+        self._unindex_facility(organization.id)
+        facility_id = organization.facility.id
+        self._by_facility.setdefault(facility_id, {})[organization.id] = None
+        self._facility_of[organization.id] = facility_id
+
+    def _unindex_facility(self, org_id: OrganizationId) -> None:
+        facility_id = self._facility_of.pop(org_id, None)
+        if facility_id is None:
+            return
+        members = self._by_facility[facility_id]
+        members.pop(org_id, None)
+        if not members:
+            del self._by_facility[facility_id]
 
     # ---------------------------------------------------------
     # CRUD
@@ -27,42 +124,279 @@ class InMemoryOrganizationRepository(OrganizationRepository):
         except KeyError:
             raise DomainResourceNotFoundError(f"Organization {id} not found")
 
+    async def list_by_ids(
+        self, ids: Sequence[OrganizationId]
+    ) -> Sequence[Organization]:
+        return [self._items[i] for i in dict.fromkeys(ids) if i in self._items]
+
     async def save(self, organization: Organization) -> None:
+        mask = 0
+        for bt in organization.business_types:
+            mask |= self._bit(bt)
+
         self._items[organization.id] = organization
+        self._masks[organization.id] = mask
+        self._index_facility(organization)
+        self._names.add(organization.id, organization.name.value)
+        self._prefixes.add(organization)
 
     async def delete(self, organization: Organization) -> None:
         self._items.pop(organization.id, None)
+        self._masks.pop(organization.id, None)
+        self._unindex_facility(organization.id)
+        self._names.remove(organization.id)
+        self._prefixes.remove(organization)
 
     # ---------------------------------------------------------
     # Domain-specific queries
     # ---------------------------------------------------------
 
-    async def list_by_facility(self, facility: Facility) -> Sequence[Organization]:
-        return [org for org in self._items.values() if org.facility == facility]
+    async def list_by_facility(
+        self, facility: Facility, page: PageRequest | None = None
+    ) -> Sequence[Organization]:
+        return self._paged(await self.list_by_facilities([facility.id]), page)
+
+    async def list_by_facilities(
+        self, ids: Sequence[FacilityId]
+    ) -> Sequence[Organization]:
+        return [
+            self._items[org_id]
+            for facility_id in dict.fromkeys(ids)
+            for org_id in self._by_facility.get(facility_id, ())
+        ]
+
+    async def list_in_radius(
+        self,
+        center: Coordinates,
+        radius_meters: float,
+        page: PageRequest | None = None,
+    ) -> Sequence[Organization]:
+        return self._paged(
+            (
+                org
+                for org in self._items.values()
+                if center.distance_to(org.facility.coordinates) <= radius_meters
+            ),
+            page,
+        )
+
+    async def list_in_rectangle(
+        self,
+        p1: Coordinates,
+        p2: Coordinates,
+        page: PageRequest | None = None,
+    ) -> Sequence[Organization]:
+        return self._paged(
+            (
+                org
+                for org in self._items.values()
+                if org.facility.coordinates.in_rectangle(p1, p2)
+            ),
+            page,
+        )
 
     async def list_by_business_type(self, bt: BusinessType) -> Sequence[Organization]:
-        return [org for org in self._items.values() if bt in org.business_types]
+        return self._matching(self._mask_of([bt]))
 
-    async def list_by_business_type_recursive(self, bt: BusinessType):
+    async def list_by_business_type_recursive(
+        self, bt: BusinessType, page: PageRequest | None = None
+    ) -> Sequence[Organization]:
         descendants = BusinessTypeClassificationService.get_all_descendants(bt)
-        all_types = {bt, *descendants}
-
-        return [
-            org
-            for org in self._items.values()
-            if any(t in all_types for t in org.business_types)
-        ]
+        mask = self._mask_of([bt]) | self._mask_of(descendants)
+        return self._paged(self._matching(mask), page)
 
     async def list_by_any_business_type(
         self, types: Sequence[BusinessType]
     ) -> Sequence[Organization]:
-        type_set = set(types)
+        return self._matching(self._mask_of(types))
+
+    async def search_by_name(
+        self, query: str, page: PageRequest | None = None
+    ) -> Sequence[Organization]:
+        matches = self._names.search(query)
+        return self._paged((self._items[org_id] for org_id in matches), page)
+
+    async def search_by_similarity(
+        self, query: str, threshold: float, limit: int
+    ) -> Sequence[Organization]:
+        return most_similar(query, self._items.values(), _name_of, threshold, limit)
+
+    async def list_names_by_prefix(
+        self, prefix: str, limit: int
+    ) -> Sequence[OrganizationSummary]:
         return [
-            org
-            for org in self._items.values()
-            if any(t in type_set for t in org.business_types)
+            OrganizationSummary.of(org) for org in self._prefixes.prefix(prefix, limit)
         ]
 
-    async def search_by_name(self, query: str) -> Sequence[Organization]:
-        q = query.lower()
-        return [org for org in self._items.values() if q in org.name.value.lower()]
+    # ---------------------------------------------------------
+    # Projections
+    # ---------------------------------------------------------
+
+    async def view_by_ids(
+        self, ids: Sequence[OrganizationId], projection: OrganizationProjection
+    ) -> Sequence[OrganizationView]:
+        return _views(await self.list_by_ids(ids), projection)
+
+    async def view_by_facility(
+        self,
+        facility: Facility,
+        projection: OrganizationProjection,
+        page: PageRequest | None = None,
+    ) -> Sequence[OrganizationView]:
+        return _views(await self.list_by_facility(facility, page), projection)
+
+    async def view_in_radius(
+        self,
+        center: Coordinates,
+        radius_meters: float,
+        projection: OrganizationProjection,
+        page: PageRequest | None = None,
+    ) -> Sequence[OrganizationView]:
+        orgs = await self.list_in_radius(center, radius_meters, page)
+        return _views(orgs, projection)
+
+    async def view_in_rectangle(
+        self,
+        p1: Coordinates,
+        p2: Coordinates,
+        projection: OrganizationProjection,
+        page: PageRequest | None = None,
+    ) -> Sequence[OrganizationView]:
+        return _views(await self.list_in_rectangle(p1, p2, page), projection)
+
+    async def view_by_business_type_recursive(
+        self,
+        bt: BusinessType,
+        projection: OrganizationProjection,
+        page: PageRequest | None = None,
+    ) -> Sequence[OrganizationView]:
+        orgs = await self.list_by_business_type_recursive(bt, page)
+        return _views(orgs, projection)
+
+    async def view_search_by_name(
+        self,
+        query: str,
+        projection: OrganizationProjection,
+        page: PageRequest | None = None,
+    ) -> Sequence[OrganizationView]:
+        return _views(await self.search_by_name(query, page), projection)
+
+    # ---------------------------------------------------------
+    # Streaming
+    # ---------------------------------------------------------
+
+    async def stream_by_facility(
+        self, facility: Facility
+    ) -> AsyncIterator[Organization]:
+        for org in await self.list_by_facility(facility):
+            yield org
+
+    async def stream_in_radius(
+        self, center: Coordinates, radius_meters: float
+    ) -> AsyncIterator[Organization]:
+        for org in await self.list_in_radius(center, radius_meters):
+            yield org
+
+    async def stream_in_rectangle(
+        self, p1: Coordinates, p2: Coordinates
+    ) -> AsyncIterator[Organization]:
+        for org in await self.list_in_rectangle(p1, p2):
+            yield org
+
+    async def stream_by_business_type_recursive(
+        self, bt: BusinessType
+    ) -> AsyncIterator[Organization]:
+        for org in await self.list_by_business_type_recursive(bt):
+            yield org
+
+    async def stream_search_by_name(self, query: str) -> AsyncIterator[Organization]:
+        for org in await self.search_by_name(query):
+            yield org
+
+    # ---------------------------------------------------------
+    # Projected streaming
+    # ---------------------------------------------------------
+
+    async def stream_view_by_facility(
+        self, facility: Facility, projection: OrganizationProjection
+    ) -> AsyncIterator[OrganizationView]:
+        for org in await self.list_by_facility(facility):
+            yield OrganizationView.of(org, projection)
+
+    async def stream_view_in_radius(
+        self,
+        center: Coordinates,
+        radius_meters: float,
+        projection: OrganizationProjection,
+    ) -> AsyncIterator[OrganizationView]:
+        for org in await self.list_in_radius(center, radius_meters):
+            yield OrganizationView.of(org, projection)
+
+    async def stream_view_in_rectangle(
+        self, p1: Coordinates, p2: Coordinates, projection: OrganizationProjection
+    ) -> AsyncIterator[OrganizationView]:
+        for org in await self.list_in_rectangle(p1, p2):
+            yield OrganizationView.of(org, projection)
+
+    async def stream_view_by_business_type_recursive(
+        self, bt: BusinessType, projection: OrganizationProjection
+    ) -> AsyncIterator[OrganizationView]:
+        for org in await self.list_by_business_type_recursive(bt):
+            yield OrganizationView.of(org, projection)
+
+    async def stream_view_search_by_name(
+        self, query: str, projection: OrganizationProjection
+    ) -> AsyncIterator[OrganizationView]:
+        for org in await self.search_by_name(query):
+            yield OrganizationView.of(org, projection)
+
+    # ---------------------------------------------------------
+    # Aggregates
+    # ---------------------------------------------------------
+
+    async def count_by_business_type(
+        self, root: BusinessType | None = None
+    ) -> dict[BusinessTypeId, OrganizationCount]:
+        direct: Counter[BusinessType] = Counter()
+        total: Counter[BusinessType] = Counter()
+        trees: set[BusinessType] = set()
+
+        for org in self._items.values():
+            scope: set[BusinessType] = set()
+            for bt in set(org.business_types):
+                direct[bt] += 1
+                node = bt
+                while node is not None:
+                    scope.add(node)
+                    node = node.parent
+                trees.add(bt.root())
+            total.update(scope)
+
+        # every business type of the touched trees, keyed by ID so that
+        # instances loaded elsewhere (e.g. `root`) match the stored ones
+        nodes = {
+            bt.id: bt
+            for tree in trees
+            for bt in tree.get_recursive_business_types()
+        }
+        if root is not None:
+            subtree = {bt.id: bt for bt in root.get_recursive_business_types()}
+            subtree.update(
+                (bt_id, bt) for bt_id, bt in nodes.items() if bt.in_subtree_of(root)
+            )
+            nodes = subtree
+
+        return {
+            bt_id: OrganizationCount(direct=direct[bt], total=total[bt])
+            for bt_id, bt in nodes.items()
+        }
+
+
+def _name_of(org: Organization) -> str:
+    return org.name.value
+
+
+def _views(
+    orgs: Iterable[Organization], projection: OrganizationProjection
+) -> list[OrganizationView]:
+    return [OrganizationView.of(org, projection) for org in orgs]
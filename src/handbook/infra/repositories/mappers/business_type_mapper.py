@@ -1,3 +1,8 @@
+from typing import Iterable, MutableMapping
+from uuid import UUID
+
+from sqlalchemy import inspect
+
 from domain.entities.business_type import BusinessType
 from domain.val_objs.business_name import BusinessName
 from domain.val_objs.ids import BusinessTypeId
@@ -14,6 +19,46 @@ class BusinessTypeMapper:
             children=[],
         )
 
+    @staticmethod
+    def to_domain_shared(
+        model: BusinessTypeModel,
+        identity_map: MutableMapping[UUID, BusinessType],
+    ) -> BusinessType:
+        """
+        Return the one entity kept in `identity_map` for `model.id`.
+        On first sight it is created and linked under its parent, when the
+        parent row was loaded with the model.
+        """
+        bt = identity_map.get(model.id)
+        if bt is not None:
+            return bt
+
+        bt = BusinessTypeMapper.to_domain(model)
+        identity_map[model.id] = bt
+
+        if model.parent_id is not None and "parent" not in inspect(model).unloaded:
+            parent_model = model.parent
+            if parent_model is not None:
+                parent = BusinessTypeMapper.to_domain_shared(parent_model, identity_map)
+                bt.set_parent(parent)
+
+        return bt
+
+    @staticmethod
+    def to_domain_tree(
+        rows: Iterable[tuple[UUID, str, UUID | None]],
+    ) -> dict[UUID, BusinessType]:
+        """Hydrate (id, name, parent_id) rows into linked entities in O(n)."""
+        nodes = BusinessType.reconstitute(
+            (
+                BusinessTypeId(id_),
+                BusinessName(name),
+                BusinessTypeId(parent_id) if parent_id is not None else None,
+            )
+            for id_, name, parent_id in rows
+        )
+        return {bt_id.value: bt for bt_id, bt in nodes.items()}
+
     @staticmethod
     def attach_relations(
         domain_bt: BusinessType, model: BusinessTypeModel, cache: dict
@@ -23,10 +68,11 @@ class BusinessTypeMapper:
             parent = cache.get(model.parent_id)
             domain_bt.set_parent(parent)
 
-        # children
+        # children (only those that were loaded alongside this node)
         for child_model in model.children:
-            child = cache[child_model.id]
-            domain_bt.add_child(child)
+            child = cache.get(child_model.id)
+            if child is not None and child not in domain_bt.children:
+                domain_bt.add_child(child)
 
     @staticmethod
     def to_model(entity: BusinessType) -> BusinessTypeModel:
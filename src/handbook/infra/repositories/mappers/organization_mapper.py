@@ -1,3 +1,7 @@
+from typing import MutableMapping
+from uuid import UUID
+
+from domain.entities.business_type import BusinessType
 from domain.entities.organization import Organization
 from domain.val_objs.ids import OrganizationId
 from domain.val_objs.organization_name import OrganizationName
@@ -11,16 +15,22 @@ from infra.repositories.mappers.facility_mapper import FacilityMapper
 
 class OrganizationMapper:
     @staticmethod
-    def to_domain(model: OrganizationModel) -> Organization:
+    def to_domain(
+        model: OrganizationModel,
+        bt_identity_map: MutableMapping[UUID, BusinessType] | None = None,
+    ) -> Organization:
+        """
+        Pass the same `bt_identity_map` when mapping many organizations so
+        they share one BusinessType instance per ID.
+        """
         facility = FacilityMapper.to_domain(model.facility)
 
-        business_types = [BusinessTypeMapper.to_domain(bt) for bt in model.activities]
-
-        bt_cache = {bt.id_.value: bt for bt in business_types}
-        for bt_model in model.activities:
-            BusinessTypeMapper.attach_relations(
-                bt_cache[bt_model.id], bt_model, bt_cache
-            )
+        if bt_identity_map is None:
+            bt_identity_map = {}
+        business_types = [
+            BusinessTypeMapper.to_domain_shared(bt, bt_identity_map)
+            for bt in model.activities
+        ]
 
         return Organization(
             id_=OrganizationId(model.id),
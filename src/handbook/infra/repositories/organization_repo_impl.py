@@ -1,26 +1,355 @@
 from __future__ import annotations
 
-from typing import Iterable
+from collections import ChainMap
+from typing import AsyncIterator, Iterable, MutableMapping, Sequence
+from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import ColumnElement, Result, Row, Select, func, select, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import raiseload, selectinload
+from sqlalchemy.orm import contains_eager, joinedload, load_only, raiseload, selectinload
 
 from domain.entities.business_type import BusinessType
 from domain.entities.facility import Facility
 from domain.entities.organization import Organization
 from domain.exceptions.base import DomainResourceNotFoundError
 from domain.repositories.organization_repository import OrganizationRepository
-from domain.val_objs.ids import OrganizationId
+from domain.val_objs.coords import Coordinates
+from domain.val_objs.ids import BusinessTypeId, FacilityId, OrganizationId
+from domain.val_objs.org_count import OrganizationCount
+from domain.val_objs.org_projection import OrganizationProjection, OrganizationView
+from domain.val_objs.org_summary import OrganizationSummary
+from domain.val_objs.organization_name import OrganizationName
+from domain.val_objs.page import PageRequest
+from domain.val_objs.phone import PhoneNumber
+from infra.cache.business_type_tree import BusinessTypeTreeCache, bt_tree_cache
+from infra.cache.org_name_prefix import (
+    OrganizationNamePrefixCache,
+    normalize_prefix,
+    org_name_prefix_cache,
+)
+from infra.db.geo import within_radius, within_rectangle
+from infra.db.locks import lock_organization
 from infra.db.models.business_type import BusinessTypeModel
+from infra.db.models.business_type_closure import BusinessTypeClosureModel
+from infra.db.models.business_type_org_count import BusinessTypeOrgCountModel
+from infra.db.models.facility import FacilityModel
 from infra.db.models.links import organization_business_type
 from infra.db.models.org import OrganizationModel
+from infra.db.models.phone import PhoneModel
+from infra.db.org_counts import apply_link_changes
+from infra.indexes.trigram import most_similar
+from infra.repositories.mappers.business_type_mapper import BusinessTypeMapper
+from infra.repositories.mappers.facility_mapper import FacilityMapper
 from infra.repositories.mappers.organization_mapper import OrganizationMapper
 
+# rows fetched per round trip when streaming; eager loads run per batch
+STREAM_BATCH_SIZE = 500
+
 
 class OrganizationRepositoryImpl(OrganizationRepository):
-    def __init__(self, session: AsyncSession):
+    """
+    Activity rows are loaded slim: only id, name and parent_id of each
+    business type and of its parent, joined into the organization query.
+
+    With `with_hierarchy=True` organizations instead reference the
+    canonical entities of the business type tree snapshot, so every
+    business type carries its full ancestry and children.
+
+    Name prefix suggestions are served from `name_cache` when a recent
+    answer for the same prefix and limit is there.
+    """
+
+    def __init__(
+        self,
+        session: AsyncSession,
+        with_hierarchy: bool = False,
+        tree_cache: BusinessTypeTreeCache = bt_tree_cache,
+        name_cache: OrganizationNamePrefixCache = org_name_prefix_cache,
+    ):
         self._session = session
+        self._with_hierarchy = with_hierarchy
+        self._tree_cache = tree_cache
+        self._name_cache = name_cache
+        # one BusinessType instance per ID for everything this repository
+        # maps; repositories live for a single request
+        self._bt_identity_map: dict[UUID, BusinessType] = {}
+
+    # ---------------------------------------------------------
+    # Loading
+    # ---------------------------------------------------------
+
+    def _activities_option(self, loader=joinedload):
+        bt = BusinessTypeModel
+        activities = loader(OrganizationModel.activities).load_only(
+            bt.id, bt.name, bt.parent_id
+        )
+        if not self._with_hierarchy:
+            activities = activities.joinedload(bt.parent).load_only(
+                bt.id, bt.name, bt.parent_id
+            )
+        return activities
+
+    def _load_options(self) -> tuple:
+        return (
+            selectinload(OrganizationModel.facility),
+            selectinload(OrganizationModel.phone_numbers),
+            self._activities_option(),
+        )
+
+    def _located_options(self) -> tuple:
+        """
+        For statements joining the facility themselves (`_located_in`):
+        the facility, phone numbers and business types all come from
+        that one statement.
+        """
+        return (
+            contains_eager(OrganizationModel.facility),
+            joinedload(OrganizationModel.phone_numbers),
+            self._activities_option(),
+            raiseload("*"),
+        )
+
+    def _stream_options(self, facility_joined: bool = False) -> tuple:
+        """
+        Joined collections cannot be combined with yield_per, so when
+        streaming, phone numbers and business types are loaded per batch.
+        """
+        facility = (
+            contains_eager(OrganizationModel.facility)
+            if facility_joined
+            else joinedload(OrganizationModel.facility)
+        )
+        return (
+            facility,
+            selectinload(OrganizationModel.phone_numbers),
+            self._activities_option(selectinload),
+            raiseload("*"),
+        )
+
+    @staticmethod
+    def _paged(stmt: Select, page: PageRequest | None) -> Select:
+        """Order by (name, id) and, for a page, seek past its cursor and limit."""
+        org = OrganizationModel
+        stmt = stmt.order_by(org.name, org.id)
+        if page is None:
+            return stmt
+
+        if page.after is not None:
+            stmt = stmt.where(
+                tuple_(org.name, org.id) > tuple_(page.after.name, page.after.id)
+            )
+        return stmt.limit(page.limit)
+
+    async def _bt_identity(self) -> MutableMapping[UUID, BusinessType]:
+        if not self._with_hierarchy:
+            return self._bt_identity_map
+
+        snapshot = await self._tree_cache.get(self._session)
+        # IDs missing from the snapshot (e.g. not committed yet) are
+        # mapped into the local map instead
+        return ChainMap(self._bt_identity_map, snapshot.by_id)
+
+    async def _to_domain_list(self, result: Result) -> list[Organization]:
+        identity_map = await self._bt_identity()
+        return [
+            OrganizationMapper.to_domain(m, identity_map)
+            for m in result.unique().scalars().all()
+        ]
+
+    async def _stream(self, stmt: Select) -> AsyncIterator[Organization]:
+        """
+        Run `stmt` on a server-side cursor in (name, id) order and map
+        organizations as their batch arrives. The session only keeps weak
+        references to mapped rows, so memory stays bounded by the batch.
+        """
+        stmt = stmt.order_by(OrganizationModel.name, OrganizationModel.id)
+        stmt = stmt.execution_options(yield_per=STREAM_BATCH_SIZE)
+
+        identity_map = await self._bt_identity()
+        result = await self._session.stream(stmt)
+        async for model in result.scalars():
+            yield OrganizationMapper.to_domain(model, identity_map)
+
+    # ---------------------------------------------------------
+    # Projections
+    # ---------------------------------------------------------
+
+    async def _views(
+        self,
+        stmt: Select,
+        projection: OrganizationProjection,
+        page: PageRequest | None = None,
+    ) -> list[OrganizationView]:
+        """
+        Run `stmt` for id and name only (plus facility_id when the facility
+        is wanted), then load each requested relation for the whole result
+        with one `IN` query. Nothing else is selected or mapped.
+        """
+        stmt = self._paged(self._view_columns(stmt, projection), page)
+        rows = (await self._session.execute(stmt)).all()
+        return await self._views_of(rows, projection)
+
+    async def _stream_views(
+        self, stmt: Select, projection: OrganizationProjection
+    ) -> AsyncIterator[OrganizationView]:
+        """
+        Streaming counterpart of `_views`: the same narrow rows arrive on a
+        server-side cursor and relations are loaded per batch.
+        """
+        stmt = self._paged(self._view_columns(stmt, projection), None)
+        stmt = stmt.execution_options(yield_per=STREAM_BATCH_SIZE)
+
+        result = await self._session.stream(stmt)
+        async for rows in result.partitions():
+            for view in await self._views_of(rows, projection):
+                yield view
+
+    @staticmethod
+    def _view_columns(stmt: Select, projection: OrganizationProjection) -> Select:
+        org = OrganizationModel
+        columns = [org.id, org.name]
+        if projection.wants("facility"):
+            columns.append(org.facility_id)
+        return stmt.with_only_columns(*columns)
+
+    async def _views_of(
+        self, rows: Sequence[Row], projection: OrganizationProjection
+    ) -> list[OrganizationView]:
+        if not rows:
+            return []
+
+        wants, expands = projection.wants, projection.expands
+        ids = [row.id for row in rows]
+        phones = await self._phones_of(ids) if wants("phones") else {}
+        facilities = (
+            await self._facilities_of({row.facility_id for row in rows})
+            if expands("facility")
+            else {}
+        )
+        bts: dict[UUID, list[BusinessType]] = {}
+        bt_ids: dict[UUID, list[BusinessTypeId]] = {}
+        if expands("business_types"):
+            bts = await self._business_types_of(ids)
+            bt_ids = {org_id: [bt.id for bt in v] for org_id, v in bts.items()}
+        elif wants("business_types"):
+            bt_ids = await self._business_type_ids_of(ids)
+
+        views = []
+        for row in rows:
+            facility_id = row.facility_id if wants("facility") else None
+            views.append(
+                OrganizationView(
+                    id=OrganizationId(row.id),
+                    name=OrganizationName(row.name),
+                    phone_numbers=(
+                        tuple(phones.get(row.id, ())) if wants("phones") else None
+                    ),
+                    facility_id=FacilityId(facility_id) if facility_id else None,
+                    facility=facilities.get(facility_id),
+                    business_type_ids=(
+                        tuple(bt_ids.get(row.id, ()))
+                        if wants("business_types")
+                        else None
+                    ),
+                    business_types=(
+                        tuple(bts.get(row.id, ()))
+                        if expands("business_types")
+                        else None
+                    ),
+                )
+            )
+        return views
+
+    async def _phones_of(self, ids: list[UUID]) -> dict[UUID, list[PhoneNumber]]:
+        stmt = select(PhoneModel.org_id, PhoneModel.phone_number).where(
+            PhoneModel.org_id.in_(ids)
+        )
+        phones: dict[UUID, list[PhoneNumber]] = {}
+        for org_id, number in await self._session.execute(stmt):
+            phones.setdefault(org_id, []).append(PhoneNumber(number))
+        return phones
+
+    async def _facilities_of(self, ids: set[UUID]) -> dict[UUID, Facility]:
+        stmt = (
+            select(FacilityModel)
+            .where(FacilityModel.id.in_(ids))
+            .options(raiseload("*"))
+        )
+        result = await self._session.scalars(stmt)
+        return {m.id: FacilityMapper.to_domain(m) for m in result.all()}
+
+    async def _business_type_ids_of(
+        self, ids: list[UUID]
+    ) -> dict[UUID, list[BusinessTypeId]]:
+        link = organization_business_type.c
+        stmt = select(link.organization_id, link.business_type_id).where(
+            link.organization_id.in_(ids)
+        )
+        bt_ids: dict[UUID, list[BusinessTypeId]] = {}
+        for org_id, bt_id in await self._session.execute(stmt):
+            bt_ids.setdefault(org_id, []).append(BusinessTypeId(bt_id))
+        return bt_ids
+
+    async def _business_types_of(
+        self, ids: list[UUID]
+    ) -> dict[UUID, list[BusinessType]]:
+        """Same slim business type rows as `_activities_option` loads."""
+        bt, link = BusinessTypeModel, organization_business_type.c
+        options = [load_only(bt.id, bt.name, bt.parent_id), raiseload("*")]
+        if not self._with_hierarchy:
+            options.append(
+                joinedload(bt.parent).load_only(bt.id, bt.name, bt.parent_id)
+            )
+        stmt = (
+            select(link.organization_id, bt)
+            .join(bt, bt.id == link.business_type_id)
+            .where(link.organization_id.in_(ids))
+            .options(*options)
+        )
+
+        identity_map = await self._bt_identity()
+        bts: dict[UUID, list[BusinessType]] = {}
+        for org_id, model in await self._session.execute(stmt):
+            bts.setdefault(org_id, []).append(
+                BusinessTypeMapper.to_domain_shared(model, identity_map)
+            )
+        return bts
+
+    # ---------------------------------------------------------
+    # Statements shared by listing and streaming
+    # ---------------------------------------------------------
+
+    @staticmethod
+    def _by_facility(facility: Facility) -> Select:
+        return select(OrganizationModel).where(
+            OrganizationModel.facility_id == facility.id.value
+        )
+
+    @staticmethod
+    def _located_in(where: ColumnElement[bool]) -> Select:
+        """Organizations whose facility matches `where`, facility joined."""
+        return select(OrganizationModel).join(OrganizationModel.facility).where(where)
+
+    @staticmethod
+    def _in_subtree(bt: BusinessType) -> Select:
+        in_subtree = (
+            select(organization_business_type.c.organization_id)
+            .join(
+                BusinessTypeClosureModel,
+                BusinessTypeClosureModel.descendant_id
+                == organization_business_type.c.business_type_id,
+            )
+            .where(BusinessTypeClosureModel.ancestor_id == bt.id.value)
+        )
+        return select(OrganizationModel).where(OrganizationModel.id.in_(in_subtree))
+
+    @staticmethod
+    def _name_contains(query: str) -> Select:
+        # lower(name) rather than ILIKE so ix_organization_name_trgm applies
+        pattern = f"%{_escape_like(query.lower())}%"
+        return select(OrganizationModel).where(
+            func.lower(OrganizationModel.name).like(pattern, escape="\\")
+        )
 
     # ---------------------------------------------------------
     # CRUD
@@ -30,21 +359,11 @@ class OrganizationRepositoryImpl(OrganizationRepository):
         stmt = (
             select(OrganizationModel)
             .where(OrganizationModel.id == id.value)
-            .options(
-                selectinload(OrganizationModel.facility),
-                selectinload(OrganizationModel.phone_numbers),
-                selectinload(OrganizationModel.activities).selectinload(
-                    BusinessTypeModel.children
-                ),
-                selectinload(OrganizationModel.activities).selectinload(
-                    BusinessTypeModel.parent
-                ),
-                raiseload("*"),
-            )
+            .options(*self._load_options(), raiseload("*"))
         )
 
         result = await self._session.execute(stmt)
-        model = result.scalar_one_or_none()
+        model = result.unique().scalar_one_or_none()
 
         if model is None:
             raise DomainResourceNotFoundError(
@@ -52,57 +371,135 @@ class OrganizationRepositoryImpl(OrganizationRepository):
                 context={"organization_id": str(id.value)},
             )
 
-        return OrganizationMapper.to_domain(model)
+        return OrganizationMapper.to_domain(model, await self._bt_identity())
+
+    async def list_by_ids(self, ids: Sequence[OrganizationId]) -> list[Organization]:
+        org_ids = {i.value for i in ids}
+        if not org_ids:
+            return []
+
+        # facility, phones and business types joined: one statement
+        stmt = self._located_in(OrganizationModel.id.in_(org_ids)).options(
+            *self._located_options()
+        )
+        result = await self._session.execute(stmt)
+        return await self._to_domain_list(result)
+
+    async def _linked_business_types(self, org_id: UUID) -> set[UUID]:
+        stmt = select(organization_business_type.c.business_type_id).where(
+            organization_business_type.c.organization_id == org_id
+        )
+        return set((await self._session.scalars(stmt)).all())
 
     async def save(self, organization: Organization) -> None:
+        # held until commit: a concurrent save must not read the old links
+        # before this one has applied its count changes
+        await lock_organization(self._session, organization.id.value)
+        old_links = await self._linked_business_types(organization.id.value)
+        new_links = {bt.id.value for bt in organization.business_types}
+
         model = OrganizationMapper.to_model(organization)
         await self._session.merge(model)
+        await apply_link_changes(self._session, old_links, new_links)
+        self._name_cache.track(self._session)
 
     async def delete(self, organization: Organization) -> None:
+        await lock_organization(self._session, organization.id.value)
         db_model = await self._session.get(OrganizationModel, organization.id.value)
         if db_model is not None:
+            old_links = await self._linked_business_types(organization.id.value)
             await self._session.delete(db_model)
+            await apply_link_changes(self._session, old_links, set())
+            self._name_cache.track(self._session)
 
     # ---------------------------------------------------------
     # Queries
     # ---------------------------------------------------------
 
-    async def list_by_facility(self, facility: Facility) -> list[Organization]:
+    async def list_by_facility(
+        self, facility: Facility, page: PageRequest | None = None
+    ) -> list[Organization]:
+        stmt = self._by_facility(facility).options(*self._load_options())
+        stmt = self._paged(stmt, page)
+        result = await self._session.execute(stmt)
+        return await self._to_domain_list(result)
+
+    def stream_by_facility(self, facility: Facility) -> AsyncIterator[Organization]:
+        stmt = self._by_facility(facility).options(*self._stream_options())
+        return self._stream(stmt)
+
+    async def list_by_facilities(
+        self, ids: Sequence[FacilityId]
+    ) -> list[Organization]:
+        facility_ids = [i.value for i in ids]
+        if not facility_ids:
+            return []
+
         stmt = (
             select(OrganizationModel)
-            .where(OrganizationModel.facility_id == facility.id.value)
-            .options(
-                selectinload(OrganizationModel.facility),
-                selectinload(OrganizationModel.phone_numbers),
-                selectinload(OrganizationModel.activities).selectinload(
-                    BusinessTypeModel.children
-                ),
-                selectinload(OrganizationModel.activities).selectinload(
-                    BusinessTypeModel.parent
-                ),
-            )
+            .where(OrganizationModel.facility_id.in_(facility_ids))
+            .options(*self._load_options())
         )
         result = await self._session.execute(stmt)
-        return [OrganizationMapper.to_domain(m) for m in result.scalars().all()]
+        return await self._to_domain_list(result)
+
+    async def list_in_radius(
+        self,
+        center: Coordinates,
+        radius_meters: float,
+        page: PageRequest | None = None,
+    ) -> list[Organization]:
+        located = self._located_in(within_radius(center, radius_meters))
+        stmt = self._paged(located.options(*self._located_options()), page)
+        result = await self._session.execute(stmt)
+        return await self._to_domain_list(result)
+
+    def stream_in_radius(
+        self, center: Coordinates, radius_meters: float
+    ) -> AsyncIterator[Organization]:
+        located = self._located_in(within_radius(center, radius_meters))
+        return self._stream(located.options(*self._stream_options(True)))
+
+    async def list_in_rectangle(
+        self,
+        p1: Coordinates,
+        p2: Coordinates,
+        page: PageRequest | None = None,
+    ) -> list[Organization]:
+        located = self._located_in(within_rectangle(p1, p2))
+        stmt = self._paged(located.options(*self._located_options()), page)
+        result = await self._session.execute(stmt)
+        return await self._to_domain_list(result)
+
+    def stream_in_rectangle(
+        self, p1: Coordinates, p2: Coordinates
+    ) -> AsyncIterator[Organization]:
+        located = self._located_in(within_rectangle(p1, p2))
+        return self._stream(located.options(*self._stream_options(True)))
 
     async def list_by_business_type(self, bt: BusinessType) -> list[Organization]:
         stmt = (
             select(OrganizationModel)
             .join(organization_business_type)
             .where(organization_business_type.c.business_type_id == bt.id.value)
-            .options(
-                selectinload(OrganizationModel.facility),
-                selectinload(OrganizationModel.phone_numbers),
-                selectinload(OrganizationModel.activities).selectinload(
-                    BusinessTypeModel.children
-                ),
-                selectinload(OrganizationModel.activities).selectinload(
-                    BusinessTypeModel.parent
-                ),
-            )
+            .options(*self._load_options())
         )
         result = await self._session.execute(stmt)
-        return [OrganizationMapper.to_domain(m) for m in result.scalars().all()]
+        return await self._to_domain_list(result)
+
+    async def list_by_business_type_recursive(
+        self, bt: BusinessType, page: PageRequest | None = None
+    ) -> list[Organization]:
+        stmt = self._in_subtree(bt).options(*self._load_options())
+        stmt = self._paged(stmt, page)
+        result = await self._session.execute(stmt)
+        return await self._to_domain_list(result)
+
+    def stream_by_business_type_recursive(
+        self, bt: BusinessType
+    ) -> AsyncIterator[Organization]:
+        stmt = self._in_subtree(bt).options(*self._stream_options())
+        return self._stream(stmt)
 
     async def list_by_any_business_type(
         self,
@@ -116,35 +513,219 @@ class OrganizationRepositoryImpl(OrganizationRepository):
             select(OrganizationModel)
             .join(organization_business_type)
             .where(organization_business_type.c.business_type_id.in_(ids))
-            .options(
-                selectinload(OrganizationModel.facility),
-                selectinload(OrganizationModel.phone_numbers),
-                selectinload(OrganizationModel.activities).selectinload(
-                    BusinessTypeModel.children
-                ),
-                selectinload(OrganizationModel.activities).selectinload(
-                    BusinessTypeModel.parent
-                ),
+            .options(*self._load_options())
+        )
+        result = await self._session.execute(stmt)
+        return await self._to_domain_list(result)
+
+    async def search_by_name(
+        self, query: str, page: PageRequest | None = None
+    ) -> list[Organization]:
+        stmt = self._name_contains(query).options(
+            *self._load_options(), raiseload("*")
+        )
+        stmt = self._paged(stmt, page)
+        result = await self._session.execute(stmt)
+        return await self._to_domain_list(result)
+
+    async def search_by_similarity(
+        self, query: str, threshold: float, limit: int
+    ) -> list[Organization]:
+        if self._session.get_bind().dialect.name != "postgresql":
+            return await self._search_by_similarity_scan(query, threshold, limit)
+
+        # `%` only uses the trigram index with the threshold from this
+        # setting; is_local keeps it to the current transaction
+        await self._session.execute(
+            select(
+                func.set_config(
+                    "pg_trgm.similarity_threshold", str(threshold), True
+                )
             )
         )
+
+        org = OrganizationModel
+        name = func.lower(org.name)
+        score = func.similarity(name, query.lower())
+        stmt = (
+            select(org)
+            .where(name.op("%")(query.lower()), score >= threshold)
+            .order_by(score.desc(), org.name, org.id)
+            .limit(limit)
+            .options(*self._load_options(), raiseload("*"))
+        )
         result = await self._session.execute(stmt)
-        return [OrganizationMapper.to_domain(m) for m in result.scalars().all()]
+        return await self._to_domain_list(result)
+
+    async def _search_by_similarity_scan(
+        self, query: str, threshold: float, limit: int
+    ) -> list[Organization]:
+        """Without pg_trgm: rank every name in Python, then load the winners."""
+        org = OrganizationModel
+        rows = (await self._session.execute(select(org.id, org.name))).all()
+        best = most_similar(query, rows, _row_name, threshold, limit)
+        if not best:
+            return []
 
-    async def search_by_name(self, query: str) -> list[Organization]:
         stmt = (
-            select(OrganizationModel)
-            .where(OrganizationModel.name.ilike(f"%{query}%"))
-            .options(
-                selectinload(OrganizationModel.facility),
-                selectinload(OrganizationModel.phone_numbers),
-                selectinload(OrganizationModel.activities).selectinload(
-                    BusinessTypeModel.children
-                ),
-                selectinload(OrganizationModel.activities).selectinload(
-                    BusinessTypeModel.parent
-                ),
-                raiseload("*"),
-            )
+            select(org)
+            .where(org.id.in_([row.id for row in best]))
+            .options(*self._load_options())
+        )
+        result = await self._session.execute(stmt)
+        by_id = {o.id.value: o for o in await self._to_domain_list(result)}
+        return [by_id[row.id] for row in best if row.id in by_id]
+
+    def stream_search_by_name(self, query: str) -> AsyncIterator[Organization]:
+        stmt = self._name_contains(query).options(*self._stream_options())
+        return self._stream(stmt)
+
+    async def list_names_by_prefix(
+        self, prefix: str, limit: int
+    ) -> Sequence[OrganizationSummary]:
+        cached = self._name_cache.get(prefix, limit)
+        if cached is not None:
+            return cached
+
+        org = OrganizationModel
+        name = func.lower(org.name)
+        if self._session.get_bind().dialect.name == "postgresql":
+            # byte order, so both the LIKE and the ORDER BY are served
+            # by ix_organization_name_prefix
+            name = name.collate("C")
+
+        pattern = f"{_escape_like(normalize_prefix(prefix))}%"
+        stmt = (
+            select(org.id, org.name)
+            .where(name.like(pattern, escape="\\"))
+            .order_by(name, org.id)
+            .limit(limit)
         )
         result = await self._session.execute(stmt)
-        return [OrganizationMapper.to_domain(m) for m in result.scalars().all()]
+        suggestions = tuple(
+            OrganizationSummary(id=id_, name=name_) for id_, name_ in result.all()
+        )
+        if not self._name_cache.has_pending_writes(self._session):
+            self._name_cache.put(prefix, limit, suggestions)
+        return suggestions
+
+    # ---------------------------------------------------------
+    # Projected queries
+    # ---------------------------------------------------------
+
+    async def view_by_ids(
+        self, ids: Sequence[OrganizationId], projection: OrganizationProjection
+    ) -> list[OrganizationView]:
+        org_ids = {i.value for i in ids}
+        if not org_ids:
+            return []
+
+        stmt = select(OrganizationModel).where(OrganizationModel.id.in_(org_ids))
+        return await self._views(stmt, projection)
+
+    async def view_by_facility(
+        self,
+        facility: Facility,
+        projection: OrganizationProjection,
+        page: PageRequest | None = None,
+    ) -> list[OrganizationView]:
+        return await self._views(self._by_facility(facility), projection, page)
+
+    async def view_in_radius(
+        self,
+        center: Coordinates,
+        radius_meters: float,
+        projection: OrganizationProjection,
+        page: PageRequest | None = None,
+    ) -> list[OrganizationView]:
+        located = self._located_in(within_radius(center, radius_meters))
+        return await self._views(located, projection, page)
+
+    async def view_in_rectangle(
+        self,
+        p1: Coordinates,
+        p2: Coordinates,
+        projection: OrganizationProjection,
+        page: PageRequest | None = None,
+    ) -> list[OrganizationView]:
+        located = self._located_in(within_rectangle(p1, p2))
+        return await self._views(located, projection, page)
+
+    async def view_by_business_type_recursive(
+        self,
+        bt: BusinessType,
+        projection: OrganizationProjection,
+        page: PageRequest | None = None,
+    ) -> list[OrganizationView]:
+        return await self._views(self._in_subtree(bt), projection, page)
+
+    async def view_search_by_name(
+        self,
+        query: str,
+        projection: OrganizationProjection,
+        page: PageRequest | None = None,
+    ) -> list[OrganizationView]:
+        return await self._views(self._name_contains(query), projection, page)
+
+    # ---------------------------------------------------------
+    # Projected streaming
+    # ---------------------------------------------------------
+
+    def stream_view_by_facility(
+        self, facility: Facility, projection: OrganizationProjection
+    ) -> AsyncIterator[OrganizationView]:
+        return self._stream_views(self._by_facility(facility), projection)
+
+    def stream_view_in_radius(
+        self,
+        center: Coordinates,
+        radius_meters: float,
+        projection: OrganizationProjection,
+    ) -> AsyncIterator[OrganizationView]:
+        located = self._located_in(within_radius(center, radius_meters))
+        return self._stream_views(located, projection)
+
+    def stream_view_in_rectangle(
+        self, p1: Coordinates, p2: Coordinates, projection: OrganizationProjection
+    ) -> AsyncIterator[OrganizationView]:
+        located = self._located_in(within_rectangle(p1, p2))
+        return self._stream_views(located, projection)
+
+    def stream_view_by_business_type_recursive(
+        self, bt: BusinessType, projection: OrganizationProjection
+    ) -> AsyncIterator[OrganizationView]:
+        return self._stream_views(self._in_subtree(bt), projection)
+
+    def stream_view_search_by_name(
+        self, query: str, projection: OrganizationProjection
+    ) -> AsyncIterator[OrganizationView]:
+        return self._stream_views(self._name_contains(query), projection)
+
+    # ---------------------------------------------------------
+    # Aggregates
+    # ---------------------------------------------------------
+
+    async def count_by_business_type(
+        self, root: BusinessType | None = None
+    ) -> dict[BusinessTypeId, OrganizationCount]:
+        m = BusinessTypeOrgCountModel
+        stmt = select(m.business_type_id, m.direct_count, m.total_count)
+        if root is not None:
+            c = BusinessTypeClosureModel
+            stmt = stmt.join(c, c.descendant_id == m.business_type_id).where(
+                c.ancestor_id == root.id.value
+            )
+
+        result = await self._session.execute(stmt)
+        return {
+            BusinessTypeId(bt_id): OrganizationCount(direct=direct, total=total)
+            for bt_id, direct, total in result.all()
+        }
+
+
+def _row_name(row) -> str:
+    return row.name
+
+
+def _escape_like(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
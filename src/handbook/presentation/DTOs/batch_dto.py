@@ -0,0 +1,29 @@
+from typing import Callable, Generic, TypeVar
+from uuid import UUID
+
+from pydantic import BaseModel, Field
+
+from domain.val_objs.batch import BatchResult
+
+T = TypeVar("T", bound=BaseModel)
+
+
+class BatchDTO(BaseModel, Generic[T]):
+    """Result of a multi-get: what was found, and which IDs were not."""
+
+    items: list[T] = Field(
+        ...,
+        description="Found resources, in the order their IDs were requested.",
+    )
+    missing: list[UUID] = Field(
+        ...,
+        description="Requested IDs that matched nothing, in request order.",
+        json_schema_extra={"example": []},
+    )
+
+    @classmethod
+    def from_domain(cls, result: BatchResult, to_dto: Callable[..., T]):
+        return cls(
+            items=[to_dto(entity) for entity in result.found],
+            missing=list(result.missing),
+        )
@@ -83,3 +83,48 @@ class BusinessTypeDTO(BaseModel):
             name=bt.name.value,
             parent_id=bt.parent.id_.value if bt.parent else None,
         )
+
+
+class BusinessTypePathDTO(BaseModel):
+    id: UUID = Field(
+        ...,
+        description="Business type the path leads to.",
+        json_schema_extra={"example": "aaaaaaaa-aaaa-aaaa-aaaa-aaaaaaaaaaaa"},
+    )
+    path: list[BusinessTypeDTO] = Field(
+        ...,
+        description="Business types from the root down to this one, inclusive.",
+    )
+
+    @staticmethod
+    def from_domain(bt_id, path):
+        return BusinessTypePathDTO(
+            id=bt_id,
+            path=[BusinessTypeDTO.from_domain(bt) for bt in path],
+        )
+
+
+class BusinessTypeOrgCountDTO(BaseModel):
+    business_type_id: UUID = Field(
+        ...,
+        description="Business type ID.",
+        json_schema_extra={"example": "aaaaaaaa-aaaa-aaaa-aaaa-aaaaaaaaaaaa"},
+    )
+    direct_count: int = Field(
+        ...,
+        description="Organizations linked to this business type itself.",
+        json_schema_extra={"example": 3},
+    )
+    total_count: int = Field(
+        ...,
+        description="Organizations linked to this business type or any descendant.",
+        json_schema_extra={"example": 12},
+    )
+
+    @staticmethod
+    def from_domain(bt_id, count):
+        return BusinessTypeOrgCountDTO(
+            business_type_id=bt_id.value,
+            direct_count=count.direct,
+            total_count=count.total,
+        )
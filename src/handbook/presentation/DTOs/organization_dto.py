@@ -2,6 +2,8 @@ from uuid import UUID
 from pydantic import BaseModel, Field
 
 from domain.entities.organization import Organization
+from domain.val_objs.org_projection import OrganizationProjection, OrganizationView
+from domain.val_objs.org_summary import OrganizationSummary
 from presentation.DTOs.business_types_dto import BusinessTypeDTO
 from presentation.DTOs.facility_dto import FacilityDTO
 
@@ -14,6 +16,26 @@ class PhoneDTO(BaseModel):
     )
 
 
+class OrganizationSummaryDTO(BaseModel):
+    """DTO with only the identity and name of an organization."""
+
+    id: UUID = Field(
+        ...,
+        description="Unique identifier of the organization.",
+        json_schema_extra={"example": "99999999-9999-9999-9999-999999999999"},
+    )
+
+    name: str = Field(
+        ...,
+        description="Human-readable name of the organization.",
+        json_schema_extra={"example": "Coffee House №1"},
+    )
+
+    @staticmethod
+    def from_domain(summary: OrganizationSummary):
+        return OrganizationSummaryDTO(id=summary.id, name=summary.name)
+
+
 class OrganizationDTO(BaseModel):
     """
     DTO representing an organization with its facility, phone numbers,
@@ -86,3 +108,45 @@ class OrganizationDTO(BaseModel):
                 for bt in org.business_types
             ],
         )
+
+
+class OrganizationFieldsDTO(BaseModel):
+    """
+    Sparse organization: only the fields a projection asked for are set.
+    Dump with `exclude_unset=True` to leave the others out.
+    """
+
+    id: UUID | None = None
+    name: str | None = None
+    phones: list[PhoneDTO] | None = None
+    facility: FacilityDTO | None = None
+    facility_id: UUID | None = None
+    business_types: list[BusinessTypeDTO] | None = None
+    business_type_ids: list[UUID] | None = None
+
+    @staticmethod
+    def from_view(view: OrganizationView, projection: OrganizationProjection):
+        wants, expands = projection.wants, projection.expands
+        data: dict = {}
+        if wants("id"):
+            data["id"] = view.id.value
+        if wants("name"):
+            data["name"] = view.name.value
+        if wants("phones"):
+            data["phones"] = [PhoneDTO(number=p.value) for p in view.phone_numbers]
+        if expands("facility"):
+            data["facility"] = FacilityDTO.from_domain(view.facility)
+        elif wants("facility"):
+            data["facility_id"] = view.facility_id.value
+        if expands("business_types"):
+            data["business_types"] = [
+                BusinessTypeDTO(
+                    id=bt.id.value,
+                    name=bt.name.value,
+                    parent_id=bt.parent.id.value if bt.parent else None,
+                )
+                for bt in view.business_types
+            ]
+        elif wants("business_types"):
+            data["business_type_ids"] = [i.value for i in view.business_type_ids]
+        return OrganizationFieldsDTO(**data)
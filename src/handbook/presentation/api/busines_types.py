@@ -1,11 +1,36 @@
 from uuid import UUID
-from fastapi import APIRouter, Depends, Path
+from fastapi import APIRouter, Depends, Path, Query, Request
+from pydantic import TypeAdapter
 
-from presentation.dependencies import get_bt_by_id_uc, get_bt_repo
-from presentation.DTOs.business_types_dto import BusinessTypeDTO
+from presentation.dependencies import (
+    autocomplete_bt_uc,
+    count_orgs_by_bt_uc,
+    get_bt_ancestors_batch_uc,
+    get_bt_ancestors_uc,
+    get_bt_by_id_uc,
+    get_bt_repo,
+    get_bt_subtree_uc,
+    get_bt_tree_uc,
+    get_bts_by_ids_uc,
+    search_bt_by_name_uc,
+)
+from presentation.DTOs.batch_dto import BatchDTO
+from presentation.DTOs.business_types_dto import (
+    BusinessTypeDTO,
+    BusinessTypeOrgCountDTO,
+    BusinessTypePathDTO,
+    BusinessTypeTreeDTO,
+)
+from presentation.http_cache import RenderedCache, conditional_json_response
+from presentation.schemas.autocomplete import AutocompleteQuery
+from presentation.schemas.batch import MAX_BATCH_IDS, BatchIdsRequest
+from presentation.schemas.fuzzy_search import FuzzySearchQuery
 
 router = APIRouter(prefix="/business-types", tags=["Business Types"])
 
+tree_cache = RenderedCache()
+_tree_adapter = TypeAdapter(list[BusinessTypeTreeDTO])
+
 
 @router.get(
     "/",
@@ -18,6 +43,189 @@ async def list_all(repo=Depends(get_bt_repo)):
     return [BusinessTypeDTO.from_domain(bt) for bt in bts]
 
 
+@router.get(
+    "/tree",
+    response_model=list[BusinessTypeTreeDTO],
+    summary="Get the business type hierarchy",
+    description=(
+        "Returns every root business type with its nested children. "
+        "Responses carry an ETag; send it back in If-None-Match to get 304."
+    ),
+    responses={304: {"description": "Hierarchy unchanged since the given ETag"}},
+)
+async def get_tree(request: Request, uc=Depends(get_bt_tree_uc)):
+    # Read the version before the roots: a write landing in between then
+    # caches the newer tree under an already superseded version.
+    version = await uc.data_version()
+
+    async def render() -> bytes:
+        roots = await uc.execute()
+        return _tree_adapter.dump_json(
+            [BusinessTypeTreeDTO.from_domain(bt) for bt in roots]
+        )
+
+    payload = await tree_cache.get_or_render(version, render)
+    return conditional_json_response(request, payload)
+
+
+@router.get(
+    "/autocomplete",
+    response_model=list[BusinessTypeDTO],
+    summary="Autocomplete business type names",
+    description="Returns business types whose name starts with the given prefix, ignoring case.",
+)
+async def autocomplete(
+    q: AutocompleteQuery = Query(...),
+    uc=Depends(autocomplete_bt_uc),
+):
+    bts = await uc.execute(q.prefix, q.limit)
+    return [BusinessTypeDTO.from_domain(bt) for bt in bts]
+
+
+@router.get(
+    "/search",
+    response_model=list[BusinessTypeDTO],
+    summary="Search business types by name, tolerating typos",
+    description=(
+        "Returns business types whose name is within `max_distance` edits "
+        "of `q`, ignoring case, closest first."
+    ),
+)
+async def search_by_name(
+    q: FuzzySearchQuery = Query(...),
+    uc=Depends(search_bt_by_name_uc),
+):
+    bts = await uc.execute(q.q, q.max_distance, q.limit)
+    return [BusinessTypeDTO.from_domain(bt) for bt in bts]
+
+
+@router.get(
+    "/counts",
+    response_model=list[BusinessTypeOrgCountDTO],
+    summary="Count organizations per business type",
+    description=(
+        "Returns direct and subtree organization counts for every business "
+        "type, or only for `root_id` and its descendants."
+    ),
+    responses={
+        404: {
+            "description": "Business type not found",
+            "content": {
+                "application/json": {
+                    "example": {"detail": "Business type not found"}
+                }
+            },
+        },
+    },
+)
+async def count_organizations(
+    root_id: UUID | None = Query(None, description="Root of the subtree to count."),
+    uc=Depends(count_orgs_by_bt_uc),
+):
+    counts = await uc.execute(root_id)
+    return [
+        BusinessTypeOrgCountDTO.from_domain(bt_id, count)
+        for bt_id, count in counts.items()
+    ]
+
+
+@router.get(
+    "/ancestors",
+    response_model=list[BusinessTypePathDTO],
+    summary="Get root-to-node paths for many business types",
+    description=(
+        "Returns the breadcrumb path of every requested business type, "
+        "in request order. Unknown IDs are skipped."
+    ),
+)
+async def get_ancestors_batch(
+    ids: list[UUID] = Query(
+        ...,
+        min_length=1,
+        max_length=MAX_BATCH_IDS,
+        description="Business type UUIDs; repeat the parameter for each ID.",
+    ),
+    uc=Depends(get_bt_ancestors_batch_uc),
+):
+    paths = await uc.execute(ids)
+    return [
+        BusinessTypePathDTO.from_domain(bt_id, paths[bt_id])
+        for bt_id in dict.fromkeys(ids)
+        if bt_id in paths
+    ]
+
+
+@router.post(
+    "/batch",
+    response_model=BatchDTO[BusinessTypeDTO],
+    summary="Get many business types by ID",
+    description=(
+        "Returns the requested business types in request order; IDs that "
+        "match nothing are listed under `missing` instead of failing."
+    ),
+)
+async def get_bts_by_ids(
+    body: BatchIdsRequest,
+    uc=Depends(get_bts_by_ids_uc),
+):
+    result = await uc.execute(body.ids)
+    return BatchDTO[BusinessTypeDTO].from_domain(result, BusinessTypeDTO.from_domain)
+
+
+@router.get(
+    "/{bt_id}/ancestors",
+    response_model=list[BusinessTypeDTO],
+    summary="Get the root-to-node path of a business type",
+    description="Returns the business types from the root down to the given one, inclusive.",
+    responses={
+        404: {
+            "description": "Business type not found",
+            "content": {
+                "application/json": {
+                    "example": {"detail": "Business type not found"}
+                }
+            },
+        },
+    },
+)
+async def get_ancestors(
+    bt_id: UUID = Path(..., description="Business type UUID"),
+    uc=Depends(get_bt_ancestors_uc),
+):
+    path = await uc.execute(bt_id)
+    return [BusinessTypeDTO.from_domain(bt) for bt in path]
+
+
+@router.get(
+    "/{bt_id}/subtree",
+    response_model=BusinessTypeTreeDTO,
+    summary="Get a business type subtree",
+    description=(
+        "Returns the business type with its nested children, "
+        "down to `max_depth` levels below it (all levels if omitted)."
+    ),
+    responses={
+        404: {
+            "description": "Business type not found",
+            "content": {
+                "application/json": {
+                    "example": {"detail": "Business type not found"}
+                }
+            },
+        },
+    },
+)
+async def get_subtree(
+    bt_id: UUID = Path(..., description="Business type UUID"),
+    max_depth: int | None = Query(
+        None, ge=0, description="Number of levels to include below the node."
+    ),
+    uc=Depends(get_bt_subtree_uc),
+):
+    root = await uc.execute(bt_id, max_depth)
+    return BusinessTypeTreeDTO.from_domain(root)
+
+
 @router.get(
     "/{bt_id}",
     response_model=BusinessTypeDTO,
@@ -1,8 +1,14 @@
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, Path
-from presentation.dependencies import get_facility_by_id_uc, get_facility_repo
+from presentation.dependencies import (
+    get_facilities_by_ids_uc,
+    get_facility_by_id_uc,
+    get_facility_repo,
+)
+from presentation.DTOs.batch_dto import BatchDTO
 from presentation.DTOs.facility_dto import FacilityDTO
+from presentation.schemas.batch import BatchIdsRequest
 
 router = APIRouter(prefix="/facilities", tags=["Facilities"])
 
@@ -27,6 +33,23 @@ async def list_all(repo=Depends(get_facility_repo)):
     return [FacilityDTO.from_domain(f) for f in facilities]
 
 
+@router.post(
+    "/batch",
+    response_model=BatchDTO[FacilityDTO],
+    summary="Get many facilities by ID",
+    description=(
+        "Returns the requested facilities in request order; IDs that match "
+        "nothing are listed under `missing` instead of failing."
+    ),
+)
+async def get_facilities_by_ids(
+    body: BatchIdsRequest,
+    uc=Depends(get_facilities_by_ids_uc),
+):
+    result = await uc.execute(body.ids)
+    return BatchDTO[FacilityDTO].from_domain(result, FacilityDTO.from_domain)
+
+
 @router.get(
     "/{facility_id}",
     response_model=FacilityDTO,
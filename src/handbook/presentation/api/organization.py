@@ -1,28 +1,116 @@
+from typing import AsyncIterator, Iterable
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Path, Query, status
+from fastapi import (
+    APIRouter,
+    Depends,
+    HTTPException,
+    Path,
+    Query,
+    Request,
+    Response,
+    status,
+)
+from fastapi.responses import JSONResponse
+
+from domain.entities.organization import Organization
+from domain.val_objs.org_projection import OrganizationProjection, OrganizationView
+from domain.val_objs.page import OrganizationPage
 
 from presentation.dependencies import (
+    autocomplete_org_uc,
     get_org_by_id_uc,
+    get_orgs_by_ids_uc,
     get_orgs_in_proximity,
     get_orgs_in_rect,
     list_orgs_by_bt_rec_uc,
     list_orgs_by_facility_uc,
     search_org_by_name_uc,
+    search_org_by_similarity_uc,
+)
+from presentation.DTOs.batch_dto import BatchDTO
+from presentation.DTOs.organization_dto import (
+    OrganizationDTO,
+    OrganizationFieldsDTO,
+    OrganizationSummaryDTO,
 )
-from presentation.DTOs.organization_dto import OrganizationDTO
+from presentation.schemas.autocomplete import AutocompleteQuery
+from presentation.schemas.batch import BatchIdsRequest
 from presentation.schemas.circle_schema import ProximityQuery
+from presentation.schemas.fields import OrganizationFieldsQuery
+from presentation.schemas.pagination import (
+    NEXT_CURSOR_HEADER,
+    PageQuery,
+    encode_cursor,
+)
 from presentation.schemas.rect_schema import RectangleQuery
 from presentation.schemas.search_by_name import SearchByNameQuery
+from presentation.schemas.similarity_search import SimilaritySearchQuery
+from presentation.streaming import NDJSON_MEDIA_TYPE, ndjson_response, wants_ndjson
 
 router = APIRouter(prefix="/organizations", tags=["Organizations"])
 
 
+# Documents the opt-in NDJSON body of the paginated list endpoints.
+_STREAMABLE = {
+    200: {
+        "description": (
+            f"With `Accept: {NDJSON_MEDIA_TYPE}` every match is streamed, "
+            "one organization per line; limit and cursor do not apply."
+        ),
+        "content": {NDJSON_MEDIA_TYPE: {}},
+    },
+}
+
+
+def _sparse(
+    views: Iterable[OrganizationView], projection: OrganizationProjection
+) -> list[dict]:
+    return [
+        OrganizationFieldsDTO.from_view(v, projection).model_dump(
+            mode="json", exclude_unset=True
+        )
+        for v in views
+    ]
+
+
+def _page_body(
+    page: OrganizationPage,
+    response: Response,
+    projection: OrganizationProjection | None = None,
+):
+    """
+    Full DTOs, or with a projection a JSONResponse of just the requested
+    fields (a returned Response bypasses the full-DTO response_model).
+    """
+    headers = {NEXT_CURSOR_HEADER: encode_cursor(page.next)} if page.next else {}
+    if projection is not None:
+        return JSONResponse(_sparse(page.items, projection), headers=headers)
+
+    response.headers.update(headers)
+    return [OrganizationDTO.from_domain(o) for o in page.items]
+
+
+def _ndjson(
+    items: AsyncIterator[Organization] | AsyncIterator[OrganizationView],
+    projection: OrganizationProjection | None,
+):
+    """Full organizations, or with a projection the views streamed for it."""
+    if projection is None:
+        return ndjson_response(items, OrganizationDTO.from_domain)
+    return ndjson_response(
+        items,
+        lambda v: OrganizationFieldsDTO.from_view(v, projection),
+        exclude_unset=True,
+    )
+
+
 @router.get(
     "/search",
     response_model=list[OrganizationDTO],
     summary="Search organizations by name",
     responses={
+        **_STREAMABLE,
         404: {
             "description": "No organizations found",
             "content": {
@@ -32,19 +120,64 @@ router = APIRouter(prefix="/organizations", tags=["Organizations"])
     },
 )
 async def search_by_name(
+    request: Request,
+    response: Response,
     q: SearchByNameQuery = Query(...),
+    page: PageQuery = Depends(),
+    fieldset: OrganizationFieldsQuery = Depends(),
     uc=Depends(search_org_by_name_uc),
 ):
-    orgs = await uc.execute(q.q)
+    projection = fieldset.to_projection()
+    if wants_ndjson(request):
+        return _ndjson(await uc.stream(q.q, projection), projection)
+
+    result = await uc.execute(q.q, page.to_page_request(), projection)
+
+    return _page_body(result, response, projection)
+
+
+@router.get(
+    "/search/similar",
+    response_model=list[OrganizationDTO],
+    summary="Search organizations by name similarity",
+    description=(
+        "Returns organizations whose name has a trigram similarity of at "
+        "least `threshold` to `q`, ignoring case, most similar first."
+    ),
+)
+async def search_by_similarity(
+    q: SimilaritySearchQuery = Query(...),
+    uc=Depends(search_org_by_similarity_uc),
+):
+    orgs = await uc.execute(q.q, q.threshold, q.limit)
 
     return [OrganizationDTO.from_domain(o) for o in orgs]
 
 
+@router.get(
+    "/autocomplete",
+    response_model=list[OrganizationSummaryDTO],
+    summary="Autocomplete organization names",
+    description=(
+        "Returns the id and name of organizations whose name starts with "
+        "the given prefix, ignoring case."
+    ),
+)
+async def autocomplete(
+    q: AutocompleteQuery = Query(...),
+    uc=Depends(autocomplete_org_uc),
+):
+    suggestions = await uc.execute(q.prefix, q.limit)
+
+    return [OrganizationSummaryDTO.from_domain(s) for s in suggestions]
+
+
 @router.get(
     "/facility/{facility_id}",
     response_model=list[OrganizationDTO],
     summary="List organizations by facility ID",
     responses={
+        **_STREAMABLE,
         404: {
             "description": "No organizations found for this facility",
             "content": {
@@ -56,12 +189,20 @@ async def search_by_name(
     },
 )
 async def list_by_facility(
+    request: Request,
+    response: Response,
     facility_id: UUID = Path(...),
+    page: PageQuery = Depends(),
+    fieldset: OrganizationFieldsQuery = Depends(),
     uc=Depends(list_orgs_by_facility_uc),
 ):
-    orgs = await uc.execute(facility_id)
+    projection = fieldset.to_projection()
+    if wants_ndjson(request):
+        return _ndjson(await uc.stream(facility_id, projection), projection)
 
-    return [OrganizationDTO.from_domain(o) for o in orgs]
+    result = await uc.execute(facility_id, page.to_page_request(), projection)
+
+    return _page_body(result, response, projection)
 
 
 @router.get(
@@ -69,6 +210,7 @@ async def list_by_facility(
     response_model=list[OrganizationDTO],
     summary="List organizations by business type (recursive)",
     responses={
+        **_STREAMABLE,
         404: {
             "description": "No organizations found for this business type",
             "content": {
@@ -82,12 +224,20 @@ async def list_by_facility(
     },
 )
 async def list_by_business_type_recursive(
+    request: Request,
+    response: Response,
     bt_id: UUID = Path(...),
+    page: PageQuery = Depends(),
+    fieldset: OrganizationFieldsQuery = Depends(),
     uc=Depends(list_orgs_by_bt_rec_uc),
 ):
-    orgs = list(set(await uc.execute(bt_id)))
+    projection = fieldset.to_projection()
+    if wants_ndjson(request):
+        return _ndjson(await uc.stream(bt_id, projection), projection)
 
-    return [OrganizationDTO.from_domain(o) for o in orgs]
+    result = await uc.execute(bt_id, page.to_page_request(), projection)
+
+    return _page_body(result, response, projection)
 
 
 @router.get(
@@ -95,6 +245,7 @@ async def list_by_business_type_recursive(
     response_model=list[OrganizationDTO],
     summary="Search organizations in proximity",
     responses={
+        **_STREAMABLE,
         404: {
             "description": "No organizations found in this radius",
             "content": {
@@ -106,16 +257,32 @@ async def list_by_business_type_recursive(
     },
 )
 async def search_in_proximity(
+    request: Request,
+    response: Response,
     q: ProximityQuery = Query(...),
+    page: PageQuery = Depends(),
+    fieldset: OrganizationFieldsQuery = Depends(),
     uc=Depends(get_orgs_in_proximity),
 ):
-    orgs = await uc.execute(
+    projection = fieldset.to_projection()
+    if wants_ndjson(request):
+        orgs = await uc.stream(
+            lat=q.lat,
+            lon=q.lon,
+            radius_meters=q.radius_meters,
+            projection=projection,
+        )
+        return _ndjson(orgs, projection)
+
+    result = await uc.execute(
         lat=q.lat,
         lon=q.lon,
         radius_meters=q.radius_meters,
+        page=page.to_page_request(),
+        projection=projection,
     )
 
-    return [OrganizationDTO.from_domain(o) for o in orgs]
+    return _page_body(result, response, projection)
 
 
 @router.get(
@@ -123,6 +290,7 @@ async def search_in_proximity(
     response_model=list[OrganizationDTO],
     summary="List organizations in rectangle zone",
     responses={
+        **_STREAMABLE,
         404: {
             "description": "No organizations found in this area",
             "content": {
@@ -134,17 +302,61 @@ async def search_in_proximity(
     },
 )
 async def list_orgs_in_rectangle(
+    request: Request,
+    response: Response,
     rect: RectangleQuery = Query(...),
+    page: PageQuery = Depends(),
+    fieldset: OrganizationFieldsQuery = Depends(),
     uc=Depends(get_orgs_in_rect),
 ):
-    orgs = await uc.execute(
+    projection = fieldset.to_projection()
+    if wants_ndjson(request):
+        orgs = await uc.stream(
+            lat1=rect.lat1,
+            lon1=rect.lon1,
+            lat2=rect.lat2,
+            lon2=rect.lon2,
+            projection=projection,
+        )
+        return _ndjson(orgs, projection)
+
+    result = await uc.execute(
         lat1=rect.lat1,
         lon1=rect.lon1,
         lat2=rect.lat2,
         lon2=rect.lon2,
+        page=page.to_page_request(),
+        projection=projection,
     )
 
-    return [OrganizationDTO.from_domain(o) for o in orgs]
+    return _page_body(result, response, projection)
+
+
+@router.post(
+    "/batch",
+    response_model=BatchDTO[OrganizationDTO],
+    summary="Get many organizations by ID",
+    description=(
+        "Returns the requested organizations in request order; IDs that "
+        "match nothing are listed under `missing` instead of failing."
+    ),
+)
+async def get_orgs_by_ids(
+    body: BatchIdsRequest,
+    fieldset: OrganizationFieldsQuery = Depends(),
+    uc=Depends(get_orgs_by_ids_uc),
+):
+    projection = fieldset.to_projection()
+    result = await uc.execute(body.ids, projection)
+    if projection is not None:
+        return JSONResponse(
+            {
+                "items": _sparse(result.found, projection),
+                "missing": [str(i) for i in result.missing],
+            }
+        )
+
+    return BatchDTO[OrganizationDTO].from_domain(result, OrganizationDTO.from_domain)
 
 
 @router.get(
@@ -162,8 +374,12 @@ async def list_orgs_in_rectangle(
 )
 async def get_org_by_id(
     org_id: UUID = Path(...),
+    fieldset: OrganizationFieldsQuery = Depends(),
     uc=Depends(get_org_by_id_uc),
 ):
-    org = await uc.execute(org_id)
+    projection = fieldset.to_projection()
+    org = await uc.execute(org_id, projection)
+    if projection is not None:
+        return JSONResponse(_sparse([org], projection)[0])
 
     return OrganizationDTO.from_domain(org)
@@ -1,8 +1,34 @@
 from fastapi import Depends
 
-from application.use_cases.business_types.get_bt_by_id import GetBusinessTypeByIdUseCase
-from application.use_cases.facilities.get_facility_by_id import GetFacilityByIdUseCase
-from application.use_cases.orgs.get_org_by_id import GetOrganizationByIdUseCase
+from application.use_cases.business_types.autocomplete_bt import (
+    AutocompleteBusinessTypesUseCase,
+)
+from application.use_cases.business_types.count_orgs_by_bt import (
+    CountOrganizationsByBusinessTypeUseCase,
+)
+from application.use_cases.business_types.get_bt_ancestors import (
+    GetBusinessTypeAncestorsBatchUseCase,
+    GetBusinessTypeAncestorsUseCase,
+)
+from application.use_cases.business_types.get_bt_by_id import (
+    GetBusinessTypeByIdUseCase,
+    GetBusinessTypesByIdsUseCase,
+)
+from application.use_cases.business_types.get_bt_subtree import (
+    GetBusinessTypeSubtreeUseCase,
+)
+from application.use_cases.business_types.get_bt_tree import GetBusinessTypeTreeUseCase
+from application.use_cases.business_types.search_bt_by_name import (
+    SearchBusinessTypesByNameUseCase,
+)
+from application.use_cases.facilities.get_facility_by_id import (
+    GetFacilitiesByIdsUseCase,
+    GetFacilityByIdUseCase,
+)
+from application.use_cases.orgs.get_org_by_id import (
+    GetOrganizationByIdUseCase,
+    GetOrganizationsByIdsUseCase,
+)
 from application.use_cases.orgs.list_orgs_by_bt import (
     ListOrganizationsByBusinessTypeUseCase,
 )
@@ -19,6 +45,12 @@ from application.use_cases.orgs.list_orgs_in_rect import (
 from application.use_cases.orgs.search_org_by_name import (
     SearchOrganizationByNameUseCase,
 )
+from application.use_cases.orgs.autocomplete_org import (
+    AutocompleteOrganizationsUseCase,
+)
+from application.use_cases.orgs.search_org_by_similarity import (
+    SearchOrganizationsBySimilarityUseCase,
+)
 from infra.db.dependency import (
     get_bt_repo,
     get_facility_repo,
@@ -45,6 +77,21 @@ def get_org_by_id_uc(
     return GetOrganizationByIdUseCase(org_repo=org_repo)
 
 
+def get_orgs_by_ids_uc(
+    org_repo=Depends(get_org_repo),
+):
+    """
+    Provide a use case for retrieving several organizations by ID at once.
+
+    Dependencies:
+        - org_repo: Repository for organization persistence.
+
+    Returns:
+        GetOrganizationsByIdsUseCase
+    """
+    return GetOrganizationsByIdsUseCase(org_repo=org_repo)
+
+
 def list_orgs_by_facility_uc(
     org_repo=Depends(get_org_repo),
     facility_repo=Depends(get_facility_repo),
@@ -108,41 +155,35 @@ def list_orgs_by_bt_rec_uc(
 
 
 def list_orgs_by_radius_uc(
-    facility_repo=Depends(get_facility_repo),
     org_repo=Depends(get_org_repo),
 ):
     """
     Provide a use case for listing organizations within a geographic radius.
 
     Dependencies:
-        - facility_repo: Repository for facility geolocation data.
         - org_repo: Repository for organizations.
 
     Returns:
         ListOrganizationsInRadiusUseCase
     """
     return ListOrganizationsInRadiusUseCase(
-        facility_repo=facility_repo,
         org_repo=org_repo,
     )
 
 
 def list_orgs_in_rect_uc(
-    facility_repo=Depends(get_facility_repo),
     org_repo=Depends(get_org_repo),
 ):
     """
     Provide a use case for listing organizations within a rectangular area.
 
     Dependencies:
-        - facility_repo: Repository for facility geolocation data.
         - org_repo: Repository for organizations.
 
     Returns:
         ListOrganizationsInRectangleUseCase
     """
     return ListOrganizationsInRectangleUseCase(
-        facility_repo=facility_repo,
         org_repo=org_repo,
     )
 
@@ -162,6 +203,36 @@ def search_org_by_name_uc(
     return SearchOrganizationByNameUseCase(org_repo)
 
 
+def search_org_by_similarity_uc(
+    org_repo=Depends(get_org_repo),
+):
+    """
+    Provide a use case for ranked, typo-tolerant organization name search.
+
+    Dependencies:
+        - org_repo: Repository for organizations.
+
+    Returns:
+        SearchOrganizationsBySimilarityUseCase
+    """
+    return SearchOrganizationsBySimilarityUseCase(org_repo)
+
+
+def autocomplete_org_uc(
+    org_repo=Depends(get_org_repo),
+):
+    """
+    Provide a use case for suggesting organization names by prefix.
+
+    Dependencies:
+        - org_repo: Repository for organizations.
+
+    Returns:
+        AutocompleteOrganizationsUseCase
+    """
+    return AutocompleteOrganizationsUseCase(org_repo)
+
+
 # ------------------------------------------------------------------
 # Business Type Use Case Providers
 # ------------------------------------------------------------------
@@ -182,6 +253,131 @@ def get_bt_by_id_uc(
     return GetBusinessTypeByIdUseCase(bt_repo=bt_repo)
 
 
+def get_bts_by_ids_uc(
+    bt_repo=Depends(get_bt_repo),
+):
+    """
+    Provide a use case for retrieving several business types by ID at once.
+
+    Dependencies:
+        - bt_repo: Repository for business types.
+
+    Returns:
+        GetBusinessTypesByIdsUseCase
+    """
+    return GetBusinessTypesByIdsUseCase(bt_repo=bt_repo)
+
+
+def autocomplete_bt_uc(
+    bt_repo=Depends(get_bt_repo),
+):
+    """
+    Provide a use case for suggesting business types by name prefix.
+
+    Dependencies:
+        - bt_repo: Repository for business types.
+
+    Returns:
+        AutocompleteBusinessTypesUseCase
+    """
+    return AutocompleteBusinessTypesUseCase(bt_repo=bt_repo)
+
+
+def search_bt_by_name_uc(
+    bt_repo=Depends(get_bt_repo),
+):
+    """
+    Provide a use case for typo-tolerant business type search by name.
+
+    Dependencies:
+        - bt_repo: Repository for business types.
+
+    Returns:
+        SearchBusinessTypesByNameUseCase
+    """
+    return SearchBusinessTypesByNameUseCase(bt_repo=bt_repo)
+
+
+def get_bt_tree_uc(
+    bt_repo=Depends(get_bt_repo),
+):
+    """
+    Provide a use case for retrieving the whole business type hierarchy.
+
+    Dependencies:
+        - bt_repo: Repository for business types.
+
+    Returns:
+        GetBusinessTypeTreeUseCase
+    """
+    return GetBusinessTypeTreeUseCase(bt_repo=bt_repo)
+
+
+def get_bt_ancestors_uc(
+    bt_repo=Depends(get_bt_repo),
+):
+    """
+    Provide a use case for retrieving the root-to-node path of a business type.
+
+    Dependencies:
+        - bt_repo: Repository for business types.
+
+    Returns:
+        GetBusinessTypeAncestorsUseCase
+    """
+    return GetBusinessTypeAncestorsUseCase(bt_repo=bt_repo)
+
+
+def get_bt_ancestors_batch_uc(
+    bt_repo=Depends(get_bt_repo),
+):
+    """
+    Provide a use case for retrieving root-to-node paths of many business types.
+
+    Dependencies:
+        - bt_repo: Repository for business types.
+
+    Returns:
+        GetBusinessTypeAncestorsBatchUseCase
+    """
+    return GetBusinessTypeAncestorsBatchUseCase(bt_repo=bt_repo)
+
+
+def get_bt_subtree_uc(
+    bt_repo=Depends(get_bt_repo),
+):
+    """
+    Provide a use case for retrieving a depth-limited business type subtree.
+
+    Dependencies:
+        - bt_repo: Repository for business types.
+
+    Returns:
+        GetBusinessTypeSubtreeUseCase
+    """
+    return GetBusinessTypeSubtreeUseCase(bt_repo=bt_repo)
+
+
+def count_orgs_by_bt_uc(
+    org_repo=Depends(get_org_repo),
+    bt_repo=Depends(get_bt_repo),
+):
+    """
+    Provide a use case for counting organizations per business type.
+
+    Dependencies:
+        - org_repo: Repository for organizations.
+        - bt_repo: Repository for business types.
+
+    Returns:
+        CountOrganizationsByBusinessTypeUseCase
+    """
+    return CountOrganizationsByBusinessTypeUseCase(
+        org_repo=org_repo,
+        bt_repo=bt_repo,
+    )
+
+
 # ------------------------------------------------------------------
 # Facility Use Case Providers
 # ------------------------------------------------------------------
@@ -202,41 +398,50 @@ def get_facility_by_id_uc(
     return GetFacilityByIdUseCase(facility_repo=facility_repo)
 
 
-def get_orgs_in_proximity(
+def get_facilities_by_ids_uc(
     facility_repo=Depends(get_facility_repo),
+):
+    """
+    Provide a use case for retrieving several facilities by ID at once.
+
+    Dependencies:
+        - facility_repo: Repository for facilities.
+
+    Returns:
+        GetFacilitiesByIdsUseCase
+    """
+    return GetFacilitiesByIdsUseCase(facility_repo=facility_repo)
+
+
+def get_orgs_in_proximity(
     orgs_repo=Depends(get_org_repo),
 ):
     """
     Provide a use case for listing organizations near a given facility.
 
     Dependencies:
-        - facility_repo: Repository for facility geolocation data.
         - orgs_repo: Repository for organizations.
 
     Returns:
         ListOrganizationsInRadiusUseCase
     """
     return ListOrganizationsInRadiusUseCase(
-        facility_repo=facility_repo,
         org_repo=orgs_repo,
     )
 
 
 def get_orgs_in_rect(
-    facility_repo=Depends(get_facility_repo),
     orgs_repo=Depends(get_org_repo),
 ):
     """
     Provide a use case for listing organizations inside a rectangular area.
 
     Dependencies:
-        - facility_repo: Repository for facility geolocation data.
         - orgs_repo: Repository for organizations.
 
     Returns:
         ListOrganizationsInRectangleUseCase
     """
     return ListOrganizationsInRectangleUseCase(
-        facility_repo=facility_repo,
         org_repo=orgs_repo,
     )
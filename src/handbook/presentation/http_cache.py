@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+import hashlib
+from dataclasses import dataclass
+from typing import Awaitable, Callable
+
+from fastapi import Request, Response, status
+
+
+@dataclass(frozen=True, slots=True)
+class RenderedPayload:
+    version: int
+    body: bytes
+    etag: str
+
+    @classmethod
+    def render(cls, version: int, body: bytes) -> RenderedPayload:
+        digest = hashlib.sha256(body).hexdigest()[:32]
+        return cls(version=version, body=body, etag=f'"{digest}"')
+
+
+class RenderedCache:
+    """
+    Keeps the last rendered response body for one endpoint.
+
+    The body is rendered once per data version; later requests for the
+    same version reuse the bytes and their content-hash ETag.
+    """
+
+    def __init__(self) -> None:
+        self._payload: RenderedPayload | None = None
+
+    def get(self, version: int) -> RenderedPayload | None:
+        payload = self._payload
+        if payload is not None and payload.version == version:
+            return payload
+        return None
+
+    def put(self, version: int, body: bytes) -> RenderedPayload:
+        payload = RenderedPayload.render(version, body)
+        self._payload = payload
+        return payload
+
+    async def get_or_render(
+        self, version: int, render: Callable[[], Awaitable[bytes]]
+    ) -> RenderedPayload:
+        payload = self.get(version)
+        if payload is None:
+            payload = self.put(version, await render())
+        return payload
+
+    def clear(self) -> None:
+        self._payload = None
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Weak comparison of an If-None-Match header against `etag` (RFC 9110)."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    candidates = (tag.strip().removeprefix("W/") for tag in if_none_match.split(","))
+    return etag in candidates
+
+
+def conditional_json_response(request: Request, payload: RenderedPayload) -> Response:
+    """Serve `payload` as JSON, or 304 when the client already holds it."""
+    headers = {"ETag": payload.etag, "Cache-Control": "no-cache"}
+    if etag_matches(request.headers.get("if-none-match"), payload.etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(
+        content=payload.body, media_type="application/json", headers=headers
+    )
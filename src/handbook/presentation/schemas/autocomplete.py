@@ -0,0 +1,20 @@
+from pydantic import BaseModel, Field
+
+
+class AutocompleteQuery(BaseModel):
+    """Query parameters for name autocomplete."""
+
+    prefix: str = Field(
+        ...,
+        min_length=1,
+        max_length=100,
+        description="Case-insensitive start of the name.",
+        json_schema_extra={"example": "foo"},
+    )
+    limit: int = Field(
+        10,
+        ge=1,
+        le=50,
+        description="Maximum number of suggestions to return.",
+        json_schema_extra={"example": 10},
+    )
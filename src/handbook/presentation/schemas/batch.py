@@ -0,0 +1,17 @@
+from uuid import UUID
+
+from pydantic import BaseModel, Field
+
+MAX_BATCH_IDS = 100
+
+
+class BatchIdsRequest(BaseModel):
+    """Body of the multi-get endpoints."""
+
+    ids: list[UUID] = Field(
+        ...,
+        min_length=1,
+        max_length=MAX_BATCH_IDS,
+        description=f"UUIDs to fetch, at most {MAX_BATCH_IDS}; repeats count once.",
+        json_schema_extra={"example": ["11111111-1111-1111-1111-111111111111"]},
+    )
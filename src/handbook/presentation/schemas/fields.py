@@ -0,0 +1,59 @@
+from pydantic import BaseModel, Field
+
+from domain.val_objs.org_projection import (
+    ORGANIZATION_FIELDS,
+    ORGANIZATION_RELATIONS,
+    OrganizationProjection,
+)
+
+
+def _names(value: str, allowed: frozenset[str], what: str) -> frozenset[str]:
+    names = frozenset(part.strip() for part in value.split(",") if part.strip())
+    unknown = names - allowed
+    if unknown:
+        raise ValueError(f"Unknown {what}: {', '.join(sorted(unknown))}")
+    return names
+
+
+class OrganizationFieldsQuery(BaseModel):
+    """
+    Sparse fieldset parameters. Without either parameter the full
+    organization is returned; relations that are requested but not
+    expanded come back as `facility_id` / `business_type_ids`.
+    """
+
+    fields: str | None = Field(
+        None,
+        description=(
+            "Comma-separated fields to return, out of "
+            f"{', '.join(sorted(ORGANIZATION_FIELDS))}. Defaults to all."
+        ),
+        json_schema_extra={"example": "id,name"},
+    )
+    expand: str | None = Field(
+        None,
+        description=(
+            "Comma-separated relations to return in full, out of "
+            f"{', '.join(sorted(ORGANIZATION_RELATIONS))}; the others are "
+            "returned by ID. Defaults to all; pass it empty for none."
+        ),
+        json_schema_extra={"example": "facility"},
+    )
+
+    def to_projection(self) -> OrganizationProjection | None:
+        """None when the client asked for the full organization."""
+        if self.fields is None and self.expand is None:
+            return None
+
+        projection = OrganizationProjection()
+        fields = (
+            _names(self.fields, ORGANIZATION_FIELDS, "fields")
+            if self.fields is not None
+            else projection.fields
+        )
+        expand = (
+            _names(self.expand, ORGANIZATION_RELATIONS, "relations")
+            if self.expand is not None
+            else projection.expand
+        )
+        return OrganizationProjection(fields=fields, expand=expand)
@@ -0,0 +1,27 @@
+from pydantic import BaseModel, Field
+
+
+class FuzzySearchQuery(BaseModel):
+    """Query parameters for typo-tolerant name search."""
+
+    q: str = Field(
+        ...,
+        min_length=1,
+        max_length=100,
+        description="Name to look for; case and small typos are ignored.",
+        json_schema_extra={"example": "resturant"},
+    )
+    max_distance: int = Field(
+        2,
+        ge=0,
+        le=3,
+        description="Maximum number of edits between `q` and a matching name.",
+        json_schema_extra={"example": 2},
+    )
+    limit: int = Field(
+        10,
+        ge=1,
+        le=50,
+        description="Maximum number of results to return.",
+        json_schema_extra={"example": 10},
+    )
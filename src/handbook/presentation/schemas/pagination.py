@@ -0,0 +1,50 @@
+import base64
+import binascii
+import json
+from uuid import UUID
+
+from pydantic import BaseModel, Field
+
+from domain.exceptions.base import DomainTypeError
+from domain.val_objs.page import OrganizationCursor, PageRequest
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+def encode_cursor(cursor: OrganizationCursor) -> str:
+    raw = json.dumps([cursor.name, str(cursor.id)], ensure_ascii=False)
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(token: str) -> OrganizationCursor:
+    """Raises ValueError for anything `encode_cursor` did not produce."""
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        name, id_ = json.loads(base64.urlsafe_b64decode(padded))
+        return OrganizationCursor(name=name, id=UUID(id_))
+    except (binascii.Error, DomainTypeError, TypeError, ValueError):
+        raise ValueError("Invalid cursor") from None
+
+
+class PageQuery(BaseModel):
+    """
+    Keyset pagination parameters. Results are ordered by (name, id);
+    the cursor of the next page comes back in the X-Next-Cursor header.
+    """
+
+    limit: int = Field(
+        50,
+        ge=1,
+        le=500,
+        description="Maximum number of organizations to return.",
+        json_schema_extra={"example": 50},
+    )
+    cursor: str | None = Field(
+        None,
+        description="Opaque X-Next-Cursor value of the previous page.",
+        json_schema_extra={"example": None},
+    )
+
+    def to_page_request(self) -> PageRequest:
+        after = decode_cursor(self.cursor) if self.cursor else None
+        return PageRequest(limit=self.limit, after=after)
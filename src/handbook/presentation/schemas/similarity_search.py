@@ -0,0 +1,27 @@
+from pydantic import BaseModel, Field
+
+
+class SimilaritySearchQuery(BaseModel):
+    """Query parameters for ranked, trigram-based name search."""
+
+    q: str = Field(
+        ...,
+        min_length=1,
+        max_length=100,
+        description="Name to look for; case is ignored.",
+        json_schema_extra={"example": "cofee hous"},
+    )
+    threshold: float = Field(
+        0.3,
+        ge=0,
+        le=1,
+        description="Minimum trigram similarity between `q` and a matching name.",
+        json_schema_extra={"example": 0.3},
+    )
+    limit: int = Field(
+        10,
+        ge=1,
+        le=50,
+        description="Maximum number of results to return.",
+        json_schema_extra={"example": 10},
+    )
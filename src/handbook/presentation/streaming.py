@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+from typing import AsyncIterator, Callable, TypeVar
+
+from fastapi import Request
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+T = TypeVar("T")
+
+
+def wants_ndjson(request: Request) -> bool:
+    """Whether the client listed NDJSON among the media types it accepts."""
+    accept = request.headers.get("accept", "")
+    return any(
+        part.split(";", 1)[0].strip().lower() == NDJSON_MEDIA_TYPE
+        for part in accept.split(",")
+    )
+
+
+async def _lines(
+    items: AsyncIterator[T],
+    to_dto: Callable[[T], BaseModel],
+    exclude_unset: bool,
+) -> AsyncIterator[bytes]:
+    async for item in items:
+        line = to_dto(item).model_dump_json(exclude_unset=exclude_unset)
+        yield line.encode() + b"\n"
+
+
+def ndjson_response(
+    items: AsyncIterator[T],
+    to_dto: Callable[[T], BaseModel],
+    exclude_unset: bool = False,
+) -> StreamingResponse:
+    """
+    Serialize every item as one JSON line as soon as it is produced, so
+    neither the domain objects nor the body are held in memory at once.
+    """
+    return StreamingResponse(
+        _lines(items, to_dto, exclude_unset), media_type=NDJSON_MEDIA_TYPE
+    )
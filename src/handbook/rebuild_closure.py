@@ -0,0 +1,27 @@
+import asyncio
+
+from domain.exceptions.business_type_err import BusinessTypeHierarchyError
+from infra.db.closure_rebuild import rebuild_business_type_closure
+from infra.db.org_counts import rebuild_org_counts
+from infra.db.session import SessionLocal
+
+
+async def main() -> None:
+    async with SessionLocal() as session:
+        try:
+            report = await rebuild_business_type_closure(session)
+        except BusinessTypeHierarchyError as e:
+            raise SystemExit(f"closure not rebuilt: {e!r}") from e
+        count_rows = await rebuild_org_counts(session)
+        await session.commit()
+
+    print(f"business types:  {report.business_types}")
+    print(f"closure rows:    {report.closure_rows}")
+    print(f"build (CTE):     {report.build_seconds:.3f}s")
+    print(f"swap:            {report.swap_seconds:.3f}s")
+    print(f"total:           {report.total_seconds:.3f}s")
+    print(f"org count rows:  {count_rows}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
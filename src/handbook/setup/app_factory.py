@@ -4,7 +4,10 @@ from fastapi import Depends, FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from structlog import get_logger
 
+from infra.cache.business_type_tree import bt_tree_cache
+from infra.db.session import SessionLocal
 from presentation.router import api_router as router
+from presentation.schemas.pagination import NEXT_CURSOR_HEADER
 from setup.dependencies_g import require_api_key
 from setup.exceptions.handlers import register_exception_handlers
 
@@ -23,6 +26,7 @@ def create_app() -> FastAPI:
         allow_credentials=True,
         allow_methods=["*"],
         allow_headers=["*"],
+        expose_headers=[NEXT_CURSOR_HEADER],
     )
     register_exception_handlers(app)
     app.include_router(router, prefix="/v1/handbook")
@@ -35,6 +39,7 @@ async def lifespan(app: FastAPI):
     # init_logging()
     logger = get_logger()
     logger.info("app startup")
+    bt_tree_cache.configure(SessionLocal)
     # --- startup ---
 
     yield
@@ -2,6 +2,7 @@ import asyncio
 import os
 import pytest
 from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
+from infra.cache.business_type_tree import bt_tree_cache
 from infra.db.base import Base
 
 
@@ -42,3 +43,10 @@ async def db_session(test_engine):
     async with async_session() as session:
         yield session
         await session.rollback()
+
+
+@pytest.fixture(autouse=True)
+def reset_bt_tree_cache():
+    bt_tree_cache.clear()
+    yield
+    bt_tree_cache.clear()
@@ -0,0 +1,80 @@
+import uuid
+
+import pytest
+from sqlalchemy import insert, select
+
+from domain.exceptions.business_type_err import BusinessTypeHierarchyError
+from infra.db.closure_rebuild import rebuild_business_type_closure
+from infra.db.models.business_type import BusinessTypeModel
+from infra.db.models.business_type_closure import BusinessTypeClosureModel
+
+
+@pytest.mark.asyncio
+async def test_rebuild_closure_from_parent_ids(db_session):
+    root, child, grand, other = (uuid.uuid4() for _ in range(4))
+
+    await db_session.execute(
+        insert(BusinessTypeModel),
+        [
+            {"id": root, "name": "Root", "parent_id": None},
+            {"id": child, "name": "Child", "parent_id": root},
+            {"id": grand, "name": "Grand", "parent_id": child},
+            {"id": other, "name": "Other", "parent_id": None},
+        ],
+    )
+    # stale row that the rebuild must drop
+    await db_session.execute(
+        insert(BusinessTypeClosureModel),
+        [{"ancestor_id": other, "descendant_id": grand, "depth": 1}],
+    )
+
+    report = await rebuild_business_type_closure(db_session)
+    await db_session.commit()
+
+    result = await db_session.execute(
+        select(
+            BusinessTypeClosureModel.ancestor_id,
+            BusinessTypeClosureModel.descendant_id,
+            BusinessTypeClosureModel.depth,
+        )
+    )
+    rows = set(result.all())
+
+    assert rows == {
+        (root, root, 0),
+        (child, child, 0),
+        (grand, grand, 0),
+        (other, other, 0),
+        (root, child, 1),
+        (child, grand, 1),
+        (root, grand, 2),
+    }
+    assert report.business_types == 4
+    assert report.closure_rows == 7
+    assert report.total_seconds >= 0
+
+
+@pytest.mark.asyncio
+async def test_rebuild_closure_fails_on_parent_cycle(db_session):
+    root, a, b = (uuid.uuid4() for _ in range(3))
+
+    await db_session.execute(
+        insert(BusinessTypeModel),
+        [
+            {"id": root, "name": "Root", "parent_id": None},
+            {"id": a, "name": "A", "parent_id": b},
+            {"id": b, "name": "B", "parent_id": a},
+        ],
+    )
+    await db_session.execute(
+        insert(BusinessTypeClosureModel),
+        [{"ancestor_id": root, "descendant_id": root, "depth": 0}],
+    )
+
+    with pytest.raises(BusinessTypeHierarchyError) as exc:
+        await rebuild_business_type_closure(db_session)
+
+    assert set(exc.value.context["business_type_ids"]) == {str(a), str(b)}
+    # the live closure is left as it was
+    rows = (await db_session.execute(select(BusinessTypeClosureModel.depth))).all()
+    assert len(rows) == 1
@@ -0,0 +1,44 @@
+import pytest
+from sqlalchemy import select, update
+
+from infra.db.models.business_type_org_count import BusinessTypeOrgCountModel
+from infra.db.org_counts import rebuild_org_counts
+from infra.repositories.business_type_repo_impl import BusinessTypeRepositoryImpl
+from infra.repositories.facility_repo_impl import FacilityRepositoryImpl
+from infra.repositories.organization_repo_impl import OrganizationRepositoryImpl
+
+from tests.integration.fixtures import make_bt, make_facility, make_org
+
+
+@pytest.mark.asyncio
+async def test_rebuild_org_counts_from_links(db_session):
+    fac = make_facility("HQ")
+    root = make_bt("Food")
+    child = make_bt("Meat", parent=root)
+
+    await FacilityRepositoryImpl(db_session).save(fac)
+    bt_repo = BusinessTypeRepositoryImpl(db_session)
+    await bt_repo.save(root)
+    await bt_repo.save(child)
+    await db_session.commit()
+
+    org_repo = OrganizationRepositoryImpl(db_session)
+    await org_repo.save(make_org("O001", fac, root, child))
+    await db_session.commit()
+
+    # drift the table so the rebuild has something to fix
+    await db_session.execute(update(BusinessTypeOrgCountModel).values(total_count=7))
+
+    rows = await rebuild_org_counts(db_session)
+    await db_session.commit()
+
+    m = BusinessTypeOrgCountModel
+    result = await db_session.execute(
+        select(m.business_type_id, m.direct_count, m.total_count)
+    )
+
+    assert rows == 2
+    assert set(result.all()) == {
+        (root.id.value, 1, 1),
+        (child.id.value, 1, 1),
+    }
@@ -1,4 +1,12 @@
 import pytest
+from sqlalchemy import select
+
+from domain.entities.business_type import BusinessType
+from domain.exceptions.base import DomainResourceNotFoundError
+from domain.exceptions.business_type_err import BusinessTypeHierarchyError
+from domain.val_objs.business_name import BusinessName
+from infra.cache.business_type_tree import bt_tree_cache
+from infra.db.models.business_type_closure import BusinessTypeClosureModel
 from infra.repositories.business_type_repo_impl import BusinessTypeRepositoryImpl
 
 from tests.integration.fixtures import make_bt
@@ -29,6 +37,38 @@ async def test_bt_get_by_name(db_session):
     assert loaded.name.value == "Coffee"
 
 
+@pytest.mark.asyncio
+async def test_bt_get_by_name_ignores_case_and_prefix(db_session):
+    repo = BusinessTypeRepositoryImpl(db_session)
+
+    await repo.save(make_bt("Coffee"))
+    await repo.save(make_bt("Cola"))
+    await repo.save(make_bt("Tea Shops"))
+    await db_session.commit()
+
+    loaded = await repo.get_by_name(BusinessName("coffee"))
+    assert loaded.name.value == "Coffee"
+
+    result = await repo.list_by_name_prefix("CO", 10)
+    assert [bt.name.value for bt in result] == ["Coffee", "Cola"]
+
+
+@pytest.mark.asyncio
+async def test_bt_search_by_name_tolerates_typos(db_session):
+    repo = BusinessTypeRepositoryImpl(db_session)
+
+    await repo.save(make_bt("Coffee"))
+    await repo.save(make_bt("Toffee"))
+    await repo.save(make_bt("Tea Shops"))
+    await db_session.commit()
+
+    result = await repo.search_by_name("cofee", 2, 10)
+    assert [bt.name.value for bt in result] == ["Coffee", "Toffee"]
+
+    result = await repo.search_by_name("cofee", 2, 1)
+    assert [bt.name.value for bt in result] == ["Coffee"]
+
+
 @pytest.mark.asyncio
 async def test_bt_list_all(db_session):
     repo = BusinessTypeRepositoryImpl(db_session)
@@ -86,6 +126,34 @@ async def test_bt_descendants(db_session):
     assert names == {"C1aa", "C2aa"}
 
 
+@pytest.mark.asyncio
+async def test_bt_save_writes_closure_rows(db_session):
+    repo = BusinessTypeRepositoryImpl(db_session)
+
+    root = make_bt("Root")
+    child = make_bt("Child", parent=root)
+    grand = make_bt("Grand", parent=child)
+
+    await repo.save(root)
+    await repo.save(child)
+    await repo.save(grand)
+    await repo.save(grand)
+    await db_session.commit()
+
+    result = await db_session.execute(
+        select(
+            BusinessTypeClosureModel.ancestor_id,
+            BusinessTypeClosureModel.depth,
+        ).where(BusinessTypeClosureModel.descendant_id == grand.id.value)
+    )
+
+    assert sorted(result.all(), key=lambda r: r.depth) == [
+        (grand.id.value, 0),
+        (child.id.value, 1),
+        (root.id.value, 2),
+    ]
+
+
 @pytest.mark.asyncio
 async def test_bt_delete(db_session):
     repo = BusinessTypeRepositoryImpl(db_session)
@@ -99,3 +167,180 @@ async def test_bt_delete(db_session):
 
     with pytest.raises(Exception):
         await repo.get_by_id(bt.id)
+
+
+@pytest.mark.asyncio
+async def test_bt_reads_share_snapshot_until_commit(db_session):
+    repo = BusinessTypeRepositoryImpl(db_session)
+
+    root = make_bt("Root")
+    await repo.save(root)
+    await db_session.commit()
+
+    first = await repo.get_by_id(root.id)
+    assert await repo.get_by_id(root.id) is first
+
+    child = make_bt("Child", parent=root)
+    await repo.save(child)
+    assert {c.name.value for c in await repo.list_children(root)} == set()
+
+    await db_session.commit()
+
+    children = await repo.list_children(root)
+    assert {c.name.value for c in children} == {"Child"}
+    assert await repo.get_by_id(root.id) is not first
+
+
+@pytest.mark.asyncio
+async def test_bt_data_version_changes_after_commit(db_session):
+    repo = BusinessTypeRepositoryImpl(db_session)
+
+    before = await repo.data_version()
+    assert await repo.data_version() == before
+
+    await repo.save(make_bt("Root"))
+    await db_session.commit()
+
+    assert await repo.data_version() != before
+
+
+@pytest.mark.asyncio
+async def test_bt_uncommitted_rows_never_become_current(db_session):
+    repo = BusinessTypeRepositoryImpl(db_session)
+
+    root = make_bt("Root")
+    await repo.save(root)
+    before = await repo.data_version()
+
+    # the writing session sees its own row, nobody else gets that snapshot
+    assert await repo.get_by_id(root.id) is not None
+    assert bt_tree_cache._current() is None
+
+    await db_session.rollback()
+
+    assert await repo.data_version() != before
+    with pytest.raises(DomainResourceNotFoundError):
+        await repo.get_by_id(root.id)
+
+
+@pytest.mark.asyncio
+async def test_bt_list_paths(db_session):
+    repo = BusinessTypeRepositoryImpl(db_session)
+
+    root = make_bt("Root")
+    child = make_bt("Child", parent=root)
+    grand = make_bt("Grand", parent=child)
+    for bt in (root, child, grand):
+        await repo.save(bt)
+    await db_session.commit()
+
+    missing = make_bt("Missing")
+    paths = await repo.list_paths([grand.id, root.id, missing.id])
+
+    assert [bt.name.value for bt in paths[grand.id]] == ["Root", "Child", "Grand"]
+    assert [bt.name.value for bt in paths[root.id]] == ["Root"]
+    assert missing.id not in paths
+
+
+@pytest.mark.asyncio
+async def test_bt_get_subtree_limits_depth(db_session):
+    repo = BusinessTypeRepositoryImpl(db_session)
+
+    root = make_bt("Root")
+    child = make_bt("Child", parent=root)
+    grand = make_bt("Grand", parent=child)
+    for bt in (root, child, grand):
+        await repo.save(bt)
+    await db_session.commit()
+
+    shallow = await repo.get_subtree(child.id, max_depth=0)
+    assert shallow.parent is None
+    assert shallow.children == ()
+
+    full = await repo.get_subtree(root.id)
+    assert [c.name.value for c in full.children] == ["Child"]
+    assert [g.name.value for g in full.children[0].children] == ["Grand"]
+
+    limited = await repo.get_subtree(root.id, max_depth=1)
+    assert limited.children[0].children == ()
+
+
+async def closure_of(db_session, bt):
+    result = await db_session.execute(
+        select(
+            BusinessTypeClosureModel.ancestor_id,
+            BusinessTypeClosureModel.depth,
+        ).where(BusinessTypeClosureModel.descendant_id == bt.id.value)
+    )
+    return sorted(result.all(), key=lambda r: r.depth)
+
+
+@pytest.mark.asyncio
+async def test_bt_reparent_moves_closure_rows(db_session):
+    repo = BusinessTypeRepositoryImpl(db_session)
+
+    root1 = make_bt("Root1")
+    root2 = make_bt("Root2")
+    child = make_bt("Child", parent=root1)
+    grand = make_bt("Grand", parent=child)
+
+    for bt in (root1, root2, child, grand):
+        await repo.save(bt)
+    await db_session.commit()
+
+    child.set_parent(root2)
+    await repo.save(child)
+    await db_session.commit()
+
+    assert await closure_of(db_session, grand) == [
+        (grand.id.value, 0),
+        (child.id.value, 1),
+        (root2.id.value, 2),
+    ]
+    assert await repo.list_descendants(root1) == []
+    assert {d.name.value for d in await repo.list_descendants(root2)} == {
+        "Child",
+        "Grand",
+    }
+
+
+@pytest.mark.asyncio
+async def test_bt_reparent_rejects_cycle_from_stale_entity(db_session):
+    repo = BusinessTypeRepositoryImpl(db_session)
+
+    root = make_bt("Root")
+    child = make_bt("Child", parent=root)
+    await repo.save(root)
+    await repo.save(child)
+    await db_session.commit()
+
+    # A detached copy of root that does not know about its child.
+    stale_root = BusinessType(root.id, root.name)
+    stale_child = BusinessType(child.id, child.name)
+    stale_root.set_parent(stale_child)
+
+    with pytest.raises(BusinessTypeHierarchyError):
+        await repo.save(stale_root)
+
+
+@pytest.mark.asyncio
+async def test_bt_delete_removes_subtree_closure_rows(db_session):
+    repo = BusinessTypeRepositoryImpl(db_session)
+
+    root = make_bt("Root")
+    child = make_bt("Child", parent=root)
+    grand = make_bt("Grand", parent=child)
+
+    for bt in (root, child, grand):
+        await repo.save(bt)
+    await db_session.commit()
+
+    await repo.delete(child)
+    await db_session.commit()
+
+    result = await db_session.execute(select(BusinessTypeClosureModel))
+    rows = result.scalars().all()
+
+    assert [(r.ancestor_id, r.descendant_id) for r in rows] == [
+        (root.id.value, root.id.value)
+    ]
@@ -87,3 +87,18 @@ async def test_facility_list_in_rectangle(db_session):
 
     names = {f.address.address for f in result}
     assert names == {"Inside"}
+
+
+@pytest.mark.asyncio
+async def test_facility_list_by_ids(db_session):
+    repo = FacilityRepositoryImpl(db_session)
+
+    f1 = make_facility("AAAAA")
+    f2 = make_facility("BBBBB")
+    await repo.save(f1)
+    await repo.save(f2)
+    await db_session.commit()
+
+    result = await repo.list_by_ids([f2.id])
+
+    assert [f.address.address for f in result] == ["BBBBB"]
@@ -1,5 +1,10 @@
 import pytest
+from sqlalchemy import event
 
+from domain.val_objs.org_projection import OrganizationProjection
+from domain.val_objs.page import OrganizationCursor, PageRequest
+
+from infra.cache.org_name_prefix import OrganizationNamePrefixCache
 from infra.repositories.organization_repo_impl import OrganizationRepositoryImpl
 from infra.repositories.facility_repo_impl import FacilityRepositoryImpl
 from infra.repositories.business_type_repo_impl import BusinessTypeRepositoryImpl
@@ -78,6 +83,84 @@ async def test_org_list_by_facility(db_session):
     assert names == {"O001", "O002"}
 
 
+@pytest.mark.asyncio
+async def test_org_list_by_facilities(db_session):
+    org_repo = OrganizationRepositoryImpl(db_session)
+    fac_repo = FacilityRepositoryImpl(db_session)
+
+    fac1 = make_facility("A")
+    fac2 = make_facility("B")
+    fac3 = make_facility("C")
+
+    for fac in (fac1, fac2, fac3):
+        await fac_repo.save(fac)
+    await db_session.commit()
+
+    await org_repo.save(make_org("O001", fac1))
+    await org_repo.save(make_org("O002", fac2))
+    await org_repo.save(make_org("O003", fac3))
+    await db_session.commit()
+
+    result = await org_repo.list_by_facilities([fac1.id, fac2.id])
+    names = {o.name.value for o in result}
+
+    assert names == {"O001", "O002"}
+    assert await org_repo.list_by_facilities([]) == []
+
+
+@pytest.mark.asyncio
+async def test_org_list_in_radius_attaches_facility(db_session):
+    org_repo = OrganizationRepositoryImpl(db_session)
+    fac_repo = FacilityRepositoryImpl(db_session)
+    bt_repo = BusinessTypeRepositoryImpl(db_session)
+
+    near = make_facility("Near", lat="0.001", lon="0.001")
+    far = make_facility("Far", lat="1", lon="1")
+    bt = make_bt("Food")
+
+    await fac_repo.save(near)
+    await fac_repo.save(far)
+    await bt_repo.save(bt)
+    await db_session.commit()
+
+    await org_repo.save(make_org("NearOrg", near, bt))
+    await org_repo.save(make_org("FarOrg", far, bt))
+    await db_session.commit()
+
+    center = make_facility(lat="0", lon="0").coordinates
+    (org,) = await org_repo.list_in_radius(center, radius_meters=500)
+
+    assert org.name.value == "NearOrg"
+    assert org.facility.address.address == "Near"
+    assert [b.name.value for b in org.business_types] == ["Food"]
+
+
+@pytest.mark.asyncio
+async def test_org_list_in_rectangle(db_session):
+    org_repo = OrganizationRepositoryImpl(db_session)
+    fac_repo = FacilityRepositoryImpl(db_session)
+
+    inside = make_facility("Inside", lat="10", lon="20")
+    outside = make_facility("Outside", lat="50", lon="50")
+
+    await fac_repo.save(inside)
+    await fac_repo.save(outside)
+    await db_session.commit()
+
+    await org_repo.save(make_org("Alpha", inside))
+    await org_repo.save(make_org("Beta", inside))
+    await org_repo.save(make_org("Gamma", outside))
+    await db_session.commit()
+
+    result = await org_repo.list_in_rectangle(
+        make_facility(lat="9", lon="19").coordinates,
+        make_facility(lat="11", lon="21").coordinates,
+    )
+
+    assert {o.name.value for o in result} == {"Alpha", "Beta"}
+    assert {o.facility.address.address for o in result} == {"Inside"}
+
+
 @pytest.mark.asyncio
 async def test_org_list_by_business_type(db_session):
     org_repo = OrganizationRepositoryImpl(db_session)
@@ -154,3 +237,515 @@ async def test_org_search_by_name(db_session):
     names = {o.name.value for o in result}
 
     assert names == {"Coffee House"}
+
+
+@pytest.mark.asyncio
+async def test_org_list_by_business_type_recursive(db_session):
+    org_repo = OrganizationRepositoryImpl(db_session)
+    fac_repo = FacilityRepositoryImpl(db_session)
+    bt_repo = BusinessTypeRepositoryImpl(db_session)
+
+    fac = make_facility("HQ")
+    root = make_bt("Food")
+    child = make_bt("Meat", parent=root)
+    other = make_bt("Tech")
+
+    await fac_repo.save(fac)
+    await bt_repo.save(root)
+    await bt_repo.save(child)
+    await bt_repo.save(other)
+    await db_session.commit()
+
+    o1 = make_org("O001", fac, root)
+    o2 = make_org("O002", fac, child)
+    o3 = make_org("O003", fac, other)
+    o4 = make_org("O004", fac, root, child)
+
+    for org in (o1, o2, o3, o4):
+        await org_repo.save(org)
+    await db_session.commit()
+
+    result = await org_repo.list_by_business_type_recursive(root)
+    names = [o.name.value for o in result]
+
+    assert sorted(names) == ["O001", "O002", "O004"]
+
+
+@pytest.mark.asyncio
+async def test_org_list_shares_business_type_instances(db_session):
+    org_repo = OrganizationRepositoryImpl(db_session)
+    fac_repo = FacilityRepositoryImpl(db_session)
+    bt_repo = BusinessTypeRepositoryImpl(db_session)
+
+    fac = make_facility("HQ")
+    root = make_bt("Food")
+    child = make_bt("Meat", parent=root)
+
+    await fac_repo.save(fac)
+    await bt_repo.save(root)
+    await bt_repo.save(child)
+    await db_session.commit()
+
+    await org_repo.save(make_org("O001", fac, child))
+    await org_repo.save(make_org("O002", fac, child))
+    await db_session.commit()
+
+    first, second = await org_repo.list_by_facility(fac)
+
+    assert first.business_types[0] is second.business_types[0]
+    assert first.business_types[0].parent.id == root.id
+
+
+@pytest.mark.asyncio
+async def test_org_with_hierarchy_uses_tree_snapshot(db_session):
+    fac_repo = FacilityRepositoryImpl(db_session)
+    bt_repo = BusinessTypeRepositoryImpl(db_session)
+
+    fac = make_facility("HQ")
+    root = make_bt("Food")
+    child = make_bt("Meat", parent=root)
+    grand = make_bt("Beef", parent=child)
+
+    await fac_repo.save(fac)
+    for bt in (root, child, grand):
+        await bt_repo.save(bt)
+    await db_session.commit()
+
+    org = make_org("O001", fac, child)
+    await OrganizationRepositoryImpl(db_session).save(org)
+    await db_session.commit()
+
+    slim = await OrganizationRepositoryImpl(db_session).get_by_id(org.id)
+    assert slim.business_types[0].parent.id == root.id
+    assert slim.business_types[0].children == ()
+
+    full = await OrganizationRepositoryImpl(db_session, with_hierarchy=True).get_by_id(
+        org.id
+    )
+    assert full.business_types[0] is await bt_repo.get_by_id(child.id)
+    assert [c.id for c in full.business_types[0].children] == [grand.id]
+
+
+def totals(counts):
+    return {bt_id.value: (c.direct, c.total) for bt_id, c in counts.items()}
+
+
+@pytest.mark.asyncio
+async def test_org_counts_follow_link_changes(db_session):
+    org_repo = OrganizationRepositoryImpl(db_session)
+    fac_repo = FacilityRepositoryImpl(db_session)
+    bt_repo = BusinessTypeRepositoryImpl(db_session)
+
+    fac = make_facility("HQ")
+    root = make_bt("Food")
+    child = make_bt("Meat", parent=root)
+    other = make_bt("Tech")
+
+    await fac_repo.save(fac)
+    for bt in (root, child, other):
+        await bt_repo.save(bt)
+    await db_session.commit()
+
+    both = make_org("O001", fac, root, child)
+    meat = make_org("O002", fac, child)
+    await org_repo.save(both)
+    await org_repo.save(meat)
+    await db_session.commit()
+
+    counts = totals(await org_repo.count_by_business_type())
+    assert counts[root.id.value] == (1, 2)
+    assert counts[child.id.value] == (2, 2)
+    assert counts[other.id.value] == (0, 0)
+
+    meat.add_business_type(other)
+    meat.remove_business_type(child)
+    await org_repo.save(meat)
+    await org_repo.delete(both)
+    await db_session.commit()
+
+    counts = totals(await org_repo.count_by_business_type())
+    assert counts[root.id.value] == (0, 0)
+    assert counts[other.id.value] == (1, 1)
+
+    subtree = totals(await org_repo.count_by_business_type(root))
+    assert set(subtree) == {root.id.value, child.id.value}
+
+
+@pytest.mark.asyncio
+async def test_org_counts_follow_reparenting(db_session):
+    org_repo = OrganizationRepositoryImpl(db_session)
+    fac_repo = FacilityRepositoryImpl(db_session)
+    bt_repo = BusinessTypeRepositoryImpl(db_session)
+
+    fac = make_facility("HQ")
+    food = make_bt("Food")
+    tech = make_bt("Tech")
+    meat = make_bt("Meat", parent=food)
+
+    await fac_repo.save(fac)
+    for bt in (food, tech, meat):
+        await bt_repo.save(bt)
+    await db_session.commit()
+
+    await org_repo.save(make_org("O001", fac, meat))
+    await db_session.commit()
+
+    meat.set_parent(tech)
+    await bt_repo.save(meat)
+    await db_session.commit()
+
+    counts = totals(await org_repo.count_by_business_type())
+    assert counts[food.id.value] == (0, 0)
+    assert counts[tech.id.value] == (0, 1)
+
+
+@pytest.mark.asyncio
+async def test_org_counts_add_missing_rows_once(db_session):
+    org_repo = OrganizationRepositoryImpl(db_session)
+    fac_repo = FacilityRepositoryImpl(db_session)
+
+    fac = make_facility("HQ")
+    await fac_repo.save(fac)
+    await db_session.commit()
+
+    # created through the organization's cascade: no count row yet
+    bt = make_bt("Food")
+    org = make_org("O001", fac, bt)
+    await org_repo.save(org)
+    await db_session.commit()
+
+    assert totals(await org_repo.count_by_business_type())[bt.id.value][0] == 1
+
+    await org_repo.delete(org)
+    await db_session.commit()
+
+    assert totals(await org_repo.count_by_business_type())[bt.id.value][0] == 0
+
+
+@pytest.mark.asyncio
+async def test_org_search_pages_by_name_then_id(db_session):
+    org_repo = OrganizationRepositoryImpl(db_session)
+    fac_repo = FacilityRepositoryImpl(db_session)
+
+    fac = make_facility("HQ")
+    await fac_repo.save(fac)
+    await db_session.commit()
+
+    names = ["Delta", "Alpha", "Charlie", "Bravo", "Alpha"]
+    orgs = [make_org(name, fac) for name in names]
+    for org in orgs:
+        await org_repo.save(org)
+    await db_session.commit()
+
+    seen = []
+    page = PageRequest(limit=2)
+    while True:
+        batch = await org_repo.search_by_name("a", page)
+        seen.extend(batch)
+        if len(batch) < page.limit:
+            break
+        page = PageRequest(limit=2, after=OrganizationCursor.of(batch[-1]))
+
+    expected = sorted(orgs, key=lambda o: (o.name.value, o.id.value))
+    assert [o.id for o in seen] == [o.id for o in expected]
+
+
+@pytest.mark.asyncio
+async def test_org_list_in_rectangle_limits_organizations_not_rows(db_session):
+    org_repo = OrganizationRepositoryImpl(db_session)
+    fac_repo = FacilityRepositoryImpl(db_session)
+
+    fac = make_facility("Inside", lat="10", lon="20")
+    await fac_repo.save(fac)
+    await db_session.commit()
+
+    for name in ("Alpha", "Bravo", "Charlie"):
+        await org_repo.save(make_org(name, fac, make_bt(), make_bt()))
+    await db_session.commit()
+
+    result = await org_repo.list_in_rectangle(
+        make_facility(lat="9", lon="19").coordinates,
+        make_facility(lat="11", lon="21").coordinates,
+        PageRequest(limit=2),
+    )
+
+    assert [o.name.value for o in result] == ["Alpha", "Bravo"]
+    assert all(len(o.business_types) == 2 for o in result)
+
+
+@pytest.mark.asyncio
+async def test_org_stream_search_by_name(db_session):
+    org_repo = OrganizationRepositoryImpl(db_session)
+    fac_repo = FacilityRepositoryImpl(db_session)
+
+    fac = make_facility("HQ")
+    await fac_repo.save(fac)
+    await db_session.commit()
+
+    for name in ("Charlie", "Alpha", "Bravo", "Zulu"):
+        await org_repo.save(make_org(name, fac, make_bt(), make_bt()))
+    await db_session.commit()
+
+    streamed = [org async for org in org_repo.stream_search_by_name("a")]
+
+    assert [o.name.value for o in streamed] == ["Alpha", "Bravo", "Charlie"]
+    assert all(o.facility.address.address == "HQ" for o in streamed)
+    assert all(len(o.business_types) == 2 for o in streamed)
+
+
+@pytest.mark.asyncio
+async def test_org_stream_in_rectangle(db_session):
+    org_repo = OrganizationRepositoryImpl(db_session)
+    fac_repo = FacilityRepositoryImpl(db_session)
+
+    inside = make_facility("Inside", lat="10", lon="20")
+    outside = make_facility("Outside", lat="50", lon="50")
+    await fac_repo.save(inside)
+    await fac_repo.save(outside)
+    await db_session.commit()
+
+    await org_repo.save(make_org("Bravo", inside))
+    await org_repo.save(make_org("Alpha", inside))
+    await org_repo.save(make_org("Gamma", outside))
+    await db_session.commit()
+
+    streamed = org_repo.stream_in_rectangle(
+        make_facility(lat="9", lon="19").coordinates,
+        make_facility(lat="11", lon="21").coordinates,
+    )
+
+    assert [o.name.value async for o in streamed] == ["Alpha", "Bravo"]
+
+
+@pytest.mark.asyncio
+async def test_org_search_by_similarity(db_session):
+    org_repo = OrganizationRepositoryImpl(db_session)
+    fac_repo = FacilityRepositoryImpl(db_session)
+
+    fac = make_facility("HQ")
+    await fac_repo.save(fac)
+    await db_session.commit()
+
+    for name in ("Coffee Shop", "Bakery", "Coffee House"):
+        await org_repo.save(make_org(name, fac))
+    await db_session.commit()
+
+    result = await org_repo.search_by_similarity("cofee hous", 0.2, 10)
+
+    assert [o.name.value for o in result] == ["Coffee House", "Coffee Shop"]
+    assert result[0].facility.address.address == "HQ"
+
+
+@pytest.mark.asyncio
+async def test_org_search_by_name_treats_wildcards_literally(db_session):
+    org_repo = OrganizationRepositoryImpl(db_session)
+    fac_repo = FacilityRepositoryImpl(db_session)
+
+    fac = make_facility("HQ")
+    await fac_repo.save(fac)
+    await db_session.commit()
+
+    await org_repo.save(make_org("Alpha", fac))
+    await org_repo.save(make_org("Beta_Gamma", fac))
+    await db_session.commit()
+
+    assert await org_repo.search_by_name("%") == []
+    assert [o.name.value for o in await org_repo.search_by_name("a_g")] == [
+        "Beta_Gamma"
+    ]
+
+
+@pytest.mark.asyncio
+async def test_org_list_names_by_prefix(db_session):
+    org_repo = OrganizationRepositoryImpl(
+        db_session, name_cache=OrganizationNamePrefixCache()
+    )
+    fac_repo = FacilityRepositoryImpl(db_session)
+
+    fac = make_facility("HQ")
+    await fac_repo.save(fac)
+    await db_session.commit()
+
+    for name in ("beta_gamma", "Betamax", "Alpha", "Beta"):
+        await org_repo.save(make_org(name, fac))
+    await db_session.commit()
+
+    result = await org_repo.list_names_by_prefix("BETA", 10)
+    assert [s.name for s in result] == ["Beta", "beta_gamma", "Betamax"]
+    assert [s.name for s in await org_repo.list_names_by_prefix("beta_", 10)] == [
+        "beta_gamma"
+    ]
+    assert len(await org_repo.list_names_by_prefix("b", 2)) == 2
+
+
+@pytest.mark.asyncio
+async def test_org_list_names_by_prefix_is_cached_until_a_write(db_session):
+    cache = OrganizationNamePrefixCache()
+    org_repo = OrganizationRepositoryImpl(db_session, name_cache=cache)
+    fac_repo = FacilityRepositoryImpl(db_session)
+
+    fac = make_facility("HQ")
+    await fac_repo.save(fac)
+    await org_repo.save(make_org("Alpha", fac))
+    await db_session.commit()
+
+    first = await org_repo.list_names_by_prefix("al", 10)
+    assert await org_repo.list_names_by_prefix(" AL", 10) is first
+
+    await org_repo.save(make_org("Alps", fac))
+    # cleared on commit, not before: a reader filling the cache in between
+    # would otherwise leave the old answer there
+    assert await org_repo.list_names_by_prefix("al", 10) is first
+    await db_session.commit()
+
+    assert [s.name for s in await org_repo.list_names_by_prefix("al", 10)] == [
+        "Alpha",
+        "Alps",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_org_list_names_by_prefix_does_not_casefold(db_session):
+    org_repo = OrganizationRepositoryImpl(
+        db_session, name_cache=OrganizationNamePrefixCache()
+    )
+    fac_repo = FacilityRepositoryImpl(db_session)
+
+    fac = make_facility("HQ")
+    await fac_repo.save(fac)
+    await org_repo.save(make_org("Straße", fac))
+    await org_repo.save(make_org("Strasse", fac))
+    await db_session.commit()
+
+    assert [s.name for s in await org_repo.list_names_by_prefix("straß", 10)] == [
+        "Straße"
+    ]
+    assert [s.name for s in await org_repo.list_names_by_prefix("STRASS", 10)] == [
+        "Strasse"
+    ]
+
+
+@pytest.mark.asyncio
+async def test_org_list_by_ids(db_session):
+    org_repo = OrganizationRepositoryImpl(db_session)
+    fac_repo = FacilityRepositoryImpl(db_session)
+
+    fac = make_facility("HQ")
+    await fac_repo.save(fac)
+    await db_session.commit()
+
+    alpha = make_org("Alpha", fac)
+    beta = make_org("Beta", fac)
+    await org_repo.save(alpha)
+    await org_repo.save(beta)
+    await org_repo.save(make_org("Gamma", fac))
+    await db_session.commit()
+
+    result = await org_repo.list_by_ids([beta.id, alpha.id, beta.id])
+
+    assert sorted(o.name.value for o in result) == ["Alpha", "Beta"]
+    assert all(o.facility.address.address == "HQ" for o in result)
+    assert all(len(o.phone_numbers) == 1 for o in result)
+    assert await org_repo.list_by_ids([]) == []
+
+
+@pytest.mark.asyncio
+async def test_org_view_of_id_and_name_selects_two_columns(db_session, test_engine):
+    org_repo = OrganizationRepositoryImpl(db_session)
+    fac_repo = FacilityRepositoryImpl(db_session)
+
+    fac = make_facility("HQ")
+    await fac_repo.save(fac)
+    await db_session.commit()
+    await org_repo.save(make_org("Beta", fac))
+    await org_repo.save(make_org("Alpha", fac))
+    await db_session.commit()
+
+    statements = []
+
+    def capture(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    event.listen(test_engine.sync_engine, "before_cursor_execute", capture)
+    try:
+        views = await org_repo.view_search_by_name(
+            "a", OrganizationProjection(fields=frozenset({"id", "name"}))
+        )
+    finally:
+        event.remove(test_engine.sync_engine, "before_cursor_execute", capture)
+
+    assert [v.name.value for v in views] == ["Alpha", "Beta"]
+    assert views[0].phone_numbers is None and views[0].facility is None
+    assert len(statements) == 1
+    columns = statements[0].split("FROM")[0]
+    assert columns.count(",") == 1
+    assert "organization.id" in columns and "organization.name" in columns
+
+
+@pytest.mark.asyncio
+async def test_org_view_expands_only_requested_relations(db_session):
+    org_repo = OrganizationRepositoryImpl(db_session)
+    fac_repo = FacilityRepositoryImpl(db_session)
+    bt_repo = BusinessTypeRepositoryImpl(db_session)
+
+    fac = make_facility("HQ")
+    bt = make_bt("Food")
+    await fac_repo.save(fac)
+    await bt_repo.save(bt)
+    await db_session.commit()
+    org = make_org("Alpha", fac, bt)
+    await org_repo.save(org)
+    await db_session.commit()
+
+    projection = OrganizationProjection(
+        fields=frozenset({"id", "phones", "facility", "business_types"}),
+        expand=frozenset({"facility"}),
+    )
+    (view,) = await org_repo.view_by_ids([org.id], projection)
+
+    assert view.facility.address.address == "HQ"
+    assert view.phone_numbers == org.phone_numbers
+    assert view.business_type_ids == (bt.id,)
+    assert view.business_types is None
+
+    projection = OrganizationProjection(expand=frozenset({"business_types"}))
+    (view,) = await org_repo.view_by_ids([org.id], projection)
+
+    assert view.facility is None and view.facility_id == fac.id
+    assert [b.name.value for b in view.business_types] == ["Food"]
+
+
+@pytest.mark.asyncio
+async def test_org_stream_view_selects_only_projected_columns(
+    db_session, test_engine
+):
+    org_repo = OrganizationRepositoryImpl(db_session)
+    fac_repo = FacilityRepositoryImpl(db_session)
+
+    fac = make_facility("HQ")
+    await fac_repo.save(fac)
+    await db_session.commit()
+    for name in ("Charlie", "Alpha", "Zulu"):
+        await org_repo.save(make_org(name, fac))
+    await db_session.commit()
+
+    statements = []
+
+    def capture(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    projection = OrganizationProjection(fields=frozenset({"name", "phones"}))
+    event.listen(test_engine.sync_engine, "before_cursor_execute", capture)
+    try:
+        views = [
+            v async for v in org_repo.stream_view_search_by_name("a", projection)
+        ]
+    finally:
+        event.remove(test_engine.sync_engine, "before_cursor_execute", capture)
+
+    assert [v.name.value for v in views] == ["Alpha", "Charlie"]
+    assert all(len(v.phone_numbers) == 1 for v in views)
+    assert views[0].facility is None and views[0].business_type_ids is None
+    # the organization rows, then one phone lookup for the batch
+    assert len(statements) == 2
+    assert statements[0].split("FROM")[0].count(",") == 1
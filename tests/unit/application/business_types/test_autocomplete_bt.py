@@ -0,0 +1,21 @@
+import pytest
+
+from application.use_cases.business_types.autocomplete_bt import (
+    AutocompleteBusinessTypesUseCase,
+)
+from conftest import make_bt
+from infra.repositories.in_mem_bt_repo import InMemoryBusinessTypeRepository
+
+
+@pytest.mark.asyncio
+async def test_autocomplete_business_types():
+    repo = InMemoryBusinessTypeRepository()
+    food = make_bt("Food")
+    meat = make_bt("Meat")
+    await repo.save(food)
+    await repo.save(meat)
+
+    uc = AutocompleteBusinessTypesUseCase(repo)
+    result = await uc.execute("fo", 10)
+
+    assert result == [food]
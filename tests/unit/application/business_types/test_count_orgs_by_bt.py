@@ -0,0 +1,59 @@
+from uuid import uuid4
+
+import pytest
+
+from application.use_cases.business_types.count_orgs_by_bt import (
+    CountOrganizationsByBusinessTypeUseCase,
+)
+from conftest import make_bt, make_facility, make_org
+from domain.entities.business_type import BusinessType
+from domain.exceptions.base import DomainResourceNotFoundError
+from domain.val_objs.org_count import OrganizationCount
+from infra.repositories.in_mem_bt_repo import InMemoryBusinessTypeRepository
+from infra.repositories.in_mem_org_repo import InMemoryOrganizationRepository
+
+
+@pytest.mark.asyncio
+async def test_count_organizations_by_business_type():
+    org_repo = InMemoryOrganizationRepository()
+    bt_repo = InMemoryBusinessTypeRepository()
+
+    root = make_bt("Food")
+    child = make_bt("Meat", parent=root)
+    await bt_repo.save(root)
+    await bt_repo.save(child)
+    await org_repo.save(make_org("ChildOrg", make_facility("A"), child))
+
+    uc = CountOrganizationsByBusinessTypeUseCase(org_repo, bt_repo)
+    counts = await uc.execute(child.id.value)
+
+    assert counts[child.id].total == 1
+    assert root.id not in counts
+
+    with pytest.raises(DomainResourceNotFoundError):
+        await uc.execute(uuid4())
+
+
+@pytest.mark.asyncio
+async def test_count_with_separately_loaded_business_types():
+    org_repo = InMemoryOrganizationRepository()
+    bt_repo = InMemoryBusinessTypeRepository()
+
+    # the business type repository holds its own instances with the same IDs
+    root = make_bt("Food")
+    child = make_bt("Meat", parent=root)
+    leaf = make_bt("Beef", parent=child)
+    await bt_repo.save(root)
+    await bt_repo.save(child)
+    await bt_repo.save(leaf)
+
+    org_root = BusinessType(id_=root.id, name=root.name)
+    org_child = BusinessType(id_=child.id, name=child.name, parent=org_root)
+    await org_repo.save(make_org("ChildOrg", make_facility("A"), org_child))
+
+    uc = CountOrganizationsByBusinessTypeUseCase(org_repo, bt_repo)
+    counts = await uc.execute(root.id.value)
+
+    assert counts[root.id] == OrganizationCount(direct=0, total=1)
+    assert counts[child.id] == OrganizationCount(direct=1, total=1)
+    assert counts[leaf.id] == OrganizationCount(direct=0, total=0)
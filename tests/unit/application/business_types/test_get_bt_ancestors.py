@@ -0,0 +1,41 @@
+from uuid import uuid4
+
+import pytest
+
+from application.use_cases.business_types.get_bt_ancestors import (
+    GetBusinessTypeAncestorsBatchUseCase,
+    GetBusinessTypeAncestorsUseCase,
+)
+from conftest import make_bt
+from domain.exceptions.base import DomainResourceNotFoundError
+from infra.repositories.in_mem_bt_repo import InMemoryBusinessTypeRepository
+
+
+@pytest.mark.asyncio
+async def test_get_business_type_ancestors():
+    repo = InMemoryBusinessTypeRepository()
+    root = make_bt("Food")
+    child = make_bt("Meat", parent=root)
+    await repo.save(root)
+    await repo.save(child)
+
+    uc = GetBusinessTypeAncestorsUseCase(repo)
+
+    assert await uc.execute(child.id.value) == [root, child]
+
+    with pytest.raises(DomainResourceNotFoundError):
+        await uc.execute(uuid4())
+
+
+@pytest.mark.asyncio
+async def test_get_business_type_ancestors_batch():
+    repo = InMemoryBusinessTypeRepository()
+    root = make_bt("Food")
+    child = make_bt("Meat", parent=root)
+    await repo.save(root)
+    await repo.save(child)
+
+    uc = GetBusinessTypeAncestorsBatchUseCase(repo)
+    result = await uc.execute([root.id.value, child.id.value, uuid4()])
+
+    assert result == {root.id.value: [root], child.id.value: [root, child]}
@@ -1,5 +1,8 @@
 from infra.repositories.in_mem_bt_repo import InMemoryBusinessTypeRepository
-from application.use_cases.business_types.get_bt_by_id import GetBusinessTypeByIdUseCase
+from application.use_cases.business_types.get_bt_by_id import (
+    GetBusinessTypeByIdUseCase,
+    GetBusinessTypesByIdsUseCase,
+)
 import pytest
 from uuid import uuid4
 
@@ -26,3 +29,17 @@ async def test_get_business_type_by_id_not_found():
 
     with pytest.raises(DomainResourceNotFoundError):
         await uc.execute(uuid4())
+
+
+@pytest.mark.asyncio
+async def test_get_business_types_by_ids_reports_missing():
+    repo = InMemoryBusinessTypeRepository()
+    bt = make_bt("Food")
+    await repo.save(bt)
+    unknown = uuid4()
+
+    uc = GetBusinessTypesByIdsUseCase(repo)
+    result = await uc.execute([bt.id.value, unknown])
+
+    assert result.found == (bt,)
+    assert result.missing == (unknown,)
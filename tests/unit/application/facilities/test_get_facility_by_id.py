@@ -1,7 +1,10 @@
 from uuid import uuid4
 
 import pytest
-from application.use_cases.facilities.get_facility_by_id import GetFacilityByIdUseCase
+from application.use_cases.facilities.get_facility_by_id import (
+    GetFacilitiesByIdsUseCase,
+    GetFacilityByIdUseCase,
+)
 from conftest import make_facility
 from domain.exceptions.base import DomainResourceNotFoundError
 from infra.repositories.in_mem_facility_repo import InMemoryFacilityRepository
@@ -26,3 +29,17 @@ async def test_get_facility_by_id_not_found():
 
     with pytest.raises(DomainResourceNotFoundError):
         await uc.execute(uuid4())
+
+
+@pytest.mark.asyncio
+async def test_get_facilities_by_ids_reports_missing():
+    repo = InMemoryFacilityRepository()
+    fac = make_facility("A")
+    await repo.save(fac)
+    unknown = uuid4()
+
+    uc = GetFacilitiesByIdsUseCase(repo)
+    result = await uc.execute([unknown, fac.id.value])
+
+    assert result.found == (fac,)
+    assert result.missing == (unknown,)
@@ -0,0 +1,20 @@
+import pytest
+from application.use_cases.orgs.autocomplete_org import (
+    AutocompleteOrganizationsUseCase,
+)
+from conftest import make_bt, make_facility, make_org
+from infra.repositories.in_mem_org_repo import InMemoryOrganizationRepository
+
+
+@pytest.mark.asyncio
+async def test_autocomplete_orgs():
+    repo = InMemoryOrganizationRepository()
+
+    house = make_org("Coffee House", make_facility("A"), make_bt("Food"))
+    await repo.save(house)
+    await repo.save(make_org("Bakery", make_facility("A"), make_bt("Food")))
+
+    uc = AutocompleteOrganizationsUseCase(repo)
+    result = await uc.execute("coffee", 10)
+
+    assert [(s.id, s.name) for s in result] == [(house.id.value, "Coffee House")]
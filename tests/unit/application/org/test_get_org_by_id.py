@@ -1,7 +1,10 @@
 from uuid import uuid4
 
 import pytest
-from application.use_cases.orgs.get_org_by_id import GetOrganizationByIdUseCase
+from application.use_cases.orgs.get_org_by_id import (
+    GetOrganizationByIdUseCase,
+    GetOrganizationsByIdsUseCase,
+)
 from conftest import make_bt, make_facility, make_org
 from domain.exceptions.base import DomainResourceNotFoundError
 from infra.repositories.in_mem_org_repo import InMemoryOrganizationRepository
@@ -26,3 +29,21 @@ async def test_get_org_by_id_not_found():
 
     with pytest.raises(DomainResourceNotFoundError):
         await uc.execute(uuid4())
+
+
+@pytest.mark.asyncio
+async def test_get_orgs_by_ids_reports_missing():
+    repo = InMemoryOrganizationRepository()
+    first = make_org("First", make_facility("A"), make_bt("Food"))
+    second = make_org("Second", make_facility("A"), make_bt("Food"))
+    await repo.save(first)
+    await repo.save(second)
+    unknown = uuid4()
+
+    uc = GetOrganizationsByIdsUseCase(repo)
+    result = await uc.execute(
+        [second.id.value, unknown, first.id.value, second.id.value]
+    )
+
+    assert result.found == (second, first)
+    assert result.missing == (unknown,)
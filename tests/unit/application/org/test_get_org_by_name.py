@@ -19,4 +19,4 @@ async def test_search_org_by_name():
     uc = SearchOrganizationByNameUseCase(repo)
     result = await uc.execute("alp")
 
-    assert result == [org1]
+    assert result.items == (org1,)
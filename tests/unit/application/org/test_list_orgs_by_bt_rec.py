@@ -26,4 +26,4 @@ async def test_list_orgs_by_business_type_recursive():
     uc = ListOrganizationsByBusinessTypeRecursiveUseCase(org_repo, bt_repo)
     result = await uc.execute(root.id.value)
 
-    assert set(result) == {org1, org2}
+    assert set(result.items) == {org1, org2}
@@ -27,4 +27,4 @@ async def test_list_orgs_by_facility():
     uc = ListOrganizationsByFacilityUseCase(org_repo, fac_repo)
     result = await uc.execute(fac1.id.value)
 
-    assert result == [org1]
+    assert result.items == (org1,)
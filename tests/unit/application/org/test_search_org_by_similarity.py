@@ -0,0 +1,20 @@
+import pytest
+from application.use_cases.orgs.search_org_by_similarity import (
+    SearchOrganizationsBySimilarityUseCase,
+)
+from conftest import make_bt, make_facility, make_org
+from infra.repositories.in_mem_org_repo import InMemoryOrganizationRepository
+
+
+@pytest.mark.asyncio
+async def test_search_org_by_similarity():
+    repo = InMemoryOrganizationRepository()
+
+    house = make_org("Coffee House", make_facility("A"), make_bt("Food"))
+    shop = make_org("Coffee Shop", make_facility("A"), make_bt("Food"))
+    await repo.save(house)
+    await repo.save(shop)
+
+    uc = SearchOrganizationsBySimilarityUseCase(repo)
+
+    assert await uc.execute("coffee hause", 0.2, 1) == [house]
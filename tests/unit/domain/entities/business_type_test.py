@@ -58,3 +58,97 @@ def test_remove_child():
 
     assert child not in root.children
     assert child.parent is None
+
+
+def test_reconstitute_links_forest():
+    root_id, child_id, grand_id, other_id = (BusinessTypeId(uuid4()) for _ in range(4))
+
+    nodes = BusinessType.reconstitute(
+        [
+            (grand_id, BusinessName("Beef"), child_id),
+            (child_id, BusinessName("Meat"), root_id),
+            (root_id, BusinessName("Food"), None),
+            (other_id, BusinessName("Tech"), None),
+        ]
+    )
+
+    assert nodes[grand_id].parent is nodes[child_id]
+    assert nodes[child_id].parent is nodes[root_id]
+    assert nodes[root_id].children == (nodes[child_id],)
+    assert nodes[other_id].parent is None
+
+
+def test_reconstitute_rejects_depth():
+    ids = [BusinessTypeId(uuid4()) for _ in range(4)]
+    records = [
+        (ids[i], BusinessName(f"Level{i}"), ids[i - 1] if i else None)
+        for i in range(4)
+    ]
+
+    with pytest.raises(BusinessTypeHierarchyError):
+        BusinessType.reconstitute(records)
+
+
+def test_reconstitute_rejects_cycle():
+    a, b = BusinessTypeId(uuid4()), BusinessTypeId(uuid4())
+
+    with pytest.raises(BusinessTypeHierarchyError):
+        BusinessType.reconstitute(
+            [(a, BusinessName("Aaaa"), b), (b, BusinessName("Bbbb"), a)]
+        )
+
+
+def test_interval_labels_follow_reparenting():
+    food = BusinessType(BusinessTypeId(uuid4()), BusinessName("Food"), None)
+    meat = BusinessType(BusinessTypeId(uuid4()), BusinessName("Meat"), food)
+    beef = BusinessType(BusinessTypeId(uuid4()), BusinessName("Beef"), meat)
+    tech = BusinessType(BusinessTypeId(uuid4()), BusinessName("Tech"), None)
+
+    assert beef.is_descendant_of(food)
+    assert food.is_ancestor_of(beef)
+    assert beef.depth == 2
+    assert not beef.is_descendant_of(tech)
+
+    meat.set_parent(tech)
+
+    assert beef.is_descendant_of(tech)
+    assert not beef.is_descendant_of(food)
+    assert beef.in_subtree_of(meat)
+    assert meat.in_subtree_of(meat)
+    assert not meat.is_descendant_of(meat)
+
+
+def test_reconstitute_labels_intervals():
+    root_id, child_id, other_id = (BusinessTypeId(uuid4()) for _ in range(3))
+
+    nodes = BusinessType.reconstitute(
+        [
+            (child_id, BusinessName("Meat"), root_id),
+            (root_id, BusinessName("Food"), None),
+            (other_id, BusinessName("Tech"), None),
+        ]
+    )
+
+    root_enter, root_exit = nodes[root_id].interval
+    child_enter, child_exit = nodes[child_id].interval
+    assert root_enter < child_enter < child_exit < root_exit
+    assert nodes[child_id].depth == 1
+    assert not nodes[child_id].in_subtree_of(nodes[other_id])
+
+
+def test_ancestry_across_separately_loaded_trees():
+    food_id, meat_id = BusinessTypeId(uuid4()), BusinessTypeId(uuid4())
+
+    food = BusinessType(food_id, BusinessName("Food"))
+    meat = BusinessType(meat_id, BusinessName("Meat"), food)
+    beef = BusinessType(BusinessTypeId(uuid4()), BusinessName("Beef"), meat)
+
+    # same IDs, different instances, as another repository load would return
+    other_food = BusinessType(food_id, BusinessName("Food"))
+    other_meat = BusinessType(meat_id, BusinessName("Meat"), other_food)
+
+    assert beef.is_descendant_of(other_food)
+    assert beef.in_subtree_of(other_meat)
+    assert meat.in_subtree_of(other_meat)
+    assert not meat.is_descendant_of(other_meat)
+    assert not other_food.in_subtree_of(meat)
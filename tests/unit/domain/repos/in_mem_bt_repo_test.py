@@ -49,6 +49,56 @@ async def test_get_by_name(repo):
     assert loaded is bt
 
 
+@pytest.mark.asyncio
+async def test_get_by_name_ignores_case(repo):
+    bt = make_bt("Tech")
+    await repo.save(bt)
+
+    loaded = await repo.get_by_name(BusinessName("TECH"))
+    assert loaded is bt
+
+
+@pytest.mark.asyncio
+async def test_list_by_name_prefix(repo):
+    food = make_bt("Food")
+    fork = make_bt("Forks")
+    tech = make_bt("Tech")
+    for bt in (tech, fork, food):
+        await repo.save(bt)
+
+    assert await repo.list_by_name_prefix("fo", 10) == [food, fork]
+    assert await repo.list_by_name_prefix("FO", 1) == [food]
+
+    await repo.delete(food)
+    assert await repo.list_by_name_prefix("fo", 10) == [fork]
+
+
+@pytest.mark.asyncio
+async def test_search_by_name_tolerates_typos(repo):
+    bakery = make_bt("Bakery")
+    await repo.save(bakery)
+    await repo.save(make_bt("Barbershop"))
+
+    assert await repo.search_by_name("bakry", 1, 10) == [bakery]
+
+    butchery = make_bt("Butchery")
+    await repo.save(butchery)
+
+    assert await repo.search_by_name("BUTCHRY", 2, 10) == [butchery]
+
+
+@pytest.mark.asyncio
+async def test_data_version_changes_on_write(repo):
+    bt = make_bt("Food")
+    before = await repo.data_version()
+
+    await repo.save(bt)
+    saved = await repo.data_version()
+    await repo.delete(bt)
+
+    assert before != saved != await repo.data_version()
+
+
 @pytest.mark.asyncio
 async def test_get_by_name_not_found(repo):
     with pytest.raises(DomainResourceNotFoundError):
@@ -121,3 +171,29 @@ async def test_list_descendants(repo):
 
     result = await repo.list_descendants(root)
     assert set(result) == {child, grand}
+
+
+@pytest.mark.asyncio
+async def test_list_paths(repo):
+    root = make_bt("Root")
+    child = make_bt("Child", parent=root)
+    await repo.save(root)
+    await repo.save(child)
+
+    paths = await repo.list_paths([child.id, BusinessTypeId(uuid4())])
+
+    assert paths == {child.id: [root, child]}
+
+
+@pytest.mark.asyncio
+async def test_get_subtree(repo):
+    root = make_bt("Root")
+    child = make_bt("Child", parent=root)
+    make_bt("Grand", parent=child)
+    await repo.save(root)
+
+    subtree = await repo.get_subtree(root.id, max_depth=1)
+
+    assert subtree is not root
+    assert [c.name.value for c in subtree.children] == ["Child"]
+    assert subtree.children[0].children == ()
@@ -11,6 +11,7 @@ from domain.val_objs.coords import Coordinates
 from domain.val_objs.ids import BusinessTypeId, FacilityId, OrganizationId
 from domain.val_objs.organization_name import OrganizationName
 from domain.val_objs.phone import PhoneNumber
+from domain.val_objs.page import OrganizationCursor, PageRequest
 from infra.repositories.in_mem_org_repo import InMemoryOrganizationRepository
 
 
@@ -86,6 +87,63 @@ async def test_list_by_facility(repo):
     assert result == [org1]
 
 
+@pytest.mark.asyncio
+async def test_list_by_facilities(repo):
+    fac1 = make_facility("A")
+    fac2 = make_facility("B")
+    fac3 = make_facility("C")
+    bt = make_bt("Food")
+
+    org1 = make_org("OneOrg", fac1, bt)
+    org2 = make_org("TwoOrg", fac2, bt)
+    org3 = make_org("ThreeOrg", fac3, bt)
+
+    for org in (org1, org2, org3):
+        await repo.save(org)
+
+    result = await repo.list_by_facilities([fac1.id, fac2.id, fac1.id])
+    assert result == [org1, org2]
+
+
+@pytest.mark.asyncio
+async def test_facility_index_follows_moves_and_deletes(repo):
+    fac1 = make_facility("A")
+    fac2 = make_facility("B")
+    org = make_org("Mover", fac1, make_bt("Food"))
+
+    await repo.save(org)
+    org.reassign_facility(fac2)
+    await repo.save(org)
+
+    assert await repo.list_by_facility(fac1) == []
+    assert await repo.list_by_facility(fac2) == [org]
+
+    await repo.delete(org)
+    assert await repo.list_by_facilities([fac1.id, fac2.id]) == []
+
+
+@pytest.mark.asyncio
+async def test_search_pages_by_name_then_id(repo):
+    fac = make_facility("A")
+    bt = make_bt("Food")
+    orgs = [make_org(name, fac, bt) for name in ("Delta", "Alpha", "Charlie", "Bravo")]
+    twin = make_org("Alpha", fac, bt)
+    for org in (*orgs, twin):
+        await repo.save(org)
+
+    seen = []
+    page = PageRequest(limit=2)
+    while True:
+        batch = await repo.search_by_name("a", page)
+        seen.extend(batch)
+        if len(batch) < page.limit:
+            break
+        page = PageRequest(limit=2, after=OrganizationCursor.of(batch[-1]))
+
+    alphas = sorted((orgs[1], twin), key=lambda o: o.id.value)
+    assert seen == [*alphas, orgs[3], orgs[2], orgs[0]]
+
+
 @pytest.mark.asyncio
 async def test_list_by_business_type(repo):
     fac = make_facility("A")
@@ -152,3 +210,99 @@ async def test_list_by_any_business_type(repo):
     result = await repo.list_by_any_business_type([bt_food, bt_tech])
 
     assert set(result) == {org1, org3}
+
+
+@pytest.mark.asyncio
+async def test_count_by_business_type(repo):
+    fac = make_facility("A")
+    root = make_bt("Food")
+    child = make_bt("Meat", parent=root)
+    other = make_bt("Tech")
+
+    both = make_org("OneOrg", fac, root)
+    both.add_business_type(child)
+    await repo.save(both)
+    await repo.save(make_org("TwoOrg", fac, child))
+    await repo.save(make_org("ThreeOrg", fac, other))
+
+    counts = await repo.count_by_business_type()
+    assert (counts[root.id].direct, counts[root.id].total) == (1, 2)
+    assert (counts[child.id].direct, counts[child.id].total) == (2, 2)
+
+    subtree = await repo.count_by_business_type(root)
+    assert set(subtree) == {root.id, child.id}
+
+
+@pytest.mark.asyncio
+async def test_business_type_filters_follow_resave_and_delete(repo):
+    fac = make_facility("A")
+    food = make_bt("Food")
+    tech = make_bt("Tech")
+
+    org = make_org("OneOrg", fac, food)
+    other = make_org("TwoOrg", fac, tech)
+    await repo.save(org)
+    await repo.save(other)
+
+    org.add_business_type(tech)
+    org.remove_business_type(food)
+    await repo.save(org)
+
+    assert await repo.list_by_business_type(food) == []
+    assert await repo.list_by_any_business_type([tech]) == [org, other]
+
+    await repo.delete(org)
+    assert await repo.list_by_business_type_recursive(tech) == [other]
+
+
+@pytest.mark.asyncio
+async def test_search_by_similarity(repo):
+    fac = make_facility("A")
+    bt = make_bt("Food")
+    house = make_org("Coffee House", fac, bt)
+    shop = make_org("Coffee Shop", fac, bt)
+    await repo.save(house)
+    await repo.save(shop)
+    await repo.save(make_org("Bakery", fac, bt))
+
+    assert await repo.search_by_similarity("cofee hous", 0.2, 10) == [house, shop]
+    assert await repo.search_by_similarity("cofee hous", 0.5, 10) == [house]
+
+
+@pytest.mark.asyncio
+async def test_search_by_name_follows_renames_and_deletes(repo):
+    fac = make_facility("A")
+    org = make_org("Coffee House", fac, make_bt("Food"))
+    await repo.save(org)
+
+    org.change_name(OrganizationName("Tea Room"))
+    await repo.save(org)
+    assert await repo.search_by_name("coffee") == []
+    assert await repo.search_by_name("TEA") == [org]
+
+    await repo.delete(org)
+    assert await repo.search_by_name("tea") == []
+
+
+@pytest.mark.asyncio
+async def test_list_names_by_prefix(repo):
+    fac = make_facility("A")
+    bt = make_bt("Food")
+    house = make_org("Coffee House", fac, bt)
+    shop = make_org("coffee shop", fac, bt)
+    for org in (shop, make_org("Bakery", fac, bt), house):
+        await repo.save(org)
+
+    result = await repo.list_names_by_prefix("COF", 10)
+
+    assert [s.name for s in result] == ["Coffee House", "coffee shop"]
+    assert result[0].id == house.id.value
+    assert len(await repo.list_names_by_prefix("cof", 1)) == 1
+
+    house.change_name(OrganizationName("Tea Room"))
+    await repo.save(house)
+    await repo.delete(shop)
+    assert await repo.list_names_by_prefix("cof", 10) == []
+    assert [s.name for s in await repo.list_names_by_prefix("tea", 10)] == [
+        "Tea Room"
+    ]
@@ -34,7 +34,7 @@ def test_get_all_ancestors():
 
     result = BusinessTypeClassificationService.get_all_ancestors(grand)
 
-    assert result == [child, root]
+    assert result == frozenset({child, root})
 
 
 def test_get_leaf_nodes():
@@ -46,3 +46,18 @@ def test_get_leaf_nodes():
     leaves = BusinessTypeClassificationService.get_leaf_nodes(root)
 
     assert set(leaves) == {child2, grand}
+
+
+def test_results_are_cached_until_tree_changes():
+    root = make_bt("Root")
+    child = make_bt("Child", parent=root)
+
+    first = BusinessTypeClassificationService.get_all_descendants(root)
+    assert BusinessTypeClassificationService.get_all_descendants(root) is first
+
+    version = root.tree_version
+    grand = make_bt("Grand", parent=child)
+
+    assert root.tree_version != version
+    assert BusinessTypeClassificationService.get_all_descendants(root) == {child, grand}
+    assert BusinessTypeClassificationService.get_leaf_nodes(root) == {grand}
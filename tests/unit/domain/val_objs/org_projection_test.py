@@ -0,0 +1,61 @@
+from decimal import Decimal
+from uuid import uuid4
+
+import pytest
+
+from domain.entities.business_type import BusinessType
+from domain.entities.facility import Facility
+from domain.entities.organization import Organization
+from domain.exceptions.base import DomainTypeError
+from domain.val_objs.address import Address
+from domain.val_objs.business_name import BusinessName
+from domain.val_objs.coords import Coordinates
+from domain.val_objs.ids import BusinessTypeId, FacilityId, OrganizationId
+from domain.val_objs.org_projection import OrganizationProjection, OrganizationView
+from domain.val_objs.organization_name import OrganizationName
+from domain.val_objs.phone import PhoneNumber
+
+
+def make_org():
+    return Organization(
+        id_=OrganizationId(uuid4()),
+        name=OrganizationName("Alpha"),
+        phone_numbers=[PhoneNumber("+1234567")],
+        facility=Facility(
+            id_=FacilityId(uuid4()),
+            address=Address("Main street 1"),
+            coordinates=Coordinates(lat=Decimal("1"), lon=Decimal("1")),
+        ),
+        business_types=[
+            BusinessType(id_=BusinessTypeId(uuid4()), name=BusinessName("Food"))
+        ],
+    )
+
+
+def test_default_projection_keeps_everything():
+    org = make_org()
+    view = OrganizationView.of(org, OrganizationProjection())
+
+    assert view.phone_numbers == org.phone_numbers
+    assert view.facility is org.facility
+    assert view.business_types == org.business_types
+
+
+def test_unexpanded_relations_keep_only_ids():
+    org = make_org()
+    projection = OrganizationProjection(
+        fields=frozenset({"id", "facility", "business_types"}), expand=frozenset()
+    )
+    view = OrganizationView.of(org, projection)
+
+    assert view.phone_numbers is None
+    assert view.facility is None and view.facility_id == org.facility.id
+    assert view.business_types is None
+    assert view.business_type_ids == (org.business_types[0].id,)
+
+
+def test_unknown_fields_are_rejected():
+    with pytest.raises(DomainTypeError):
+        OrganizationProjection(fields=frozenset({"id", "owner"}))
+    with pytest.raises(DomainTypeError):
+        OrganizationProjection(expand=frozenset({"phones"}))
@@ -0,0 +1,37 @@
+from uuid import uuid4
+
+import pytest
+from domain.exceptions.base import DomainTypeError
+from domain.val_objs.page import OrganizationCursor, OrganizationPage, PageRequest
+
+
+def test_page_request_rejects_non_positive_limit():
+    with pytest.raises(DomainTypeError):
+        PageRequest(limit=0)
+
+
+def test_lookahead_asks_for_one_more():
+    after = OrganizationCursor(name="Alpha", id=uuid4())
+    probe = PageRequest(limit=2, after=after).lookahead()
+
+    assert probe == PageRequest(limit=3, after=after)
+
+
+def test_page_of_full_lookahead_has_next(organization):
+    page = PageRequest(limit=1).page_of([organization, organization])
+
+    assert page.items == (organization,)
+    assert page.next == OrganizationCursor.of(organization)
+
+
+def test_page_of_short_result_is_last(organization):
+    page = PageRequest(limit=2).page_of([organization])
+
+    assert page.items == (organization,)
+    assert page.next is None
+
+
+def test_page_without_request_keeps_everything(organization):
+    page = OrganizationPage.of([organization], None)
+
+    assert page == OrganizationPage(items=(organization,))
@@ -0,0 +1,43 @@
+from uuid import uuid4
+
+from domain.entities.business_type import BusinessType
+from domain.val_objs.business_name import BusinessName
+from domain.val_objs.ids import BusinessTypeId
+from infra.cache.business_type_tree import (
+    BusinessTypeTreeCache,
+    BusinessTypeTreeSnapshot,
+)
+
+
+def make_bt(name: str, parent=None):
+    return BusinessType(
+        id_=BusinessTypeId(uuid4()),
+        name=BusinessName(name),
+        parent=parent,
+    )
+
+
+def test_snapshot_indexes_tree():
+    root = make_bt("Food")
+    child = make_bt("Meat", parent=root)
+    grand = make_bt("Beef", parent=child)
+    other = make_bt("Tech")
+
+    items = {bt.id.value: bt for bt in (root, child, grand, other)}
+    snapshot = BusinessTypeTreeSnapshot.build(1, items)
+
+    assert snapshot.by_id[child.id.value] is child
+    assert snapshot.names.get("tech") is other
+    assert snapshot.names.prefix("me") == [child]
+    assert set(snapshot.roots) == {root, other}
+    assert set(snapshot.descendants(root.id.value)) == {child, grand}
+    assert snapshot.descendants(uuid4()) == []
+
+
+def test_invalidate_bumps_version():
+    cache = BusinessTypeTreeCache()
+    before = cache.version
+
+    cache.invalidate()
+
+    assert cache.version == before + 1
@@ -0,0 +1,55 @@
+from uuid import uuid4
+
+from domain.val_objs.org_summary import OrganizationSummary
+from infra.cache.org_name_prefix import OrganizationNamePrefixCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def summaries(*names):
+    return tuple(OrganizationSummary(id=uuid4(), name=n) for n in names)
+
+
+def test_cache_keys_on_lowercased_prefix_and_limit():
+    cache = OrganizationNamePrefixCache()
+    value = summaries("Alpha")
+    cache.put("Al", 10, value)
+
+    assert cache.get(" al", 10) is value
+    assert cache.get("al", 5) is None
+
+    # SQL lower() keeps "ß", so these prefixes match different names
+    street = summaries("Straße")
+    cache.put("Straße", 10, street)
+    assert cache.get("STRASSE", 10) is None
+    assert cache.get(" STRAßE", 10) is street
+
+
+def test_cache_evicts_least_recently_used():
+    cache = OrganizationNamePrefixCache(maxsize=2)
+    cache.put("a", 10, summaries("A"))
+    cache.put("b", 10, summaries("B"))
+    cache.get("a", 10)
+    cache.put("c", 10, summaries("C"))
+
+    assert cache.get("b", 10) is None
+    assert cache.get("a", 10) is not None
+    assert len(cache) == 2
+
+
+def test_cache_entries_expire():
+    clock = FakeClock()
+    cache = OrganizationNamePrefixCache(ttl=30, clock=clock)
+    cache.put("a", 10, summaries("A"))
+
+    clock.now = 29
+    assert cache.get("a", 10) is not None
+    clock.now = 30
+    assert cache.get("a", 10) is None
+    assert len(cache) == 0
@@ -0,0 +1,28 @@
+from infra.indexes.bk_tree import BKTree, levenshtein
+
+
+def test_levenshtein():
+    assert levenshtein("kitten", "sitting") == 3
+    assert levenshtein("", "abc") == 3
+    assert levenshtein("same", "same") == 0
+
+
+def test_bk_tree_search_within_distance():
+    words = ["Restaurant", "Retail", "Repair", "Rental", "Bakery", "Retail"]
+    tree = BKTree.build(words, key=str)
+
+    assert len(tree) == 6
+    assert tree.search("resturant", 1) == [(1, "Restaurant")]
+    assert [w for _, w in tree.search("retal", 2)] == ["Rental", "Retail", "Retail"]
+    assert tree.search("xyz", 1) == []
+
+
+def test_bk_tree_matches_brute_force():
+    words = [f"{a}{b}{c}" for a in "abc" for b in "abd" for c in "xyz"]
+    tree = BKTree.build(words, key=str)
+
+    for query in ("abx", "ccc", "dd", "abcx"):
+        expected = sorted(
+            (levenshtein(query, w), w) for w in words if levenshtein(query, w) <= 2
+        )
+        assert sorted(tree.search(query, 2)) == expected
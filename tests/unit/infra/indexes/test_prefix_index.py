@@ -0,0 +1,36 @@
+from infra.indexes.prefix_index import PrefixIndex
+
+
+def test_prefix_index_build_and_lookup():
+    index = PrefixIndex.build(["beta", "Alpha", "alpine", "Gamma"], key=str)
+
+    assert index.get("ALPHA") == "Alpha"
+    assert index.prefix("al") == ["Alpha", "alpine"]
+    assert index.prefix("al", limit=1) == ["Alpha"]
+    assert index.prefix("x") == []
+
+
+def test_prefix_index_add_and_remove():
+    index = PrefixIndex(key=str)
+    for name in ("Cola", "coffee", "Tea"):
+        index.add(name)
+
+    assert index.prefix("c") == ["coffee", "Cola"]
+
+    index.remove("coffee")
+
+    assert index.get("coffee") is None
+    assert index.prefix("c") == ["Cola"]
+    assert len(index) == 2
+
+
+def test_prefix_index_promotes_duplicate_on_remove():
+    index = PrefixIndex(key=str.lower)
+    index.add("Food")
+    index.add("FOOD")
+
+    assert index.get("food") == "Food"
+
+    index.remove("Food")
+
+    assert index.get("food") == "FOOD"
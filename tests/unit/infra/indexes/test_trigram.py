@@ -0,0 +1,60 @@
+import random
+
+from infra.indexes.trigram import TrigramIndex, most_similar, similarity, trigrams
+
+
+def test_trigrams_match_pg_trgm():
+    assert trigrams("Cat") == {"  c", " ca", "cat", "at "}
+    assert trigrams("a-b") == {"  a", " a ", "  b", " b "}
+    assert trigrams("") == frozenset()
+
+
+def test_similarity_matches_pg_trgm():
+    # SELECT similarity('word', 'two words') -> 0.36363637
+    assert round(similarity("word", "two words"), 6) == round(4 / 11, 6)
+    assert similarity("Coffee", "coffee") == 1.0
+    assert similarity("abc", "") == 0.0
+
+
+def test_most_similar_ranks_and_cuts():
+    names = ["Coffee House", "Coffee Shop", "Tea House", "Bakery"]
+
+    assert most_similar("cofee hous", names, str, 0.2, 10) == [
+        "Coffee House",
+        "Coffee Shop",
+        "Tea House",
+    ]
+    assert most_similar("cofee hous", names, str, 0.2, 1) == ["Coffee House"]
+    assert most_similar("cofee hous", names, str, 0.3, 10) == ["Coffee House"]
+    assert most_similar("zzz", names, str, 0.3, 10) == []
+
+
+def test_trigram_index_matches_substring_scan():
+    rng = random.Random(7)
+    texts = {
+        i: "".join(rng.choice("abcAB ") for _ in range(rng.randint(0, 12)))
+        for i in range(300)
+    }
+    index = TrigramIndex()
+    for key, text in texts.items():
+        index.add(key, text)
+
+    for query in ("", "a", "Ab", "abc", "b a", "aab", "cccc", "zzz"):
+        expected = {k for k, t in texts.items() if query.lower() in t.lower()}
+        assert set(index.search(query)) == expected
+
+
+def test_trigram_index_follows_updates():
+    index = TrigramIndex()
+    index.add(1, "Coffee House")
+    index.add(2, "Tea House")
+
+    index.add(1, "Bakery")
+    assert index.search("coffee") == []
+    assert sorted(index.search("house")) == [2]
+
+    index.remove(2)
+    index.remove(2)
+    assert index.search("house") == []
+    assert index.search("bak") == [1]
+    assert len(index) == 1
@@ -84,3 +84,25 @@ def test_org_to_model_basic():
     assert model.phone_numbers[0].phone_number == "123456"
     assert model.activities[0].id == bt.id.value
     assert model.activities[0].name == "Food"
+
+
+def test_org_to_domain_shares_business_types():
+    fac_model = FacilityModel(id=uuid.uuid4(), address="HQ", lat="10", lon="20")
+    parent_model = BusinessTypeModel(id=uuid.uuid4(), name="Food", parent_id=None)
+    bt_model = BusinessTypeModel(id=uuid.uuid4(), name="Meat", parent_id=parent_model.id)
+    bt_model.parent = parent_model
+
+    def org_model(name):
+        model = OrganizationModel(id=uuid.uuid4(), name=name, facility_id=fac_model.id)
+        model.facility = fac_model
+        model.activities = [bt_model]
+        model.phone_numbers = [PhoneModel(phone_number="123456", org_id=model.id)]
+        return model
+
+    identity_map = {}
+    first = OrganizationMapper.to_domain(org_model("OrgOne"), identity_map)
+    second = OrganizationMapper.to_domain(org_model("OrgTwo"), identity_map)
+
+    assert first.business_types[0] is second.business_types[0]
+    assert first.business_types[0].parent is identity_map[parent_model.id]
+    assert set(identity_map) == {bt_model.id, parent_model.id}
@@ -0,0 +1,120 @@
+from uuid import uuid4
+
+import httpx
+import pytest
+from fastapi import FastAPI
+
+from domain.entities.business_type import BusinessType
+from domain.val_objs.business_name import BusinessName
+from domain.val_objs.ids import BusinessTypeId
+from infra.repositories.in_mem_bt_repo import InMemoryBusinessTypeRepository
+from presentation.api import busines_types
+from presentation.dependencies import get_bt_repo
+from presentation.http_cache import etag_matches
+
+
+def make_bt(name: str, parent=None):
+    return BusinessType(
+        id_=BusinessTypeId(uuid4()),
+        name=BusinessName(name),
+        parent=parent,
+    )
+
+
+@pytest.fixture
+def repo():
+    return InMemoryBusinessTypeRepository()
+
+
+@pytest.fixture
+async def client(repo):
+    busines_types.tree_cache.clear()
+
+    app = FastAPI()
+    app.include_router(busines_types.router)
+    app.dependency_overrides[get_bt_repo] = lambda: repo
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as ac:
+        yield ac
+
+
+@pytest.mark.asyncio
+async def test_tree_renders_nested_children(client, repo):
+    root = make_bt("Food")
+    child = make_bt("Meat", parent=root)
+    await repo.save(root)
+    await repo.save(child)
+
+    response = await client.get("/business-types/tree")
+
+    assert response.status_code == 200
+    assert response.json() == [
+        {
+            "id": str(root.id.value),
+            "name": "Food",
+            "children": [{"id": str(child.id.value), "name": "Meat", "children": []}],
+        }
+    ]
+
+
+@pytest.mark.asyncio
+async def test_tree_revalidates_with_etag(client, repo):
+    await repo.save(make_bt("Food"))
+
+    first = await client.get("/business-types/tree")
+    etag = first.headers["etag"]
+
+    cached = await client.get("/business-types/tree", headers={"If-None-Match": etag})
+    assert cached.status_code == 304
+    assert cached.headers["etag"] == etag
+
+    await repo.save(make_bt("Tech"))
+
+    changed = await client.get("/business-types/tree", headers={"If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.headers["etag"] != etag
+
+
+def test_etag_matches_lists_and_weak_tags():
+    assert etag_matches('"a", W/"b"', '"b"')
+    assert etag_matches("*", '"b"')
+    assert not etag_matches('"a"', '"b"')
+    assert not etag_matches(None, '"b"')
+
+
+@pytest.mark.asyncio
+async def test_ancestors_batch_keeps_request_order(client, repo):
+    root = make_bt("Food")
+    child = make_bt("Meat", parent=root)
+    await repo.save(root)
+    await repo.save(child)
+
+    response = await client.get(
+        "/business-types/ancestors",
+        params=[("ids", str(child.id.value)), ("ids", str(root.id.value))],
+    )
+
+    assert response.status_code == 200
+    data = response.json()
+    assert [item["id"] for item in data] == [str(child.id.value), str(root.id.value)]
+    assert [bt["name"] for bt in data[0]["path"]] == ["Food", "Meat"]
+
+
+@pytest.mark.asyncio
+async def test_subtree_respects_max_depth(client, repo):
+    root = make_bt("Food")
+    child = make_bt("Meat", parent=root)
+    make_bt("Beef", parent=child)
+    await repo.save(root)
+
+    response = await client.get(
+        f"/business-types/{root.id.value}/subtree", params={"max_depth": 1}
+    )
+
+    assert response.status_code == 200
+    assert response.json()["children"][0] == {
+        "id": str(child.id.value),
+        "name": "Meat",
+        "children": [],
+    }
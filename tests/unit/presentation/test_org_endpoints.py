@@ -0,0 +1,233 @@
+import json
+from decimal import Decimal
+from uuid import uuid4
+
+import httpx
+import pytest
+from fastapi import FastAPI
+
+from domain.entities.business_type import BusinessType
+from domain.entities.facility import Facility
+from domain.entities.organization import Organization
+from domain.val_objs.address import Address
+from domain.val_objs.business_name import BusinessName
+from domain.val_objs.coords import Coordinates
+from domain.val_objs.ids import BusinessTypeId, FacilityId, OrganizationId
+from domain.val_objs.organization_name import OrganizationName
+from domain.val_objs.page import OrganizationCursor
+from domain.val_objs.phone import PhoneNumber
+from infra.repositories.in_mem_facility_repo import InMemoryFacilityRepository
+from infra.repositories.in_mem_org_repo import InMemoryOrganizationRepository
+from presentation.api import organization
+from presentation.dependencies import get_facility_repo, get_org_repo
+from presentation.schemas.pagination import (
+    NEXT_CURSOR_HEADER,
+    decode_cursor,
+    encode_cursor,
+)
+from setup.exceptions.handlers import register_exception_handlers
+
+
+def make_org(name: str):
+    return Organization(
+        id_=OrganizationId(uuid4()),
+        name=OrganizationName(name),
+        phone_numbers=[PhoneNumber("+1234567")],
+        facility=Facility(
+            id_=FacilityId(uuid4()),
+            address=Address("Main street 1"),
+            coordinates=Coordinates(lat=Decimal("10"), lon=Decimal("20")),
+        ),
+        business_types=[
+            BusinessType(id_=BusinessTypeId(uuid4()), name=BusinessName("Food"))
+        ],
+    )
+
+
+@pytest.fixture
+def repo():
+    return InMemoryOrganizationRepository()
+
+
+@pytest.fixture
+async def client(repo):
+    app = FastAPI()
+    app.include_router(organization.router)
+    app.dependency_overrides[get_org_repo] = lambda: repo
+    app.dependency_overrides[get_facility_repo] = InMemoryFacilityRepository
+    register_exception_handlers(app)
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as ac:
+        yield ac
+
+
+@pytest.mark.asyncio
+async def test_search_walks_pages_with_next_cursor(client, repo):
+    for name in ("Delta", "Alpha", "Charlie", "Bravo"):
+        await repo.save(make_org(name))
+
+    names = []
+    params = {"q": "a", "limit": 3}
+    while True:
+        response = await client.get("/organizations/search", params=params)
+        assert response.status_code == 200
+        names.extend(o["name"] for o in response.json())
+
+        cursor = response.headers.get(NEXT_CURSOR_HEADER)
+        if cursor is None:
+            break
+        params["cursor"] = cursor
+
+    assert names == ["Alpha", "Bravo", "Charlie", "Delta"]
+
+
+@pytest.mark.asyncio
+async def test_invalid_cursor_is_a_bad_request(client):
+    response = await client.get(
+        "/organizations/search", params={"q": "a", "cursor": "not-a-cursor"}
+    )
+
+    assert response.status_code == 400
+
+
+def test_cursor_round_trip():
+    org = make_org("Кофейня №1")
+    cursor = decode_cursor(encode_cursor(OrganizationCursor.of(org)))
+
+    assert (cursor.name, cursor.id) == (org.name.value, org.id.value)
+
+
+@pytest.mark.asyncio
+async def test_ndjson_streams_every_match_ignoring_limit(client, repo):
+    for name in ("Charlie", "Alpha", "Bravo"):
+        await repo.save(make_org(name))
+
+    response = await client.get(
+        "/organizations/search",
+        params={"q": "a", "limit": 1},
+        headers={"Accept": "application/x-ndjson"},
+    )
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+    assert NEXT_CURSOR_HEADER not in response.headers
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert [o["name"] for o in lines] == ["Alpha", "Bravo", "Charlie"]
+
+
+@pytest.mark.asyncio
+async def test_ndjson_reports_missing_facility_before_streaming(client):
+    response = await client.get(
+        f"/organizations/facility/{uuid4()}",
+        headers={"Accept": "application/x-ndjson"},
+    )
+
+    assert response.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_autocomplete_returns_only_id_and_name(client, repo):
+    alpha = make_org("Alpha")
+    await repo.save(alpha)
+    await repo.save(make_org("Bravo"))
+
+    response = await client.get("/organizations/autocomplete", params={"prefix": "al"})
+
+    assert response.status_code == 200
+    assert response.json() == [{"id": str(alpha.id.value), "name": "Alpha"}]
+
+
+@pytest.mark.asyncio
+async def test_batch_returns_found_in_request_order_and_missing(client, repo):
+    alpha, bravo = make_org("Alpha"), make_org("Bravo")
+    await repo.save(alpha)
+    await repo.save(bravo)
+    unknown = str(uuid4())
+
+    response = await client.post(
+        "/organizations/batch",
+        json={"ids": [str(bravo.id.value), unknown, str(alpha.id.value)]},
+    )
+
+    assert response.status_code == 200
+    body = response.json()
+    assert [o["name"] for o in body["items"]] == ["Bravo", "Alpha"]
+    assert body["missing"] == [unknown]
+
+
+@pytest.mark.asyncio
+async def test_batch_rejects_empty_id_list(client):
+    response = await client.post("/organizations/batch", json={"ids": []})
+
+    assert response.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_fields_limit_the_response(client, repo):
+    alpha = make_org("Alpha")
+    await repo.save(alpha)
+
+    response = await client.get(
+        "/organizations/search", params={"q": "al", "fields": "id,name"}
+    )
+
+    assert response.status_code == 200
+    assert response.json() == [{"id": str(alpha.id.value), "name": "Alpha"}]
+
+
+@pytest.mark.asyncio
+async def test_unexpanded_relations_are_returned_by_id(client, repo):
+    alpha = make_org("Alpha")
+    await repo.save(alpha)
+
+    response = await client.get(
+        f"/organizations/{alpha.id.value}",
+        params={"fields": "name,facility,business_types", "expand": ""},
+    )
+
+    assert response.status_code == 200
+    assert response.json() == {
+        "name": "Alpha",
+        "facility_id": str(alpha.facility.id.value),
+        "business_type_ids": [str(alpha.business_types[0].id.value)],
+    }
+
+
+@pytest.mark.asyncio
+async def test_fields_apply_to_pages_batches_and_streams(client, repo):
+    for name in ("Alpha", "Bravo"):
+        await repo.save(make_org(name))
+    alpha = (await repo.search_by_name("alpha"))[0]
+
+    page = await client.get(
+        "/organizations/search", params={"q": "a", "limit": 1, "fields": "name"}
+    )
+    assert page.json() == [{"name": "Alpha"}]
+    assert NEXT_CURSOR_HEADER in page.headers
+
+    batch = await client.post(
+        "/organizations/batch",
+        params={"fields": "name"},
+        json={"ids": [str(alpha.id.value)]},
+    )
+    assert batch.json() == {"items": [{"name": "Alpha"}], "missing": []}
+
+    stream = await client.get(
+        "/organizations/search",
+        params={"q": "a", "fields": "name"},
+        headers={"Accept": "application/x-ndjson"},
+    )
+    assert [json.loads(line) for line in stream.text.splitlines()] == [
+        {"name": "Alpha"},
+        {"name": "Bravo"},
+    ]
+
+
+@pytest.mark.asyncio
+async def test_unknown_field_is_a_bad_request(client):
+    response = await client.get(
+        "/organizations/search", params={"q": "a", "fields": "id,owner"}
+    )
+
+    assert response.status_code == 400